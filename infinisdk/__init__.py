@@ -1,5 +1,5 @@
 from .core.q import Q  # pylint: disable=unused-import
-from .infinibox import InfiniBox
+from .infinibox import AsyncInfiniBox, InfiniBox, InfiniBoxFleet
 from .infinibox.components import InfiniBoxSystemComponents
 
 _SDK_HOOK = "infinidat.sdk.{}".format
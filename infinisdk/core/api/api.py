@@ -1,7 +1,8 @@
 import copy
-import json
 import socket
 import sys
+import threading
+import time
 from base64 import b64encode
 from contextlib import contextmanager
 from functools import partial
@@ -13,7 +14,7 @@ import flux
 import gossip
 import requests
 import urllib3.exceptions
-from logbook import Logger
+from logbook import TRACE, Logger
 from requests.exceptions import RequestException
 from sentinels import NOTHING
 from urlobject import URLObject as URL
@@ -28,6 +29,10 @@ from ..exceptions import (
     RelatedSystemNotFound,
     SystemNotFoundException,
 )
+from .connection_pool import ConnectionStats, PoolingHTTPAdapter
+from .json_codec import get_json_codec
+from .json_stream import iter_list_items
+from .metrics import APIMetrics
 from .special_values import translate_special_values
 
 _RETRY_REQUESTS_EXCEPTION_TYPES = (
@@ -41,7 +46,34 @@ _REQUESTS_HTTP_EXCEPTION_TYPES = (
     requests.models.HTTPError,
 )
 
-_logger = Logger(__name__)
+_STREAM_CHUNK_SIZE = 65536
+
+#: Logs the requests sent to the system and their responses, at TRACE level. Raising its ``level`` above TRACE, or
+#: setting ``disabled``, skips building these logs altogether
+logger = Logger(__name__)
+
+
+def _is_trace_enabled():
+    return not logger.disabled and TRACE >= logger.level
+
+
+class _LazyLogValue:
+    """
+    An argument of a log record which is only computed when the record is formatted, i.e. when a handler
+    actually emits it
+    """
+
+    __slots__ = ("_func", "_args")
+
+    def __init__(self, func, *args):
+        self._func = func
+        self._args = args
+
+    def __str__(self):
+        return str(self._func(*self._args))
+
+    def __format__(self, format_spec):
+        return format(str(self), format_spec)
 
 
 def _get_request_delegate(http_method):
@@ -70,21 +102,61 @@ def _approval_preprocessor(approve, request):
         request.url = request.url.set_query_param("approved", str(approve).lower())
 
 
+class _Credentials:
+    def __init__(self, session=None, auth=None):
+        super(_Credentials, self).__init__()
+        self.session = session
+        self.auth = auth
+        self.is_logged_in = False
+        #: incremented on every login, allowing concurrent login refreshes to be detected
+        self.login_generation = 0
+
+
+class _RequestContext:
+    """
+    State set by the API's context managers, which affects the requests being sent
+    """
+
+    def __init__(self):
+        super(_RequestContext, self).__init__()
+        self.preprocessors = []
+        self.headers = {}
+        self.use_basic_auth = False
+        self.check_version_compatibility = True
+        self.login_refresh_enabled = True
+        self.disabled_http_methods = set()
+        self.no_response_logs = 0
+        self.timeout = NOTHING
+        self.credentials = None
+
+    def get_values(self):
+        returned = dict(vars(self))
+        returned["preprocessors"] = list(self.preprocessors)
+        returned["headers"] = dict(self.headers)
+        returned["disabled_http_methods"] = set(self.disabled_http_methods)
+        return returned
+
+
+class _ThreadLocalRequestContext(_RequestContext, threading.local):
+    pass
+
+
 class API:
     def __init__(self, target, auth, use_ssl, ssl_cert):
         super(API, self).__init__()
-        self._auth = None
-        self._is_logged_in = False
-        self._preprocessors = []
+        self._context = _RequestContext()
+        self._credentials = _Credentials()
+        self._login_lock = threading.RLock()
         self.system = target
         self._use_ssl = use_ssl
         self._ssl_cert = ssl_cert
-        self._use_basic_auth = False
-        self._check_version_compatibility = True
         self._default_request_timeout = None
         self._interactive = False
         self._auto_retry_predicates = {}
-        self._session = None
+        self._connection_stats = ConnectionStats()
+        self._remote_authorization = None
+        #: an :class:`.APIMetrics` object aggregating the requests sent through this API
+        self.metrics = APIMetrics()
         self.reinitialize_session(auth=auth)
         self._urls = [
             self._url_from_address(address, use_ssl)
@@ -92,12 +164,57 @@ class API:
         ]
         self._active_url = None
         self._checked_version = False
-        self._no_response_logs = (
-            0  # Use counter instead of bool, improves support for coroutines
-        )
         self._use_pretty_json = config.root.api.log.pretty_json
-        self._login_refresh_enabled = True
-        self._disabled_http_methods = set()
+
+    def enable_thread_safety(self):
+        """
+        Makes the API safe for use by multiple threads at once. In this mode, the state set by the API's
+        context managers (approval, added headers, timeouts, authentication etc.) only applies to the
+        thread which entered them, and refreshing an expired login is done by a single thread while the
+        others wait for it.
+
+        .. note:: Should be called before sharing the system between threads, and outside of any API context
+        """
+        if not self.is_thread_safe():
+            self._context = _ThreadLocalRequestContext()
+
+    def is_thread_safe(self):
+        """Returns whether the API is in thread-safe mode"""
+        return isinstance(self._context, _ThreadLocalRequestContext)
+
+    def snapshot_request_context(self):
+        """
+        Returns the state set by the API's context managers in the current thread, to be applied in other
+        threads through :meth:`.applied_request_context`
+        """
+        return self._context.get_values()
+
+    @contextmanager
+    def applied_request_context(self, snapshot):
+        """
+        Applies state returned by :meth:`.snapshot_request_context` for the duration of the context. This is
+        useful for worker threads sending requests on behalf of another thread in thread-safe mode
+        """
+        context = self._context
+        if not self.is_thread_safe():
+            yield
+            return
+        prev = context.get_values()
+        vars(context).update(snapshot)
+        try:
+            yield
+        finally:
+            vars(context).update(prev)
+
+    def _get_credentials(self):
+        credentials = self._context.credentials
+        if credentials is None:
+            credentials = self._credentials
+        return credentials
+
+    @property
+    def _session(self):
+        return self._get_credentials().session
 
     def save_credentials(self):
         """Returns a copy of the current credentials, useful for loading them later"""
@@ -117,43 +234,44 @@ class API:
         """Inside this context, InfiniSDK will not attempt to refresh login cookies
         when logged out by expired cookies
         """
-        prev = self._login_refresh_enabled
-        self._login_refresh_enabled = False
+        context = self._context
+        prev = context.login_refresh_enabled
+        context.login_refresh_enabled = False
         try:
             yield
         finally:
-            self._login_refresh_enabled = prev
+            context.login_refresh_enabled = prev
 
     @contextmanager
     def disable_version_checking_context(self):
-        prev = self._check_version_compatibility
-        self._check_version_compatibility = False
+        context = self._context
+        prev = context.check_version_compatibility
+        context.check_version_compatibility = False
         try:
             yield
         finally:
-            self._check_version_compatibility = prev
+            context.check_version_compatibility = prev
 
     @contextmanager
     def added_headers_context(self, headers):
-        prev = self._session.headers.copy()
+        context = self._context
+        prev = context.headers
+        context.headers = dict(prev, **headers)
         try:
-            for k, v in headers.items():
-                self._session.headers[k] = v
             yield
         finally:
-            self._session.headers.clear()
-            for k, v in prev.items():
-                self._session.headers[k] = v  # pylint: disable=undefined-loop-variable
+            context.headers = prev
 
     @contextmanager
     def use_basic_auth_context(self):
         """Causes API requests to send auth through Basic authorization"""
-        prev = self._use_basic_auth
+        context = self._context
+        prev = context.use_basic_auth
         try:
-            self._use_basic_auth = True
+            context.use_basic_auth = True
             yield
         finally:
-            self._use_basic_auth = prev
+            context.use_basic_auth = prev
 
     def clone_requests_session(self):
         """
@@ -167,32 +285,36 @@ class API:
         cloned_session.verify = copy.copy(self._session.verify)
         cloned_session.cert = copy.copy(self._session.cert)
         cloned_session.headers = self._session.headers.copy()
+        cloned_session.headers.update(self._get_added_headers())
         cloned_session.adapters = self._session.adapters.copy()
         return cloned_session
 
     def __del__(self):
-        if self._session is not None:
+        if self._credentials.session is not None:
             try:
-                self._session.close()
+                self._credentials.session.close()
             except ReferenceError:
                 pass
 
     def reinitialize_session(self, auth=None):
-        prev_auth = self._auth
+        credentials = self._get_credentials()
+        prev_auth = credentials.auth
         if auth is None:
-            auth = self._auth
-        if self._session is not None:
-            prev_cookies = self._session.cookies.copy()
-            self._session.close()
+            auth = credentials.auth
+        if credentials.session is not None:
+            prev_cookies = credentials.session.cookies.copy()
+            credentials.session.close()
         else:
             prev_cookies = None
         was_logged_in = self.is_logged_in()
-        self._session = requests.Session()
+        session = credentials.session = requests.Session()
+        for prefix in ("http://", "https://"):
+            session.mount(prefix, PoolingHTTPAdapter(self._connection_stats))
 
-        assert self._session.cert is None
-        self._session.cert = self._ssl_cert
+        assert session.cert is None
+        session.cert = self._ssl_cert
         if not self._ssl_cert:
-            self._session.verify = False
+            session.verify = False
         self.set_auth(auth, login=False)
 
         if prev_auth == auth and prev_cookies is not None:
@@ -200,6 +322,13 @@ class API:
             if was_logged_in:
                 self.mark_logged_in()
 
+    def get_connection_stats(self):
+        """
+        Returns the :class:`.ConnectionStats` counting connections opened by this API's session, and how
+        many requests reused already open connections
+        """
+        return self._connection_stats
+
     @property
     def urls(self):
         return list(self._urls)
@@ -210,13 +339,21 @@ class API:
             raise RuntimeError("No URLs configured for {}".format(self.system))
         return self._urls[0]
 
+    def get_max_request_url_length(self, path):
+        """
+        Returns the length of the longest full URL (including the scheme, host and API prefix) at which the given
+        path may be requested
+        """
+        return max(len(str(_join_path(url, URL(path)))) for url in self._urls)
+
     @contextmanager
     def query_preprocessor(self, preprocessor):
-        self._preprocessors.append(preprocessor)
+        preprocessors = self._context.preprocessors
+        preprocessors.append(preprocessor)
         try:
             yield
         finally:
-            self._preprocessors.remove(preprocessor)
+            preprocessors.remove(preprocessor)
 
     @contextmanager
     def get_approval_context(self, value):
@@ -241,27 +378,33 @@ class API:
 
     @contextmanager
     def change_request_default_timeout_context(self, timeout):
-        prev = self.get_request_default_timeout()
-        self.set_request_default_timeout(timeout)
+        context = self._context
+        prev = context.timeout
+        context.timeout = timeout
         try:
             yield
         finally:
-            self.set_request_default_timeout(prev)
+            context.timeout = prev
 
     def get_request_default_timeout(self):
-        return self._default_request_timeout
+        timeout = self._context.timeout
+        if timeout is NOTHING:
+            timeout = self._default_request_timeout
+        return timeout
 
     def set_request_default_timeout(self, timeout_seconds):
         self._default_request_timeout = timeout_seconds
 
     def is_logged_in(self):
-        return self._is_logged_in
+        return self._get_credentials().is_logged_in
 
     def mark_logged_in(self):
-        self._is_logged_in = True
+        credentials = self._get_credentials()
+        credentials.is_logged_in = True
+        credentials.login_generation += 1
 
     def mark_not_logged_in(self):
-        self._is_logged_in = False
+        self._get_credentials().is_logged_in = False
 
     def set_auth(self, username_or_auth, password=NOTHING, login=True):
         """
@@ -272,8 +415,9 @@ class API:
         >>> system.api.set_auth(('username', 'password'))
         >>> system.api.set_auth('username', 'password')
         """
+        credentials = self._get_credentials()
         if username_or_auth is None and password is NOTHING:
-            self._auth = None
+            credentials.auth = None
             password = None
         else:
             if isinstance(username_or_auth, tuple):
@@ -284,7 +428,7 @@ class API:
                 if password is NOTHING:
                     raise TypeError("Password not specified")
                 username = username_or_auth
-            self._auth = (username, password)
+            credentials.auth = (username, password)
         self.clear_cookies()
         self.mark_not_logged_in()
         if login:
@@ -294,7 +438,7 @@ class API:
         """
         Returns a tuple of the current username/password used by the API
         """
-        return self._auth
+        return self._get_credentials().auth
 
     @contextmanager
     def get_auth_context(self, username, password, login=True):
@@ -303,8 +447,15 @@ class API:
 
         >>> with system.api.get_auth_context('username', 'password'):
         ...     ... # execute operations as 'username'
+
+        In thread-safe mode, the authentication information only changes for the current thread, which uses
+        a separate session for the duration of the context
         """
-        _logger.debug("Changing credentials to {}", username)
+        logger.debug("Changing credentials to {}", username)
+        if self.is_thread_safe():
+            with self._get_thread_auth_context(username, password, login):
+                yield
+            return
         auth = (username, password)
         prev = self.get_auth()
         prev_cookies = self._session.cookies.copy()
@@ -313,14 +464,30 @@ class API:
             self.set_auth(*auth, login=login)
             yield
         finally:
-            _logger.debug("Changing credentials back to {}", prev[0])
+            logger.debug("Changing credentials back to {}", prev[0])
             self.set_auth(*prev, login=False)
-            _logger.trace("Restoring cookies for user: {}", prev_cookies)
+            logger.trace("Restoring cookies for user: {}", prev_cookies)
             self._session.cookies.clear()
             self._session.cookies.update(prev_cookies)
 
+    @contextmanager
+    def _get_thread_auth_context(self, username, password, login):
+        context = self._context
+        prev = context.credentials
+        session = self.clone_requests_session()
+        session.cookies.clear()
+        context.credentials = _Credentials(session, (username, password))
+        try:
+            if login:
+                self.system.login()
+            yield
+        finally:
+            logger.debug("Changing credentials back for current thread")
+            context.credentials = prev
+            session.close()
+
     def clear_cookies(self):
-        _logger.trace("Clearing cookies: {}", self._session.cookies)
+        logger.trace("Clearing cookies: {}", self._session.cookies)
         self._session.cookies.clear()
 
     get = _get_request_delegate("get")
@@ -329,6 +496,141 @@ class API:
     patch = _get_request_delegate("patch")
     delete = _get_request_delegate("delete")
 
+    def _should_check_version(self, check_version):
+        return (
+            check_version
+            and self._context.check_version_compatibility
+            and not self._checked_version
+            and config.root.check_version_compatibility
+        )
+
+    def _get_request_auth(self):
+        if (
+            self._context.use_basic_auth
+            or not self.system.compat.is_initialized()
+            or not self.system.compat.has_auth_sessions()
+        ):
+            return self.get_auth()
+        return None
+
+    def _get_added_headers(self):
+        added_headers = self._context.headers
+        if self._remote_authorization is not None:
+            added_headers = dict(
+                added_headers, **{"X-Remote-Authorization": self._remote_authorization}
+            )
+        return added_headers
+
+    def _pop_request_body(self, kwargs):
+        """Pops the body related arguments of a request, returning a tuple of (data, sent_json_object, headers)"""
+        raw_data = kwargs.pop("raw_data", False)
+        data = kwargs.pop("data", NOTHING)
+        sent_json_object = None
+        headers = dict(self._get_added_headers())
+        headers.update(kwargs.pop("headers", None) or ())
+
+        if data is not NOTHING:
+            headers["Content-type"] = "application/json"
+            if raw_data:
+                sent_json_object = data
+            else:
+                data = translate_special_values(data)
+                sent_json_object = data
+                data = get_json_codec().dumps(data)
+        else:
+            assert raw_data is False, "Cannot handle raw_data with no data"
+        return data, sent_json_object, headers
+
+    def _build_api_request(
+        self, http_method, url, path, data, sent_json_object, **request_kwargs
+    ):
+        full_url = _join_path(url, URL(path))
+
+        if (
+            http_method != "get"
+            and not self._interactive
+            and not path.startswith("/api/internal/")
+        ):
+            full_url = self._with_approved(full_url)
+
+        api_request = requests.Request(
+            http_method,
+            full_url,
+            data=data if data is not NOTHING else None,
+            **request_kwargs
+        )
+        for preprocessor in list(self._context.preprocessors):
+            preprocessor(api_request)
+
+        if _is_trace_enabled():
+            hostname = full_url.hostname
+            logger.trace(
+                "{} <-- {} {}", hostname, http_method.upper(), api_request.url
+            )
+            if data is not NOTHING:
+                logger.trace(
+                    "{} <-- DATA: {}",
+                    hostname,
+                    _LazyLogValue(
+                        self._get_logged_sent_data,
+                        data,
+                        api_request.data,
+                        sent_json_object,
+                    ),
+                )
+        return api_request
+
+    def _get_transport_failure(
+        self, error, api_request, http_method, path, send_kwargs, start_time
+    ):
+        request_kwargs = dict(url=path, method=http_method, **send_kwargs)
+        logger.debug(
+            "Exception while sending API command to {}: {}", self.system, error
+        )
+        error_str = str(error).lower()
+        if any(
+            substring in error_str
+            for substring in (
+                "gaierror",
+                "nodename nor servname",
+                "name or service not known",
+                "temporary failure in name resolution",
+            )
+        ):
+            return SystemNotFoundException(error, api_request, start_time)
+        return APITransportFailure(
+            self.system, request_kwargs, error, api_request, start_time
+        )
+
+    def _log_response(self, hostname, returned, streamed=False):
+        if not _is_trace_enabled():
+            return
+        response = returned.response
+        elapsed = response.elapsed.total_seconds()
+        logger.trace(
+            "{} --> {} {} (took {:.04f}s)",
+            hostname,
+            response.status_code,
+            response.reason,
+            elapsed,
+        )
+        if streamed:
+            logger.trace("{} --> <streamed>", hostname)
+            return
+        if self._context.no_response_logs:
+            logged_response_data = "..."
+        else:
+            logged_response_data = _LazyLogValue(
+                self._get_logged_response_data, returned
+            )
+        logger.trace("{} --> {}", hostname, logged_response_data)
+
+    def _get_logged_response_data(self, returned):
+        resp_data = returned.get_json()
+        if self._use_pretty_json and resp_data is not None:
+            return get_json_codec().dumps_pretty(resp_data)
+        return resp_data
+
     def _request(self, http_method, path, **kwargs):
         """
         Sends a request to the system API interface
@@ -336,12 +638,7 @@ class API:
         :returns: :class:`.Response`
         """
         check_version = kwargs.pop("check_version", True)
-        if (
-            check_version
-            and self._check_version_compatibility
-            and not self._checked_version
-            and config.root.check_version_compatibility
-        ):
+        if self._should_check_version(check_version):
             self._checked_version = True
             try:
                 with self.use_basic_auth_context():
@@ -351,7 +648,8 @@ class API:
                 raise
 
         returned = None
-        kwargs.setdefault("timeout", self._default_request_timeout)
+        kwargs.setdefault("timeout", self.get_request_default_timeout())
+        streamed = kwargs.get("stream", False)
         auth = None
 
         if hasattr(self.system, "compat"):
@@ -359,33 +657,10 @@ class API:
                 if not self.system.compat.is_initialized():
                     with self.disable_version_checking_context():
                         self.system.compat.initialize()
-            if (
-                self._use_basic_auth
-                or not self.system.compat.is_initialized()
-                or not self.system.compat.has_auth_sessions()
-            ):
-                auth = self._auth
+            auth = self._get_request_auth()
 
-        raw_data = kwargs.pop("raw_data", False)
-        data = kwargs.pop("data", NOTHING)
-        sent_json_object = None
-        headers = kwargs.pop("headers", None)
+        data, sent_json_object, headers = self._pop_request_body(kwargs)
         files = kwargs.pop("files", None)
-        if headers is None:
-            headers = {}
-        else:
-            headers = headers.copy()
-
-        if data is not NOTHING:
-            headers["Content-type"] = "application/json"
-            if raw_data:
-                sent_json_object = data
-            else:
-                data = translate_special_values(data)
-                sent_json_object = data
-                data = json.dumps(data)
-        else:
-            assert raw_data is False, "Cannot handle raw_data with no data"
 
         url_params = kwargs.pop("params", None)
         if url_params is not None:
@@ -395,96 +670,78 @@ class API:
         urls = self._get_possible_urls(specified_address)
 
         for url in urls:
-            full_url = _join_path(url, URL(path))
-
-            if (
-                http_method != "get"
-                and not self._interactive
-                and not path.startswith("/api/internal/")
-            ):
-                full_url = self._with_approved(full_url)
-
-            hostname = full_url.hostname
-            api_request = requests.Request(
+            api_request = self._build_api_request(
                 http_method,
-                full_url,
-                data=data if data is not NOTHING else None,
+                url,
+                path,
+                data,
+                sent_json_object,
                 params=url_params,
                 headers=headers,
                 auth=auth,
                 files=files,
             )
-            for preprocessor in self._preprocessors:
-                preprocessor(api_request)
-
-            _logger.trace(
-                "{} <-- {} {}", hostname, http_method.upper(), api_request.url
-            )
-            if data is not NOTHING:
-                if data != api_request.data:
-                    sent_json_object = json.loads(api_request.data)
-                self._log_sent_data(hostname, data, sent_json_object)
+            hostname = URL(api_request.url).hostname
 
             prepared = self._session.prepare_request(api_request)
             gossip.trigger("infinidat.sdk.before_api_request", request=prepared)
             start_time = flux.current_timeline.time()
+            send_start_time = time.perf_counter()
             try:
                 response = self._session.send(prepared, **kwargs)
             except _RETRY_REQUESTS_EXCEPTION_TYPES as e:  # pylint: disable=catching-non-exception
-                request_kwargs = dict(url=path, method=http_method, **kwargs)
-                _logger.debug(
-                    "Exception while sending API command to {}: {}", self.system, e
-                )
-                error_str = str(e).lower()
-                if any(
-                    substring in error_str
-                    for substring in (
-                        "gaierror",
-                        "nodename nor servname",
-                        "name or service not known",
-                        "temporary failure in name resolution",
-                    )
-                ):
-                    raise SystemNotFoundException(e, api_request, start_time) from e
-                raise APITransportFailure(
-                    self.system, request_kwargs, e, api_request, start_time
+                self._record_metrics(prepared, time.perf_counter() - send_start_time)
+                raise self._get_transport_failure(
+                    e, api_request, http_method, path, kwargs, start_time
                 ) from e
 
+            self._record_metrics(
+                prepared, time.perf_counter() - send_start_time, response, streamed
+            )
             end_time = flux.current_timeline.time()
             gossip.trigger(
                 "infinidat.sdk.after_api_request", request=prepared, response=response
             )
 
-            elapsed = response.elapsed.total_seconds()
-            _logger.trace(
-                "{} --> {} {} (took {:.04f}s)",
-                hostname,
-                response.status_code,
-                response.reason,
-                elapsed,
-            )
             returned = Response(response, data, start_time, end_time)
-            resp_data = returned.get_json()
-            if self._no_response_logs:
-                logged_response_data = "..."
-            elif self._use_pretty_json and resp_data is not None:
-                logged_response_data = json.dumps(
-                    resp_data, indent=4, separators=(",", ": ")
-                )
-            else:
-                logged_response_data = resp_data
-            _logger.trace("{} --> {}", hostname, logged_response_data)
+            self._log_response(hostname, returned, streamed)
             if response.status_code != httplib.SERVICE_UNAVAILABLE:
                 if specified_address is None:  # need to remember our next API target
                     self._active_url = url
                 break
+            if url is not urls[-1]:
+                self._discard_response(returned, streamed)
         return returned
 
-    def _log_sent_data(self, hostname, data, sent_json_object):
+    def _discard_response(self, returned, streamed):
+        if streamed:
+            # the body is never read, so the connection is released before the request is sent again
+            returned.response.close()
+
+    def _record_metrics(self, prepared, elapsed_seconds, response=None, streamed=False):
+        if response is None:
+            bytes_received = 0
+        elif streamed:
+            bytes_received = int(response.headers.get("Content-Length", 0))
+        else:
+            bytes_received = len(response.content)
+        self.metrics.record(
+            prepared.method,
+            prepared.path_url,
+            elapsed_seconds,
+            status_code=None if response is None else response.status_code,
+            bytes_sent=len(prepared.body) if prepared.body else 0,
+            bytes_received=bytes_received,
+        )
+
+    def _get_logged_sent_data(self, data, sent_data, sent_json_object):
         try:
+            if data != sent_data:
+                # the data was changed by a preprocessor
+                sent_json_object = get_json_codec().loads(sent_data)
             # Hide potential passwords included in JSON
             if isinstance(sent_json_object, dict) and "password" in sent_json_object:
-                data = json.dumps(
+                data = get_json_codec().dumps(
                     dict(
                         sent_json_object,
                         password="*" * len(sent_json_object["password"]),
@@ -492,7 +749,7 @@ class API:
                 )
         except (ValueError, TypeError):
             pass
-        _logger.trace("{} <-- DATA: {}", hostname, data)
+        return data
 
     @contextmanager
     def limited_interaction_context(
@@ -503,21 +760,22 @@ class API:
         disable_patch=False,
         disable_delete=False,
     ):
-        disabled_http_methods = set(self._disabled_http_methods)
+        context = self._context
+        disabled_http_methods = set(context.disabled_http_methods)
         if disable_post:
-            self._disabled_http_methods.add("post")
+            context.disabled_http_methods.add("post")
         if disable_get:
-            self._disabled_http_methods.add("get")
+            context.disabled_http_methods.add("get")
         if disable_put:
-            self._disabled_http_methods.add("put")
+            context.disabled_http_methods.add("put")
         if disable_patch:
-            self._disabled_http_methods.add("patch")
+            context.disabled_http_methods.add("patch")
         if disable_delete:
-            self._disabled_http_methods.add("delete")
+            context.disabled_http_methods.add("delete")
         try:
             yield
         finally:
-            self._disabled_http_methods = disabled_http_methods
+            context.disabled_http_methods = disabled_http_methods
 
     def read_only_context(self):
         return self.limited_interaction_context(
@@ -535,23 +793,24 @@ class API:
 
     @contextmanager
     def get_no_response_logs_context(self):
-        self._no_response_logs += 1
+        context = self._context
+        context.no_response_logs += 1
         try:
             yield
         finally:
-            self._no_response_logs -= 1
+            context.no_response_logs -= 1
 
     def add_auto_retry(self, retry_predicate, max_retries=1, sleep_seconds=None):
         if sleep_seconds is None:  # backwards compatibility
             sleep_seconds = config.root.defaults.retry_sleep_seconds
         assert retry_predicate not in self._auto_retry_predicates
-        _logger.debug(
+        logger.debug(
             "Add auto-retry predicate {} for {} retries", retry_predicate, max_retries
         )
         self._auto_retry_predicates[retry_predicate] = (max_retries, sleep_seconds)
 
     def remove_auto_retry(self, retry_predicate):
-        _logger.debug("Remove auto-retry predicate {}", retry_predicate)
+        logger.debug("Remove auto-retry predicate {}", retry_predicate)
         del self._auto_retry_predicates[retry_predicate]
 
     def is_auto_retry_active(self, retry_predicate):
@@ -571,7 +830,7 @@ class API:
 
     def request(self, http_method, path, assert_success=True, **kwargs):
         """Sends HTTP API request to the remote system"""
-        if http_method in self._disabled_http_methods:
+        if http_method in self._context.disabled_http_methods:
             raise MethodDisabled(
                 'Request "{} {}" aborted, method is disabled'.format(
                     http_method.upper(), path
@@ -580,25 +839,16 @@ class API:
         did_interactive_confirmation = False
         did_login = False
         had_cookies = bool(self._session.cookies)
+        streamed = kwargs.get("stream", False)
         auto_retries_context = self._get_auto_retries_context()
         while True:
             with auto_retries_context:
+                login_generation = self._get_credentials().login_generation
                 returned = self._request(http_method, path, **kwargs)
 
-                if (
-                    returned.status_code == requests.codes.unauthorized
-                    and self._login_refresh_enabled
-                    and had_cookies
-                    and not did_login
-                    and "login" not in path
-                ):
-
-                    _logger.trace(
-                        "Performing login again due to expired cookie ({})",
-                        self._session.cookies,
-                    )
-                    self.mark_not_logged_in()
-                    self.system.login()
+                if self._should_refresh_login(returned, path, had_cookies, did_login):
+                    self._discard_response(returned, streamed)
+                    self._refresh_login(login_generation)
                     did_login = True
                     continue
 
@@ -607,36 +857,22 @@ class API:
                         returned.assert_success()
                     except APICommandFailed as e:
                         if self._is_approval_required(e):
-                            reason = self._get_unapproved_reason(
-                                e.response.response.json()
-                            )
+                            reason = self._get_unapproved_reason(e.response.get_json())
                             if self._interactive and not did_interactive_confirmation:
                                 did_interactive_confirmation = True
                                 if self._ask_approval_interactively(
                                     http_method, path, reason
                                 ):
+                                    self._discard_response(returned, streamed)
                                     path = self._with_approved(path)
                                     continue
                                 raise CommandNotApproved(e.response, reason) from e
                         if (e.status_code == 403) and (
                             e.error_code == "REMOTE_PERMISSION_REQUIRED"
                         ):
-                            try:
-                                (
-                                    related_user,
-                                    related_password,
-                                ) = self._get_related_system_auth()
-                                self._session.headers[
-                                    "X-Remote-Authorization"
-                                ] = b"Basic " + b64encode(
-                                    f"{related_user}:{related_password}".encode()
-                                )
-                                continue
-                            except TypeError as e:
-                                raise RelatedSystemNotFound(
-                                    "There are no "
-                                    "related systems registered to get the auth from"
-                                ) from e
+                            self._discard_response(returned, streamed)
+                            self._set_remote_authorization()
+                            continue
                         raise
                 deprecation_header = returned.response.headers.get(
                     "x-infinidat-deprecated-api"
@@ -649,6 +885,39 @@ class API:
                 return returned
         assert False, "Should never get here!"  # pragma: no cover
 
+    def _should_refresh_login(self, returned, path, had_cookies, did_login):
+        return (
+            returned.status_code == requests.codes.unauthorized
+            and self._context.login_refresh_enabled
+            and had_cookies
+            and not did_login
+            and "login" not in path
+        )
+
+    def _refresh_login(self, login_generation):
+        credentials = self._get_credentials()
+        with self._login_lock:
+            if credentials.login_generation != login_generation:
+                logger.trace("Login was already refreshed by another request")
+                return
+            logger.trace(
+                "Performing login again due to expired cookie ({})",
+                self._session.cookies,
+            )
+            self.mark_not_logged_in()
+            self.system.login()
+
+    def _set_remote_authorization(self):
+        try:
+            related_user, related_password = self._get_related_system_auth()
+        except TypeError as e:
+            raise RelatedSystemNotFound(
+                "There are no related systems registered to get the auth from"
+            ) from e
+        self._remote_authorization = b"Basic " + b64encode(
+            f"{related_user}:{related_password}".encode()
+        )
+
     def _get_related_system_auth(self):
         for related_system in self.system.iter_related_systems():
             if related_system is not None:
@@ -730,7 +999,7 @@ class Response:
         returned = self._cached_json
         if returned is NOTHING:
             try:
-                returned = self.response.json()
+                returned = get_json_codec().loads(self.response.content)
             except (ValueError, TypeError):
                 returned = None
             self._cached_json = returned
@@ -739,6 +1008,25 @@ class Response:
     def _get_result(self):
         return self.get_json()["result"]
 
+    def iter_result_items(self):
+        """
+        Decodes the items of a list result one by one while the response body is being received, without
+        holding the entire body in memory. The response should be obtained by passing ``stream=True`` to the
+        request.
+
+        Once all items are consumed, the rest of the response JSON object (e.g. its metadata) is available
+        through :meth:`.get_json`
+        """
+        other_members = {}
+        try:
+            for item in iter_list_items(
+                self.response.iter_content(_STREAM_CHUNK_SIZE), "result", other_members
+            ):
+                yield item
+        finally:
+            self.response.close()
+        self._cached_json = other_members
+
     def get_result(self):
         """
         :returns: The result of the API call, extracted from the response JSON object
@@ -791,7 +1079,11 @@ class _AutoRetryContext:
         self._retries_dict = None
         self._global_retries_dict = global_retries_dict
 
-    def _should_retry_request(self, exc):
+    def get_retry_sleep_seconds(self, exc):
+        """
+        Returns the number of seconds to sleep before retrying a request which failed with the given exception,
+        or ``None`` if it shouldn't be retried. Each call consumes one of the retries of the matching predicate
+        """
         if self._retries_dict is None:
             self._retries_dict = dict(
                 (k, v[0]) for k, v in self._global_retries_dict.items()
@@ -806,7 +1098,7 @@ class _AutoRetryContext:
                     retry_predicate
                 ]
                 retried_count = max_retries - retries_left + 1
-                _logger.debug(
+                logger.debug(
                     "Auto retry API ({} of {}) by {}: {}",
                     retried_count,
                     max_retries,
@@ -821,7 +1113,7 @@ class _AutoRetryContext:
         pass
 
     def __exit__(self, exc_type, exc_value, traceback):
-        sleep_seconds = self._should_retry_request(exc_value)
+        sleep_seconds = self.get_retry_sleep_seconds(exc_value)
         if sleep_seconds is not None:
             flux.current_timeline.sleep(sleep_seconds)
             return True
@@ -1,4 +1,5 @@
 import abc
+import weakref
 
 from munch import Munch
 
@@ -14,6 +15,8 @@ class APITarget(metaclass=abc.ABCMeta):
     OBJECT_TYPES = []
     SYSTEM_EVENTS_TYPE = None
     SYSTEM_COMPONENTS_TYPE = None
+    #: specifies which :class:`.API` subclass is used to communicate with the target
+    API_CLASS = API
 
     def __init__(self, address, auth=None, use_ssl=False, ssl_cert=None):
         """
@@ -28,13 +31,14 @@ class APITarget(metaclass=abc.ABCMeta):
         if auth is None:
             auth = self._get_api_auth()  # pylint: disable=assignment-from-none
 
-        self.api = API(self, auth, use_ssl=use_ssl, ssl_cert=ssl_cert)
+        self.api = self.API_CLASS(self, auth, use_ssl=use_ssl, ssl_cert=ssl_cert)
         self.api.set_request_default_timeout(self._get_api_timeout())
 
         self.types = Munch()
 
         self._initialize()
         self._caching_enabled = True
+        self._identity_map = None
 
     def _initialize(self):
         for object_type in self.OBJECT_TYPES:
@@ -54,6 +58,12 @@ class APITarget(metaclass=abc.ABCMeta):
     def is_field_supported(self, field):  # pylint: disable=unused-argument
         return True
 
+    def get_supported_field_names(self, object_type):
+        """Returns a frozen set of the names of the fields of the given object type supported by the target"""
+        return frozenset(
+            field.name for field in object_type.fields if self.is_field_supported(field)
+        )
+
     def disable_caching(self):
         """Disables field caching, and causes each field fetching to fetch the actual up-to-date value from the system"""
         self._caching_enabled = False
@@ -66,6 +76,25 @@ class APITarget(metaclass=abc.ABCMeta):
         """Returns whether caching is currently enabled"""
         return self._caching_enabled
 
+    def enable_identity_map(self):
+        """Causes objects of the same type and id to be represented by a single Python object (as long as it is
+        referenced), sharing a single field cache
+        """
+        if self._identity_map is None:
+            self._identity_map = weakref.WeakValueDictionary()
+
+    def disable_identity_map(self):
+        """Disables the identity map, causing each constructed object to be a distinct Python object"""
+        self._identity_map = None
+
+    def is_identity_map_enabled(self):
+        """Returns whether the identity map is currently enabled"""
+        return self._identity_map is not None
+
+    def get_identity_map(self):
+        """Returns the mapping of unique keys to live objects, or ``None`` if the identity map is disabled"""
+        return self._identity_map
+
     def check_version(self):
         """Called automatically by the API on the first request made to the system. Should fetch and verify the
         system version to make sure it can be operated against.
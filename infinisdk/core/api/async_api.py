@@ -0,0 +1,278 @@
+import asyncio
+import socket
+import ssl
+import time
+from datetime import timedelta
+from http import client as httplib
+
+import flux
+import gossip
+import requests
+from logbook import Logger
+from requests.cookies import MockRequest, MockResponse
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from sentinels import NOTHING
+from urlobject import URLObject as URL
+from vintage import warn_deprecation
+
+from ..exceptions import (
+    APICommandFailed,
+    CommandNotApproved,
+    InvalidUsageException,
+    MethodDisabled,
+)
+from .api import API, Response
+from .special_values import translate_special_values
+
+try:
+    import aiohttp
+    from yarl import URL as _EncodedURL
+except ImportError:
+    aiohttp = None
+
+_logger = Logger(__name__)
+
+_SUPPORTED_REQUEST_KWARGS = frozenset(["timeout", "files", "params", "address"])
+
+
+def _get_transport_exception_types():
+    return (aiohttp.ClientError, asyncio.TimeoutError, socket.error)
+
+
+def _extract_cookies(jar, prepared, headers):
+    message = httplib.HTTPMessage()
+    for value in headers.getall("Set-Cookie", ()):
+        message["Set-Cookie"] = value
+    jar.extract_cookies(MockResponse(message), MockRequest(prepared))
+
+
+def _make_requests_response(prepared, resp, body, elapsed):
+    # pylint: disable=protected-access
+    returned = requests.Response()
+    returned.status_code = resp.status
+    returned.reason = resp.reason
+    returned.headers = CaseInsensitiveDict(resp.headers)
+    returned.encoding = get_encoding_from_headers(returned.headers)
+    returned._content = body
+    returned.url = str(resp.url)
+    returned.request = prepared
+    returned.elapsed = elapsed
+    return returned
+
+
+class AsyncAPI(API):
+    """
+    An :class:`.API` variant whose requests are coroutines, sent through an ``aiohttp`` session:
+
+    >>> response = await system.api.get("volumes") # doctest: +SKIP
+
+    URL handling, approval preprocessing, login refresh and :class:`.Response` wrapping behave exactly
+    like in :class:`.API`. Cookies and session headers are still kept on the underlying ``requests``
+    session, which is used for preparing requests.
+    """
+
+    def __init__(self, target, auth, use_ssl, ssl_cert):
+        if aiohttp is None:
+            raise InvalidUsageException(
+                "aiohttp is required for asynchronous API requests"
+            )
+        self._transport = None
+        super(AsyncAPI, self).__init__(target, auth, use_ssl, ssl_cert)
+
+    def _get_transport(self):
+        if self._transport is None or self._transport.closed:
+            if self._ssl_cert:
+                ssl_context = ssl.create_default_context()
+                if isinstance(self._ssl_cert, (tuple, list)):
+                    ssl_context.load_cert_chain(*self._ssl_cert)
+                else:
+                    ssl_context.load_cert_chain(self._ssl_cert)
+            else:
+                ssl_context = False
+            self._transport = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(ssl=ssl_context),
+                cookie_jar=aiohttp.DummyCookieJar(),
+            )
+        return self._transport
+
+    async def close(self):
+        """Closes the underlying ``aiohttp`` session"""
+        if self._transport is not None:
+            await self._transport.close()
+            self._transport = None
+
+    def set_auth(self, username_or_auth, password=NOTHING, login=False):
+        """
+        Like :meth:`API.set_auth`, only logging in has to be awaited separately through ``system.login()``
+        """
+        if login:
+            raise InvalidUsageException(
+                "Logging in asynchronously must be done through `await system.login()`"
+            )
+        super(AsyncAPI, self).set_auth(username_or_auth, password, login=False)
+
+    async def _send(self, prepared, timeout):
+        start = time.perf_counter()
+        async with self._get_transport().request(
+            prepared.method,
+            _EncodedURL(prepared.url, encoded=True),
+            data=prepared.body,
+            headers=dict(prepared.headers),
+            timeout=aiohttp.ClientTimeout(total=timeout),
+        ) as resp:
+            body = await resp.read()
+        _extract_cookies(self._session.cookies, prepared, resp.headers)
+        elapsed = timedelta(seconds=time.perf_counter() - start)
+        return _make_requests_response(prepared, resp, body, elapsed)
+
+    async def _request(self, http_method, path, **kwargs):
+        """
+        Sends a request to the system API interface
+
+        :returns: :class:`.Response`
+        """
+        # Unlike the API's context managers, these are passed explicitly, since contexts entered around an
+        # await would apply to the requests of all other coroutines sharing the API as well
+        check_version = kwargs.pop("check_version", True)
+        use_basic_auth = kwargs.pop("use_basic_auth", False)
+        if self._should_check_version(check_version):
+            self._checked_version = True
+            try:
+                await self.system.check_version(use_basic_auth=True)
+            except Exception:  # pylint: disable=broad-except
+                self._checked_version = False
+                raise
+
+        returned = None
+        auth = None
+
+        if hasattr(self.system, "compat"):
+            if path != "_features":
+                if not self.system.compat.is_initialized():
+                    await self.system.initialize_compat()
+            auth = self.get_auth() if use_basic_auth else self._get_request_auth()
+
+        data, sent_json_object, headers = self._pop_request_body(kwargs)
+        unsupported = set(kwargs) - _SUPPORTED_REQUEST_KWARGS
+        if unsupported:
+            raise TypeError(
+                "Unsupported arguments for asynchronous requests: {}".format(
+                    ", ".join(sorted(unsupported))
+                )
+            )
+        timeout = kwargs.pop("timeout", self.get_request_default_timeout())
+        files = kwargs.pop("files", None)
+
+        url_params = kwargs.pop("params", None)
+        if url_params is not None:
+            url_params = translate_special_values(url_params)
+
+        specified_address = kwargs.pop("address", None)
+        urls = self._get_possible_urls(specified_address)
+
+        for url in urls:
+            api_request = self._build_api_request(
+                http_method,
+                url,
+                path,
+                data,
+                sent_json_object,
+                params=url_params,
+                headers=headers,
+                auth=auth,
+                files=files,
+            )
+            hostname = URL(api_request.url).hostname
+
+            prepared = self._session.prepare_request(api_request)
+            gossip.trigger("infinidat.sdk.before_api_request", request=prepared)
+            start_time = flux.current_timeline.time()
+            send_start_time = time.perf_counter()
+            try:
+                response = await self._send(prepared, timeout)
+            except _get_transport_exception_types() as e:
+                self._record_metrics(prepared, time.perf_counter() - send_start_time)
+                raise self._get_transport_failure(
+                    e, api_request, http_method, path, {"timeout": timeout}, start_time
+                ) from e
+
+            self._record_metrics(
+                prepared, time.perf_counter() - send_start_time, response
+            )
+            end_time = flux.current_timeline.time()
+            gossip.trigger(
+                "infinidat.sdk.after_api_request", request=prepared, response=response
+            )
+
+            returned = Response(response, data, start_time, end_time)
+            self._log_response(hostname, returned)
+            if response.status_code != httplib.SERVICE_UNAVAILABLE:
+                if specified_address is None:  # need to remember our next API target
+                    self._active_url = url
+                break
+        return returned
+
+    async def request(self, http_method, path, assert_success=True, **kwargs):
+        """
+        Sends HTTP API request to the remote system. Pass ``use_basic_auth=True`` to send the auth through Basic
+        authorization, or ``check_version=False`` to skip checking the system's version
+        """
+        if http_method in self._context.disabled_http_methods:
+            raise MethodDisabled(
+                'Request "{} {}" aborted, method is disabled'.format(
+                    http_method.upper(), path
+                )
+            )
+        did_interactive_confirmation = False
+        did_login = False
+        had_cookies = bool(self._session.cookies)
+        auto_retries_context = self._get_auto_retries_context()
+        while True:
+            try:
+                returned = await self._request(http_method, path, **kwargs)
+
+                if self._should_refresh_login(returned, path, had_cookies, did_login):
+                    _logger.trace(
+                        "Performing login again due to expired cookie ({})",
+                        self._session.cookies,
+                    )
+                    self.mark_not_logged_in()
+                    await self.system.login()
+                    did_login = True
+                    continue
+
+                if assert_success:
+                    try:
+                        returned.assert_success()
+                    except APICommandFailed as e:
+                        if self._is_approval_required(e):
+                            reason = self._get_unapproved_reason(e.response.get_json())
+                            if self._interactive and not did_interactive_confirmation:
+                                did_interactive_confirmation = True
+                                if self._ask_approval_interactively(
+                                    http_method, path, reason
+                                ):
+                                    path = self._with_approved(path)
+                                    continue
+                                raise CommandNotApproved(e.response, reason) from e
+                        if (e.status_code == 403) and (
+                            e.error_code == "REMOTE_PERMISSION_REQUIRED"
+                        ):
+                            self._set_remote_authorization()
+                            continue
+                        raise
+                deprecation_header = returned.response.headers.get(
+                    "x-infinidat-deprecated-api"
+                )
+                if deprecation_header:
+                    warn_deprecation(
+                        "Deprecation warning: {}".format(deprecation_header),
+                        frame_correction=2,
+                    )
+                return returned
+            except Exception as e:  # pylint: disable=broad-except
+                sleep_seconds = auto_retries_context.get_retry_sleep_seconds(e)
+                if sleep_seconds is None:
+                    raise
+                await asyncio.sleep(sleep_seconds)
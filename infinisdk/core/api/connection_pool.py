@@ -0,0 +1,111 @@
+import functools
+import socket
+import threading
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from ..config import config
+
+
+class ConnectionStats:
+    """
+    Counts the HTTP connections opened by an API session, and the requests sent over them
+    """
+
+    def __init__(self):
+        super(ConnectionStats, self).__init__()
+        self._lock = threading.Lock()
+        self.opened = 0
+        self.requests = 0
+
+    @property
+    def reused(self):
+        """Number of requests sent over an already open connection"""
+        return max(self.requests - self.opened, 0)
+
+    def record_opened(self):
+        with self._lock:
+            self.opened += 1
+
+    def record_request(self):
+        with self._lock:
+            self.requests += 1
+
+    def reset(self):
+        with self._lock:
+            self.opened = self.requests = 0
+
+    def __repr__(self):
+        return "<ConnectionStats: opened={}, reused={}, requests={}>".format(
+            self.opened, self.reused, self.requests
+        )
+
+
+class _CountingPoolMixin:
+    def __init__(self, *args, **kwargs):
+        self._connection_stats = kwargs.pop("connection_stats")
+        super(_CountingPoolMixin, self).__init__(*args, **kwargs)
+
+    def _new_conn(self):
+        self._connection_stats.record_opened()
+        return super(_CountingPoolMixin, self)._new_conn()
+
+    def _make_request(self, *args, **kwargs):
+        self._connection_stats.record_request()
+        return super(_CountingPoolMixin, self)._make_request(*args, **kwargs)
+
+
+class _CountingHTTPConnectionPool(_CountingPoolMixin, HTTPConnectionPool):
+    pass
+
+
+class _CountingHTTPSConnectionPool(_CountingPoolMixin, HTTPSConnectionPool):
+    pass
+
+
+def _get_keepalive_socket_options():
+    pool_config = config.root.api.connection_pool
+    returned = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+    for option_name, value in [
+        ("TCP_KEEPIDLE", pool_config.tcp_keepalive_idle_seconds),
+        ("TCP_KEEPINTVL", pool_config.tcp_keepalive_interval_seconds),
+        ("TCP_KEEPCNT", pool_config.tcp_keepalive_probes),
+    ]:
+        option = getattr(socket, option_name, None)
+        if option is not None and value is not None:
+            returned.append((socket.IPPROTO_TCP, option, value))
+    return returned
+
+
+class PoolingHTTPAdapter(HTTPAdapter):
+    """
+    An :class:`requests.adapters.HTTPAdapter` configured by ``config.root.api.connection_pool``, which
+    counts opened connections and sent requests in the given :class:`.ConnectionStats`
+    """
+
+    def __init__(self, connection_stats):
+        self._connection_stats = connection_stats
+        pool_config = config.root.api.connection_pool
+        super(PoolingHTTPAdapter, self).__init__(
+            pool_connections=pool_config.pool_connections,
+            pool_maxsize=pool_config.pool_maxsize,
+            pool_block=pool_config.pool_block,
+            max_retries=pool_config.max_retries,
+        )
+
+    def init_poolmanager(self, *args, **pool_kwargs):
+        if config.root.api.connection_pool.tcp_keepalive:
+            pool_kwargs["socket_options"] = (
+                HTTPConnection.default_socket_options + _get_keepalive_socket_options()
+            )
+        super(PoolingHTTPAdapter, self).init_poolmanager(*args, **pool_kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": functools.partial(
+                _CountingHTTPConnectionPool, connection_stats=self._connection_stats
+            ),
+            "https": functools.partial(
+                _CountingHTTPSConnectionPool, connection_stats=self._connection_stats
+            ),
+        }
@@ -0,0 +1,137 @@
+import json
+import re
+
+from logbook import Logger
+
+from ..config import config
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+_logger = Logger(__name__)
+
+_AUTO = "auto"
+_PRETTY_INDENT = 4
+# integers of 19 digits or more might not fit in 64 bits
+_WIDE_INTEGER = re.compile(r"[0-9]{19}")
+_WIDE_INTEGER_BYTES = re.compile(rb"[0-9]{19}")
+
+
+class JSONCodec:
+    """
+    Encodes and decodes the JSON bodies of API requests and responses. Encoded bodies are ASCII strings, like
+    the ones encoded by the standard library's ``json``, which is also used for values the codec cannot encode
+    or decode exactly (e.g. integers wider than 64 bits)
+    """
+
+    #: the name by which the codec is selected in ``config.root.api.json_codec``
+    name = "json"
+
+    def is_available(self):
+        return True
+
+    def dumps(self, obj):
+        """Encodes the given object, returning a string"""
+        return json.dumps(obj)
+
+    def dumps_pretty(self, obj):
+        """Encodes the given object in an indented form, used for logging"""
+        return json.dumps(obj, indent=_PRETTY_INDENT, separators=(",", ": "))
+
+    def loads(self, data):
+        """
+        Decodes the given string or bytes. Raises ``ValueError`` if the data isn't valid JSON
+        """
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    name = "orjson"
+
+    def is_available(self):
+        return orjson is not None
+
+    def dumps(self, obj):
+        try:
+            returned = orjson.dumps(obj)
+        except (TypeError, OverflowError):
+            return super(OrjsonCodec, self).dumps(obj)
+        if not returned.isascii():
+            # orjson can't escape non-ASCII characters
+            return super(OrjsonCodec, self).dumps(obj)
+        return returned.decode("ascii")
+
+    def dumps_pretty(self, obj):
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+        except (TypeError, OverflowError):
+            return super(OrjsonCodec, self).dumps_pretty(obj)
+
+    def loads(self, data):
+        pattern = _WIDE_INTEGER if isinstance(data, str) else _WIDE_INTEGER_BYTES
+        if pattern.search(data) is not None:
+            # orjson decodes integers wider than 64 bits as floats, losing their precision
+            return super(OrjsonCodec, self).loads(data)
+        return orjson.loads(data)
+
+
+class UjsonCodec(JSONCodec):
+    name = "ujson"
+
+    def is_available(self):
+        return ujson is not None
+
+    def dumps(self, obj):
+        try:
+            return ujson.dumps(obj, escape_forward_slashes=False)
+        except (TypeError, OverflowError):
+            return super(UjsonCodec, self).dumps(obj)
+
+    def dumps_pretty(self, obj):
+        try:
+            return ujson.dumps(obj, escape_forward_slashes=False, indent=_PRETTY_INDENT)
+        except (TypeError, OverflowError):
+            return super(UjsonCodec, self).dumps_pretty(obj)
+
+    def loads(self, data):
+        return ujson.loads(data)
+
+
+_CODECS = [OrjsonCodec(), UjsonCodec(), JSONCodec()]
+_resolved_codecs = {}
+
+
+def get_json_codec(name=None):
+    """
+    Returns the codec selected by ``config.root.api.json_codec`` (or by the given name). ``auto`` selects the
+    fastest installed codec. If the selected codec isn't installed, the next available one is used instead
+    """
+    if name is None:
+        name = config.root.api.json_codec
+    returned = _resolved_codecs.get(name)
+    if returned is None:
+        names = [codec.name for codec in _CODECS]
+        if name == _AUTO:
+            candidates = _CODECS
+        elif name in names:
+            candidates = _CODECS[names.index(name) :]
+        else:
+            raise ValueError(
+                "Unknown JSON codec {!r} (should be one of {})".format(
+                    name, ", ".join([_AUTO] + names)
+                )
+            )
+        returned = next(codec for codec in candidates if codec.is_available())
+        if name not in (_AUTO, returned.name):
+            _logger.debug(
+                "JSON codec {} is not installed. Using {} instead", name, returned.name
+            )
+        _resolved_codecs[name] = returned
+    return returned
@@ -0,0 +1,99 @@
+import codecs
+import json
+from numbers import Number
+
+_WHITESPACE = " \t\n\r"
+_COMPACT_THRESHOLD = 65536
+
+
+class _ChunksReader:
+    def __init__(self, chunks):
+        super(_ChunksReader, self).__init__()
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._eof = False
+        self.buffer = ""
+        self.pos = 0
+
+    def read_more(self):
+        """Appends the next chunk to the buffer, returning False if no more data is available"""
+        if self._eof:
+            return False
+        if self.pos > _COMPACT_THRESHOLD:
+            self.buffer = self.buffer[self.pos :]
+            self.pos = 0
+        for chunk in self._chunks:
+            text = self._decoder.decode(chunk)
+            if text:
+                self.buffer += text
+                return True
+        self._eof = True
+        self.buffer += self._decoder.decode(b"", final=True)
+        return False
+
+    def peek(self):
+        """Skips whitespace and returns the next character, or None at the end of the stream"""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.read_more():
+                return None
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise ValueError(
+                "Expected {!r} at position {} of streamed JSON".format(char, self.pos)
+            )
+        self.pos += 1
+
+    def decode_value(self, decoder):
+        self.peek()
+        while True:
+            try:
+                value, end = decoder.raw_decode(self.buffer, self.pos)
+            except ValueError:
+                if not self.read_more():
+                    raise
+                continue
+            # a number at the end of the buffer might continue in the next chunk
+            if (
+                isinstance(value, Number)
+                and end == len(self.buffer)
+                and self.read_more()
+            ):
+                continue
+            self.pos = end
+            return value
+
+
+def iter_list_items(chunks, list_key, other_members):
+    """
+    Incrementally parses a JSON object received as an iterable of byte chunks, yielding the items of the list
+    found under ``list_key`` as soon as each of them is decoded. Other members of the object are stored into the
+    ``other_members`` dictionary
+    """
+    decoder = json.JSONDecoder()
+    reader = _ChunksReader(chunks)
+    reader.expect("{")
+    while reader.peek() != "}":
+        if reader.peek() == ",":
+            reader.pos += 1
+        key = reader.decode_value(decoder)
+        reader.expect(":")
+        if key == list_key and reader.peek() == "[":
+            reader.pos += 1
+            while reader.peek() != "]":
+                if reader.peek() == ",":
+                    reader.pos += 1
+                yield reader.decode_value(decoder)
+            reader.pos += 1
+        else:
+            value = reader.decode_value(decoder)
+            if key == list_key and isinstance(value, list):
+                for item in value:
+                    yield item
+            else:
+                other_members[key] = value
+    reader.pos += 1
@@ -0,0 +1,233 @@
+import collections
+import math
+import re
+import threading
+
+from urlobject import URLObject as URL
+
+_SIGNIFICANT_VALUES = 100  # i.e. 2 significant digits
+_ID_SEGMENT_PATTERN = re.compile(
+    r"^(\d+|[0-9a-fA-F]{8}(-[0-9a-fA-F]{4}){3}-[0-9a-fA-F]{12})$"
+)
+_DEFAULT_PERCENTILES = (50, 95, 99)
+
+
+def get_path_template(path):
+    """
+    Normalizes an API path into a template, by stripping its query and replacing object ids with ``{id}``:
+
+    >>> get_path_template('/api/rest/volumes/1001/luns?page=2')
+    '/api/rest/volumes/{id}/luns'
+    """
+    path = URL(path).path
+    return "/".join(
+        "{id}" if _ID_SEGMENT_PATTERN.match(segment) else segment
+        for segment in path.split("/")
+    )
+
+
+def _get_bucket(micros):
+    unit = 1
+    while micros >= _SIGNIFICANT_VALUES * unit:
+        unit *= 10
+    return (micros // unit) * unit, unit
+
+
+class LatencyHistogram:
+    """
+    A log-linear (HDR-style) histogram of latencies, keeping 2 significant digits of each recorded value
+    """
+
+    def __init__(self):
+        super(LatencyHistogram, self).__init__()
+        self._buckets = collections.Counter()
+        self.count = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    def record(self, seconds):
+        micros = max(int(seconds * 1000000), 0)
+        self._buckets[_get_bucket(micros)[0]] += 1
+        self.count += 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+
+    def get_percentile(self, percentile):
+        """Returns the latency (in seconds) below which the given percentage of requests completed"""
+        if not self.count:
+            return None
+        threshold = max(math.ceil(self.count * percentile / 100.0), 1)
+        seen = 0
+        for lower_bound, count in sorted(dict(self._buckets).items()):
+            seen += count
+            if seen >= threshold:
+                _, unit = _get_bucket(lower_bound)
+                highest_micros = lower_bound + unit - 1
+                return min(highest_micros / 1000000.0, self.max_seconds)
+        return self.max_seconds
+
+    @property
+    def p50(self):
+        return self.get_percentile(50)
+
+    @property
+    def p95(self):
+        return self.get_percentile(95)
+
+    @property
+    def p99(self):
+        return self.get_percentile(99)
+
+
+class EndpointMetrics:
+    """
+    Metrics of the requests sent with a specific HTTP method to a specific path template
+    """
+
+    def __init__(self, method, path_template):
+        super(EndpointMetrics, self).__init__()
+        self.method = method
+        self.path_template = path_template
+        self.count = 0
+        self.errors = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.latency = LatencyHistogram()
+
+    def __repr__(self):
+        return "<{} {}: count={}, errors={}, p50={}, p99={}>".format(
+            self.method,
+            self.path_template,
+            self.count,
+            self.errors,
+            self.latency.p50,
+            self.latency.p99,
+        )
+
+
+class APIMetrics:
+    """
+    Aggregates metrics of the requests sent through an :class:`.API`, grouped by HTTP method and path
+    template:
+
+    >>> for endpoint in system.api.metrics: # doctest: +SKIP
+    ...     print(endpoint.method, endpoint.path_template, endpoint.count, endpoint.latency.p95)
+    """
+
+    def __init__(self):
+        super(APIMetrics, self).__init__()
+        self._lock = threading.Lock()
+        self._endpoints = {}
+
+    def record(
+        self,
+        method,
+        path,
+        elapsed_seconds,
+        status_code=None,
+        bytes_sent=0,
+        bytes_received=0,
+    ):
+        """
+        Records a single request. A missing status code means the request failed to get any response
+        """
+        key = (method.upper(), get_path_template(path))
+        with self._lock:
+            endpoint = self._endpoints.get(key)
+            if endpoint is None:
+                endpoint = self._endpoints[key] = EndpointMetrics(*key)
+            endpoint.count += 1
+            if status_code is None or status_code >= 400:
+                endpoint.errors += 1
+            endpoint.bytes_sent += bytes_sent
+            endpoint.bytes_received += bytes_received
+            endpoint.latency.record(elapsed_seconds)
+
+    def get(self, method, path):
+        """
+        Returns the :class:`.EndpointMetrics` of the given method and path (or path template), or ``None``
+        if no such requests were recorded
+        """
+        return self._endpoints.get((method.upper(), get_path_template(path)))
+
+    def __iter__(self):
+        with self._lock:
+            endpoints = list(self._endpoints.values())
+        return iter(
+            sorted(
+                endpoints,
+                key=lambda endpoint: endpoint.latency.total_seconds,
+                reverse=True,
+            )
+        )
+
+    def reset(self):
+        with self._lock:
+            self._endpoints.clear()
+
+    def to_prometheus_text(self, prefix="infinisdk_api"):
+        """
+        Returns the metrics in the Prometheus text exposition format
+        """
+        endpoints = list(self)
+        lines = []
+
+        def _add_metric(name, metric_type, help_text, get_value):
+            lines.append("# HELP {}_{} {}".format(prefix, name, help_text))
+            lines.append("# TYPE {}_{} {}".format(prefix, name, metric_type))
+            for endpoint in endpoints:
+                lines.append(
+                    "{}_{}{{{}}} {}".format(
+                        prefix, name, _get_labels(endpoint), get_value(endpoint)
+                    )
+                )
+
+        _add_metric(
+            "requests_total",
+            "counter",
+            "Number of API requests sent",
+            lambda e: e.count,
+        )
+        _add_metric(
+            "errors_total",
+            "counter",
+            "Number of failed API requests",
+            lambda e: e.errors,
+        )
+        _add_metric(
+            "sent_bytes_total",
+            "counter",
+            "Number of bytes sent in request bodies",
+            lambda e: e.bytes_sent,
+        )
+        _add_metric(
+            "received_bytes_total",
+            "counter",
+            "Number of bytes received in response bodies",
+            lambda e: e.bytes_received,
+        )
+        name = "{}_request_duration_seconds".format(prefix)
+        lines.append("# HELP {} API request latency".format(name))
+        lines.append("# TYPE {} summary".format(name))
+        for endpoint in endpoints:
+            labels = _get_labels(endpoint)
+            for percentile in _DEFAULT_PERCENTILES:
+                lines.append(
+                    '{}{{{},quantile="{}"}} {}'.format(
+                        name,
+                        labels,
+                        percentile / 100.0,
+                        endpoint.latency.get_percentile(percentile),
+                    )
+                )
+            lines.append(
+                "{}_sum{{{}}} {}".format(name, labels, endpoint.latency.total_seconds)
+            )
+            lines.append(
+                "{}_count{{{}}} {}".format(name, labels, endpoint.latency.count)
+            )
+        return "\n".join(lines) + "\n"
+
+
+def _get_labels(endpoint):
+    return 'method="{}",path="{}"'.format(endpoint.method, endpoint.path_template)
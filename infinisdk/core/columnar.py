@@ -0,0 +1,121 @@
+from .bindings import ListOfRelatedObjectIDsBinding, RelatedObjectBinding
+from .exceptions import InvalidUsageException
+from .translators_and_types import (
+    CapacityTranslator,
+    MillisecondsDatetimeTranslator,
+    SecondsDatetimeTranslator,
+)
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import pandas
+except ImportError:
+    pandas = None
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+_OUTPUT_FORMATS = ("numpy", "pandas", "arrow", "lists")
+
+
+def get_column_dtype(field):
+    """
+    Returns the NumPy dtype used for a column of the given field, or ``None`` for a column of Python objects.
+    Capacities are given as integral numbers of bytes, timestamps as ``datetime64`` values and related objects
+    as their ids
+    """
+    translator = field.type.translator
+    if isinstance(translator, CapacityTranslator):
+        return "int64"
+    if isinstance(translator, MillisecondsDatetimeTranslator):
+        return "datetime64[ms]"
+    if isinstance(translator, SecondsDatetimeTranslator):
+        return "datetime64[s]"
+    if isinstance(field.binding, RelatedObjectBinding) and not isinstance(
+        field.binding, ListOfRelatedObjectIDsBinding
+    ):
+        return "int64"
+    api_type = field.type.api_type
+    if api_type is bool:
+        return "bool"
+    if api_type is int:
+        return "int64"
+    if api_type is float:
+        return "float64"
+    return None
+
+
+def _to_numpy_array(field, values):
+    dtype = get_column_dtype(field)
+    has_missing = any(value is None for value in values)
+    if dtype == "int64" and has_missing:
+        dtype = "float64"  # missing values become NaN
+    elif dtype == "bool" and has_missing:
+        dtype = None
+    if dtype is None:
+        returned = numpy.empty(len(values), dtype=object)
+        for index, value in enumerate(values):
+            returned[index] = value
+        return returned
+    return numpy.array(values, dtype=dtype)
+
+
+def _to_arrow_array(field, values):
+    dtype = get_column_dtype(field)
+    if dtype is not None and dtype.startswith("datetime64"):
+        unit = dtype[len("datetime64[") : -1]
+        return pyarrow.array(values, type=pyarrow.int64()).cast(
+            pyarrow.timestamp(unit, tz="UTC")
+        )
+    arrow_type = {
+        "int64": pyarrow.int64(),
+        "float64": pyarrow.float64(),
+        "bool": pyarrow.bool_(),
+    }.get(dtype)
+    return pyarrow.array(values, type=arrow_type)
+
+
+def _require(module, name):
+    if module is None:
+        raise InvalidUsageException(
+            "{} is required for exporting query results in this format".format(name)
+        )
+
+
+def build_columns(fields, values_by_field, output="numpy"):
+    """
+    Builds typed columns out of lists of raw API values, one list per field. ``output`` is one of
+    ``numpy`` (a dictionary of arrays), ``pandas`` (a ``DataFrame``), ``arrow`` (a ``pyarrow.Table``) or
+    ``lists`` (a dictionary of the raw value lists)
+    """
+    if output not in _OUTPUT_FORMATS:
+        raise ValueError(
+            "Unsupported output format {!r} (should be one of {})".format(
+                output, ", ".join(_OUTPUT_FORMATS)
+            )
+        )
+    if output == "lists":
+        return {field.name: values for field, values in zip(fields, values_by_field)}
+    if output == "arrow":
+        _require(pyarrow, "pyarrow")
+        return pyarrow.table(
+            {
+                field.name: _to_arrow_array(field, values)
+                for field, values in zip(fields, values_by_field)
+            }
+        )
+    _require(numpy, "numpy")
+    arrays = {
+        field.name: _to_numpy_array(field, values)
+        for field, values in zip(fields, values_by_field)
+    }
+    if output == "pandas":
+        _require(pandas, "pandas")
+        return pandas.DataFrame(arrays, columns=[field.name for field in fields])
+    return arrays
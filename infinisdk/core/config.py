@@ -7,10 +7,33 @@ config = confetti.Config(
     dict(
         check_version_compatibility=True,
         ini_file_path="~/.infinidat/infinisdk.ini",
+        persistent_cache=dict(
+            enabled=False,
+            path="~/.infinidat/infinisdk_cache.sqlite3",
+            ttl_seconds=60 * 60,
+        ),
         api={
             "log": {
                 "pretty_json": False,
-            }
+            },
+            "connection_pool": {
+                "pool_connections": 10,
+                "pool_maxsize": 10,
+                "pool_block": False,
+                "max_retries": 0,
+                "tcp_keepalive": False,
+                "tcp_keepalive_idle_seconds": 60,
+                "tcp_keepalive_interval_seconds": 10,
+                "tcp_keepalive_probes": 6,
+            },
+            "json_codec": "auto",
+            "page_size": 1000,
+            "adaptive_paging": {
+                "min_page_size": 50,
+                "max_page_size": 1000,
+                "latency_budget_seconds": 2.0,
+                "max_page_bytes": 8 * 1024 * 1024,
+            },
         },
         defaults=dict(
             system_api_port=80,
@@ -1,9 +1,16 @@
 import collections
+import os
+
+import flux
+from logbook import Logger
 
 from ..core import Field, MillisecondsDatetimeType, SystemObject, TypeBinder
 from ..core.bindings import RelatedObjectBinding
+from ..core.config import config
 from ..core.q import Q
 
+_logger = Logger(__name__)
+
 
 class Events(TypeBinder):
     def __init__(self, system):
@@ -29,6 +36,60 @@ class Events(TypeBinder):
             return events[0]
         return None
 
+    def follow(
+        self,
+        *predicates,
+        since_id=None,
+        poll_interval=1,
+        max_poll_interval=30,
+        cursor_file=None
+    ):
+        """
+        Yields events as they are reported by the system, polling for new events indefinitely:
+
+        >>> for event in system.events.follow(cursor_file='/var/lib/app/events.cursor'): # doctest: +SKIP
+        ...     print(event.get_code())
+
+        :param predicates: filters applied by the system to the polled events (e.g. ``Q.level == 'ERROR'``)
+        :param since_id: only events whose id is greater than this id are yielded. Defaults to the id of the
+          last reported event, i.e. only events reported from now on are yielded
+        :param poll_interval: the time to wait before polling again once no new events are found. The time
+          doubles while no new events arrive, up to ``max_poll_interval``
+        :param cursor_file: a path of a file to keep the id of the last consumed event in. An event is consumed
+          once the next event is requested, so an event whose handling was interrupted is yielded again. If the
+          file exists, following resumes right after the consumed event (overriding ``since_id``)
+        """
+        cursor = load_events_cursor(cursor_file)
+        if cursor is None:
+            cursor = since_id
+        if cursor is None:
+            last_event = self.get_last_event()
+            cursor = 0 if last_event is None else last_event.id
+        page_size = config.root.api.page_size
+        interval = poll_interval
+        try:
+            while True:
+                events = (
+                    self.find(Event.fields.id > cursor, *predicates)
+                    .sort(+Q.id)
+                    .page_size(page_size)
+                    .page(1)
+                    .to_list()
+                )
+                for event in events:
+                    yield event
+                    # the consumer asked for the next event, so it's done with this one
+                    cursor = event.id
+                if events:
+                    _save_events_cursor(cursor_file, cursor)
+                    interval = poll_interval
+                if len(events) < page_size:
+                    flux.current_timeline.sleep(interval)
+                    if not events:
+                        interval = min(interval * 2, max_poll_interval)
+        finally:
+            _save_events_cursor(cursor_file, cursor)
+
     def _get_events_types_from_system(self):
         return self.system.api.get("events/types").get_result()
 
@@ -47,6 +108,30 @@ class Events(TypeBinder):
         return self.get_events_types()["reporters"]
 
 
+def load_events_cursor(path):
+    """
+    Returns the id of the last consumed event saved in the given cursor file by :meth:`.Events.follow`, or
+    ``None`` if there is no such file (or if ``path`` is ``None``)
+    """
+    if path is None or not os.path.exists(path):
+        return None
+    with open(path) as f:
+        contents = f.read().strip()
+    if not contents:
+        return None
+    return int(contents)
+
+
+def _save_events_cursor(path, event_id):
+    if path is None:
+        return
+    tmp_path = "{}.tmp".format(path)
+    with open(tmp_path, "w") as f:
+        f.write("{}\n".format(event_id))
+    os.replace(tmp_path, path)
+    _logger.trace("Saved events cursor {} to {}", event_id, path)
+
+
 class Event(SystemObject):
 
     FIELDS = [
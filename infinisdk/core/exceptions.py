@@ -221,3 +221,47 @@ class MethodDisabled(InfiniSDKException):
     """Thrown when attempting to use an HTTP method, which has been explicitly disabled"""
 
     pass
+
+
+class FleetOperationFailed(InfiniSDKException):
+    """Thrown when an operation run across a fleet of systems fails on some of them"""
+
+    def __init__(self, failures):
+        self.failures = failures
+        msg = "Operation failed on {} system(s): {}".format(
+            len(failures),
+            ", ".join(
+                "{} ({!r})".format(result.system, result.exception)
+                for result in failures
+            ),
+        )
+        super(FleetOperationFailed, self).__init__(msg)
+
+
+class BulkCreationFailed(InfiniSDKException):
+    """Thrown when some of the objects requested through ``create_many`` could not be created"""
+
+    def __init__(self, created, errors, rolled_back=False, rollback_errors=None):
+        #: the objects which were created, in the requested order. When rolling back, only the objects which
+        #: could not be deleted are left
+        self.created = created
+        #: a dictionary mapping the names of the objects which could not be created to the raised exceptions
+        self.errors = errors
+        #: whether all of the created objects were deleted
+        self.rolled_back = rolled_back
+        #: a dictionary mapping the created objects which could not be deleted to the raised exceptions
+        self.rollback_errors = rollback_errors or {}
+        msg = "Failed creating {} object(s){}: {}".format(
+            len(errors),
+            " (rolled back)" if rolled_back else "",
+            ", ".join("{} ({!r})".format(name, exc) for name, exc in errors.items()),
+        )
+        if self.rollback_errors:
+            msg += ". Failed rolling back {} object(s): {}".format(
+                len(self.rollback_errors),
+                ", ".join(
+                    "{} ({!r})".format(obj, exc)
+                    for obj, exc in self.rollback_errors.items()
+                ),
+            )
+        super(BulkCreationFailed, self).__init__(msg)
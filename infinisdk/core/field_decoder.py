@@ -0,0 +1,93 @@
+from datetime import datetime, timedelta
+from functools import lru_cache
+from numbers import Number
+
+import arrow
+from api_object_schema import ObjectAPIBinding
+from api_object_schema.utils import loose_isinstance
+from capacity import Capacity
+
+_MAX_DECODER_PLANS = 4096
+# decoded values of these types can't be changed by whoever reads them, so they can be shared between reads
+_IMMUTABLE_VALUE_TYPES = (
+    str,
+    bytes,
+    Number,
+    Capacity,
+    arrow.Arrow,
+    datetime,
+    timedelta,
+)
+
+
+class DecoderStep:
+    """
+    Decodes a single field out of the raw API representation of an object. Fields whose bindings only translate
+    the raw value (without depending on the system or the object) are decoded by ``decode_api_value``, which is
+    compiled from the binding's translators. Other fields are decoded by their binding
+    """
+
+    __slots__ = ("field_name", "api_name", "field", "decode_api_value")
+
+    def __init__(self, field):
+        super(DecoderStep, self).__init__()
+        self.field_name = field.name
+        self.api_name = field.api_name
+        self.field = field
+        self.decode_api_value = _compile_api_value_decoder(field)
+
+    def decode(self, system, object_type, obj, api_obj):
+        """Returns the value of the field. Raises ``KeyError`` if the field is missing from the API object"""
+        if self.decode_api_value is not None:
+            return self.decode_api_value(api_obj[self.api_name])
+        return self.field.binding.get_value_from_api_object(
+            system, object_type, obj, api_obj
+        )
+
+
+def is_immutable_value(value):
+    return value is None or isinstance(value, _IMMUTABLE_VALUE_TYPES)
+
+
+def _has_default_translation(binding):
+    binding_type = type(binding)
+    return (
+        binding_type.get_value_from_api_object
+        is ObjectAPIBinding.get_value_from_api_object
+        and binding_type.get_value_from_api_value
+        is ObjectAPIBinding.get_value_from_api_value
+        and binding_type._normalize_value  # pylint: disable=protected-access
+        is ObjectAPIBinding._normalize_value  # pylint: disable=protected-access
+    )
+
+
+def _compile_api_value_decoder(field):
+    binding = field.binding
+    if not _has_default_translation(binding):
+        return None
+    translators = tuple(binding.from_api_translators) + (
+        field.type.translator.from_api,
+    )
+    value_type = field.type.type
+
+    def decode_api_value(api_value):
+        value = api_value
+        for translator in translators:
+            value = translator(value)
+        if value is not None and not loose_isinstance(value, value_type):
+            value = value_type(value)
+        return value
+
+    return decode_api_value
+
+
+@lru_cache(maxsize=_MAX_DECODER_PLANS)
+def get_decoder_plan(object_type, field_names):
+    """
+    Returns a tuple of :class:`.DecoderStep`, one per given field name, for decoding fields of the given object
+    type out of its API representation. The most recently used plans are memoized per object type and field names
+    """
+    return tuple(
+        DecoderStep(object_type.fields.get_or_fabricate(field_name))
+        for field_name in field_names
+    )
@@ -0,0 +1,155 @@
+from api_object_schema import ObjectAPIBinding
+from sentinels import NOTHING
+
+from .exceptions import CacheMiss
+
+_record_types_by_object_type = {}
+
+
+class LiteRecord:
+    """
+    A read-only, memory-efficient representation of a system object returned by a lite query. Field values
+    are kept as received from the API in slots, and are only translated when accessed through
+    :meth:`.get_field` or the generated getters (e.g. ``get_name()``)
+    """
+
+    __slots__ = ("_system",)
+
+    #: the type of the objects represented by this record type
+    OBJECT_TYPE = None
+    _SLOT_BY_API_NAME = {}
+    # records are passed to field bindings in place of objects, and never hold prefetched related objects
+    _prefetched_objects = None
+
+    def __init__(self, system, api_obj):
+        object.__setattr__(self, "_system", system)
+        for api_name, slot in self._SLOT_BY_API_NAME.items():
+            object.__setattr__(self, slot, api_obj.get(api_name, NOTHING))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("{} is read-only".format(type(self).__name__))
+
+    def __delattr__(self, name):
+        raise AttributeError("{} is read-only".format(type(self).__name__))
+
+    @property
+    def system(self):
+        return self._system
+
+    @property
+    def id(self):
+        return self.get_field(self.OBJECT_TYPE.UID_FIELD)
+
+    def get_unique_key(self):
+        return (self._system, self.OBJECT_TYPE.get_type_name(), self.id)
+
+    def __eq__(self, other):
+        if not isinstance(other, LiteRecord):
+            return NotImplemented
+        return self.get_unique_key() == other.get_unique_key()
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self.get_unique_key())
+
+    def _get_api_value(self, api_name):
+        return getattr(self, self._SLOT_BY_API_NAME[api_name])
+
+    def get_field(self, field_name, **_):
+        """
+        Returns the value of the given field, as received when the record was fetched. Keyword arguments
+        accepted by :meth:`.SystemObject.get_field` are ignored, since records are never refetched
+        """
+        return self.get_fields([field_name])[field_name]
+
+    def get_fields(self, field_names=(), **_):
+        if not field_names:
+            field_names = [
+                field.name
+                for field in self.OBJECT_TYPE.fields
+                if self._SLOT_BY_API_NAME.get(field.api_name) is not None
+                and self._get_api_value(field.api_name) is not NOTHING
+            ]
+        returned = {}
+        for field_name in field_names:
+            field = self.OBJECT_TYPE.fields.get_or_fabricate(field_name)
+            slot = self._SLOT_BY_API_NAME.get(field.api_name)
+            api_value = NOTHING if slot is None else getattr(self, slot)
+            if api_value is NOTHING:
+                raise CacheMiss(
+                    "Field {!r} was not fetched for {!r}".format(field_name, self)
+                )
+            binding = field.binding
+            if (
+                type(binding).get_value_from_api_object
+                is ObjectAPIBinding.get_value_from_api_object
+            ):
+                value = binding.get_value_from_api_value(
+                    self._system, self.OBJECT_TYPE, self, api_value
+                )
+            else:
+                value = binding.get_value_from_api_object(
+                    self._system, self.OBJECT_TYPE, self, self.to_api_dict()
+                )
+            returned[field_name] = value
+        return returned
+
+    def to_api_dict(self):
+        """Returns the field values of the record, as received from the API"""
+        returned = {}
+        for api_name, slot in self._SLOT_BY_API_NAME.items():
+            value = getattr(self, slot)
+            if value is not NOTHING:
+                returned[api_name] = value
+        return returned
+
+    def to_object(self):
+        """Returns a full system object, whose field cache is initialized with the record's fields"""
+        return self.OBJECT_TYPE.construct(self._system, self.to_api_dict())
+
+    def __repr__(self):
+        return "<{}:{} id={}>".format(
+            self._system, self.OBJECT_TYPE.__name__, self._get_api_value_or_none()
+        )
+
+    def _get_api_value_or_none(self):
+        uid_field = self.OBJECT_TYPE.fields[self.OBJECT_TYPE.UID_FIELD]
+        slot = self._SLOT_BY_API_NAME.get(uid_field.api_name)
+        value = NOTHING if slot is None else getattr(self, slot)
+        return None if value is NOTHING else value
+
+
+def _make_record_getter(field_name, getter_name):
+    def getter(self, **kwargs):
+        return self.get_field(field_name, **kwargs)
+
+    getter.__name__ = getter_name
+    return getter
+
+
+def get_lite_record_type(object_type):
+    """
+    Returns the :class:`.LiteRecord` subclass generated from the fields of the given object type
+    """
+    returned = _record_types_by_object_type.get(object_type)
+    if returned is None:
+        slot_by_api_name = {}
+        for field in object_type.fields:
+            if field.api_name not in slot_by_api_name:
+                slot_by_api_name[field.api_name] = "_v{}".format(len(slot_by_api_name))
+        attributes = {
+            "__slots__": tuple(slot_by_api_name.values()),
+            "OBJECT_TYPE": object_type,
+            "_SLOT_BY_API_NAME": slot_by_api_name,
+        }
+        for field in object_type.fields:
+            if field.getter_name is not None:
+                attributes[field.getter_name] = _make_record_getter(
+                    field.name, field.getter_name
+                )
+        returned = _record_types_by_object_type[object_type] = type(
+            "{}Record".format(object_type.__name__), (LiteRecord,), attributes
+        )
+    return returned
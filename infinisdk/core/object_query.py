@@ -1,17 +1,20 @@
 import itertools
 import random
+import time
+from concurrent.futures import ThreadPoolExecutor
 from numbers import Number
 
 from urlobject import URLObject as URL
 
+from .bindings import RelatedObjectBinding
+from .columnar import build_columns
+from .config import config
 from .exceptions import ChangedDuringIteration, ObjectNotFound
 from .field import Field
 from .field_filter import FieldFilter
+from .lite_record import get_lite_record_type
 from .q import QField
 
-_DEFAULT_SYSTEM_PAGE_SIZE = 50
-_DEFAULT_PAGE_SIZE = 1000
-
 
 class QueryBase:
     def count(self):
@@ -69,6 +72,8 @@ class LazyQuery(QueryBase):
         self._mutable = True
         self._included_fields = None
         self._extra = None
+        self._prefetch_pages = None
+        self._page_sizer = None
 
     def get_extra(self):
         self._fetch()
@@ -106,14 +111,82 @@ class LazyQuery(QueryBase):
         else:
             start = 0
             end = len(self)
+        prefetcher = None
+        if self._prefetch_pages is not None and self._requested_page is None:
+            prefetcher = _PagePrefetcher(self, self._prefetch_pages)
+        try:
+            for i in range(start, end):
+                if prefetcher is not None:
+                    prefetcher.advance(i, end)
+                try:
+                    yield self[i]
+                except IndexError as e:
+                    if i != self._total_num_objects:
+                        raise ChangedDuringIteration(
+                            "Queried path's size changed during iteration"
+                        ) from e
+        finally:
+            if prefetcher is not None:
+                prefetcher.close()
+
+    def __aiter__(self):
+        return self._iter_async()
+
+    async def _iter_async(self):
+        """
+        Iterates the query for systems whose API requests are awaitable (e.g. :class:`.AsyncInfiniBox`)
+        """
+        if self._total_num_objects is None:
+            await self._fetch_async()
+        if self._requested_page is not None:
+            start = (self._requested_page - 1) * self._requested_page_size
+            end = min(start + self._requested_page_size, self._total_num_objects)
+        else:
+            start = 0
+            end = len(self)
         for i in range(start, end):
-            try:
-                yield self[i]
-            except IndexError as e:
-                if i != self._total_num_objects:
-                    raise ChangedDuringIteration(
-                        "Queried path's size changed during iteration"
-                    ) from e
+            if not self._is_fetched(i):
+                await self._fetch_async(i)
+            if not self._is_fetched(i):
+                raise ChangedDuringIteration(
+                    "Queried path's size changed during iteration"
+                )
+            self._translate_item_if_needed(i)
+            yield self._fetched[i]
+
+    def stream(self):
+        """
+        Iterates over the query's objects, decoding each page incrementally while it is being received
+        instead of holding the entire page in memory. Streamed objects are not kept by the query
+        """
+        self._mutable = False
+        for item in self._iter_raw_items(self.query):
+            if self.factory is not None:
+                item = self.factory(self.system, item)
+            yield item
+
+    def _iter_raw_items(self, url):
+        page_size = self._get_page_size()
+        page = self._requested_page or 1
+        while True:
+            query = url.set_query_param("page", str(page)).set_query_param(
+                "page_size", str(page_size)
+            )
+            response = self.system.api.get(query, stream=True)
+            num_items = 0
+            for item in response.iter_result_items():
+                num_items += 1
+                yield item
+            total = response.get_total_num_objects()
+            if self._total_num_objects is None:
+                self._total_num_objects = total
+            if (
+                self._requested_page is not None
+                or num_items < page_size
+                or page * page_size >= total
+            ):
+                break
+            page += 1
 
     def __len__(self):
         if self._total_num_objects is None:
@@ -153,30 +226,47 @@ class LazyQuery(QueryBase):
         assert element_index is not None
         if self._fetched.get(element_index) is None:
             query = self._get_query_for_index(element_index)
+            start_time = time.perf_counter()
             response = self.system.api.get(query)
+            if self._page_sizer is not None:
+                self._page_sizer.record(response, time.perf_counter() - start_time)
+            self._store_response(response)
 
-            if self._total_num_objects is None:
-                self._total_num_objects = response.get_total_num_objects()
-            if self._included_fields is not None:
-                self._extra = response.get_extra()
-            for index, obj in enumerate(
-                response.get_result(), start=response.get_page_start_index()
-            ):
-                if self._fetched.get(index) is None:
-                    self._fetched[index] = obj
+    async def _fetch_async(self, element_index=None):
+        self._mutable = False
+        element_index = self._get_requested_element_index(element_index)
+        if not self._is_fetched(element_index):
+            query = self._get_query_for_index(element_index)
+            self._store_response(await self.system.api.get(query))
 
-    def _get_query_for_index(self, element_index):
-        returned = self.query
+    def _store_response(self, response):
+        if self._total_num_objects is None:
+            self._total_num_objects = response.get_total_num_objects()
+        if self._included_fields is not None:
+            self._extra = response.get_extra()
+        for index, obj in enumerate(
+            response.get_result(), start=response.get_page_start_index()
+        ):
+            if self._fetched.get(index) is None:
+                self._fetched[index] = obj
+
+    def _is_fetched(self, element_index):
+        return self._fetched.get(element_index) is not None
+
+    def _get_page_size(self, element_index=None):
+        if self._requested_page_size is not None:
+            return self._requested_page_size
         if (
-            self._requested_page_size is None
-            and element_index < _DEFAULT_SYSTEM_PAGE_SIZE
+            self._page_sizer is not None
+            and self._prefetch_pages is None
+            and element_index is not None
         ):
-            return returned
-        page_size = (
-            self._requested_page_size
-            if self._requested_page_size is not None
-            else _DEFAULT_PAGE_SIZE
-        )
+            return self._page_sizer.get_page_size(element_index)
+        return config.root.api.page_size
+
+    def _get_query_for_index(self, element_index):
+        returned = self.query
+        page_size = self._get_page_size(element_index)
         page_number = int(element_index // page_size) + 1
         returned = returned.set_query_param("page", str(page_number)).set_query_param(
             "page_size", str(page_size)
@@ -214,6 +304,123 @@ class LazyQuery(QueryBase):
         self._requested_page_size = page_size
         return self
 
+    def prefetch(self, pages):
+        """
+        Fetches up to ``pages`` upcoming pages concurrently while the current page is being
+        consumed. Pages are still yielded in order
+
+        .. note:: Pages are fetched by worker threads, so the system's API must be in thread-safe mode
+          (see :meth:`.API.enable_thread_safety`)
+        """
+        assert pages > 0, "Number of prefetched pages must be positive"
+        assert self._mutable, "Cannot modify query after fetching"
+        assert (
+            self.system.api.is_thread_safe()
+        ), "Prefetching pages requires calling api.enable_thread_safety() first"
+        self._prefetch_pages = pages
+        return self
+
+    def adaptive_page_size(self):
+        """
+        Adapts the size of each fetched page according to the response times and sizes of previous pages,
+        aiming for each page request to complete within ``config.root.api.adaptive_paging.latency_budget_seconds``
+
+        .. note:: Has no effect when a page size is specified explicitly, or when prefetching pages
+        """
+        assert self._mutable, "Cannot modify query after fetching"
+        self._page_sizer = _AdaptivePageSizer()
+        return self
+
+
+class _AdaptivePageSizer:
+    def __init__(self):
+        super(_AdaptivePageSizer, self).__init__()
+        paging_config = config.root.api.adaptive_paging
+        self._min_page_size = paging_config.min_page_size
+        self._max_page_size = paging_config.max_page_size
+        self._latency_budget = paging_config.latency_budget_seconds
+        self._max_page_bytes = paging_config.max_page_bytes
+        self._desired_page_size = min(
+            max(config.root.api.page_size, self._min_page_size), self._max_page_size
+        )
+
+    def record(self, response, elapsed_seconds):
+        num_items = len(response.get_result())
+        if not num_items:
+            return
+        desired = self._latency_budget * num_items / max(elapsed_seconds, 0.001)
+        num_bytes = len(response.response.content)
+        if num_bytes:
+            desired = min(desired, self._max_page_bytes * num_items / num_bytes)
+        # change gradually, to avoid over-reacting to a single slow or fast response
+        desired = min(
+            max(desired, self._desired_page_size / 2), self._desired_page_size * 2
+        )
+        self._desired_page_size = int(
+            min(max(desired, self._min_page_size), self._max_page_size)
+        )
+
+    def get_page_size(self, element_index):
+        # pages are aligned to their size, so the page starting at the given index is fetched as is
+        if element_index % self._min_page_size == 0:
+            candidate = self._desired_page_size - (
+                self._desired_page_size % self._min_page_size
+            )
+            while candidate > self._min_page_size and element_index % candidate:
+                candidate -= self._min_page_size
+            return candidate
+        return self._desired_page_size
+
+
+class _PagePrefetcher:
+    def __init__(self, query, num_pages):
+        super(_PagePrefetcher, self).__init__()
+        self._query = query
+        self._num_pages = num_pages
+        self._page_size = query._get_page_size()  # pylint: disable=protected-access
+        self._executor = ThreadPoolExecutor(
+            max_workers=num_pages, thread_name_prefix="infinisdk-prefetch"
+        )
+        self._pending = {}
+        self._request_context = query.system.api.snapshot_request_context()
+
+    def _fetch_page(self, page_query):
+        api = self._query.system.api
+        with api.applied_request_context(self._request_context):
+            return api.get(page_query)
+
+    def _schedule(self, page):
+        # Pages are keyed by their number rather than by their URL, since the fields fetched for following pages
+        # may change (e.g. by learn_fields()) after a page was scheduled with the fields known at that time
+        if page not in self._pending:
+            # pylint: disable=protected-access
+            page_query = self._query._get_query_for_index(page * self._page_size)
+            self._pending[page] = self._executor.submit(self._fetch_page, page_query)
+
+    def advance(self, element_index, end):
+        # pylint: disable=protected-access
+        query = self._query
+        current_page = element_index // self._page_size
+        if not query._is_fetched(element_index):
+            self._schedule(current_page)
+        elif element_index % self._page_size:
+            return
+        for page in range(current_page + 1, current_page + self._num_pages + 1):
+            page_start = page * self._page_size
+            if page_start >= end:
+                break
+            if not query._is_fetched(page_start):
+                self._schedule(page)
+        future = self._pending.pop(current_page, None)
+        if future is not None:
+            query._store_response(future.result())
+
+    def close(self):
+        for future in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+        self._executor.shutdown(wait=False)
+
 
 class PolymorphicQuery(LazyQuery):
     def __init__(self, system, url, object_types, factory):
@@ -225,6 +432,11 @@ class PolymorphicQuery(LazyQuery):
         assert callable(
             self.factory
         ), "A callable factory must be provided for PolymorphicQuery"
+        self._fields_recorder = None
+        self._learned_api_fields = None
+        self._lite = False
+        self._prefetched_fields = None
+        self._prefetched_objects = None
 
     def _get_or_fabricate_field(self, field_name):
         for obj_type in self.object_types:
@@ -287,14 +499,182 @@ class PolymorphicQuery(LazyQuery):
                 requested_fields.add(object_type.fields[field_name].api_name)
 
         for object_type in self.object_types:
+            supported_field_names = self.system.get_supported_field_names(object_type)
             for field in object_type.fields.get_identity_fields():
-                if field.api_name not in requested_fields:
+                if (
+                    field.api_name not in requested_fields
+                    and field.name in supported_field_names
+                ):
                     requested_fields.add(field.api_name)
             self.query = self.query.set_query_param(
                 "fields", ",".join(requested_fields)
             )
         return self
 
+    def fields_hint(self, *field_names):
+        """
+        Hints which fields of the queried objects are going to be read, so that only those fields are fetched.
+        Fields which weren't hinted are still fetched separately upon access:
+
+        >>> for volume in system.volumes.find().fields_hint('name', 'size'): # doctest: +SKIP
+        ...     print(volume.get_name(), volume.get_size())
+
+        Unlike :meth:`.only_fields`, fields unknown to the queried types are fetched by their given names
+        """
+        assert self._mutable, "Cannot modify query after fetching"
+        query_fields = self.query.query_dict.get("fields", None)
+        requested_fields = set([] if not query_fields else query_fields.split(","))
+        for field_name in field_names:
+            requested_fields.add(self._get_or_fabricate_field(field_name).api_name)
+        for object_type in self.object_types:
+            supported_field_names = self.system.get_supported_field_names(object_type)
+            for field in object_type.fields.get_identity_fields():
+                if field.name in supported_field_names:
+                    requested_fields.add(field.api_name)
+        self.query = self.query.set_query_param(
+            "fields", ",".join(sorted(requested_fields))
+        )
+        return self
+
+    def to_columns(self, field_names, output="numpy"):
+        """
+        Fetches the given fields of all queried objects as typed columns, without constructing an object per
+        row. Capacities are given as integral numbers of bytes, timestamps as ``datetime64`` values, and
+        related objects as their ids:
+
+        >>> df = system.volumes.find().to_columns(['name', 'size', 'created_at'], output='pandas') # doctest: +SKIP
+
+        :param output: one of ``numpy`` (a dictionary of arrays, the default), ``pandas`` (a ``DataFrame``),
+          ``arrow`` (a ``pyarrow.Table``) or ``lists`` (a dictionary of the raw API values)
+        """
+        fields = [
+            self._get_or_fabricate_field(field_name) for field_name in field_names
+        ]
+        api_names = {field.api_name for field in fields}
+        query_fields = self.query.query_dict.get("fields", None)
+        if query_fields:
+            api_names.update(query_fields.split(","))
+        query = self.query.set_query_param("fields", ",".join(sorted(api_names)))
+        values_by_field = [[] for _ in fields]
+        for item in self._iter_raw_items(query):
+            for field, values in zip(fields, values_by_field):
+                values.append(item.get(field.api_name))
+        return build_columns(fields, values_by_field, output)
+
+    def learn_fields(self):
+        """
+        Records which fields are read from the objects of the first fetched page, and plucks only those
+        fields when fetching the following pages. Fields which weren't recorded are still fetched
+        separately upon access
+        """
+        assert self._mutable, "Cannot modify query after fetching"
+        self._fields_recorder = _FieldsRecorder()
+        return self
+
+    def prefetch_related(self, *field_names):
+        """
+        Fetches the objects referred to by the specified related object fields (e.g. ``pool``) along with each
+        fetched page, using a single request per related type. The related objects returned by the queried
+        objects' getters then already hold their fields in cache:
+
+        >>> for volume in system.volumes.find().prefetch_related('pool'): # doctest: +SKIP
+        ...     print(volume.get_pool().get_name(from_cache=True))
+        """
+        assert self._mutable, "Cannot modify query after fetching"
+        for field_name in field_names:
+            field = self._get_or_fabricate_field(field_name)
+            if not isinstance(field.binding, RelatedObjectBinding):
+                raise ValueError(
+                    "Field {!r} does not refer to related objects".format(field_name)
+                )
+        self._prefetched_fields = (self._prefetched_fields or ()) + field_names
+        if self._prefetched_objects is None:
+            self._prefetched_objects = {}
+        return self
+
+    def _store_response(self, response):
+        super(PolymorphicQuery, self)._store_response(response)
+        if self._prefetched_fields:
+            self._prefetch_related_objects(response.get_result())
+
+    def _prefetch_related_objects(self, items):
+        ids_by_collection = {}
+        for field_name in self._prefetched_fields:
+            field = self._get_or_fabricate_field(field_name)
+            collection_name = field.binding.get_related_collection_name()
+            related_ids = ids_by_collection.setdefault(collection_name, {})
+            for item in items:
+                api_value = item.get(field.api_name)
+                for related_id in field.binding.get_related_ids(api_value):
+                    if (collection_name, related_id) not in self._prefetched_objects:
+                        related_ids[related_id] = None
+        for collection_name, related_ids in ids_by_collection.items():
+            if not related_ids:
+                continue
+            binder = getattr(self.system, collection_name)
+            related_objects = [
+                binder.get_by_id_lazy(related_id) for related_id in related_ids
+            ]
+            binder.refresh_fields(related_objects, ())
+            for related_id, related_object in zip(related_ids, related_objects):
+                self._prefetched_objects[(collection_name, related_id)] = related_object
+
+    async def _fetch_async(self, element_index=None):
+        assert (
+            not self._prefetched_fields
+        ), "Related objects cannot be prefetched when iterating asynchronously"
+        await super(PolymorphicQuery, self)._fetch_async(element_index)
+
+    def _translate_item_if_needed(self, item_index):
+        super(PolymorphicQuery, self)._translate_item_if_needed(item_index)
+        if self._lite:
+            return
+        obj = self._fetched.get(item_index)
+        if obj is None:
+            return
+        # pylint: disable=protected-access
+        if self._fields_recorder is not None and self._learned_api_fields is None:
+            obj._fields_recorder = self._fields_recorder
+        if self._prefetched_objects is not None:
+            obj._prefetched_objects = self._prefetched_objects
+
+    def _get_query_for_index(self, element_index):
+        returned = super(PolymorphicQuery, self)._get_query_for_index(element_index)
+        if self._fields_recorder is not None and self._total_num_objects is not None:
+            api_fields = self._get_learned_api_fields()
+            if api_fields:
+                returned = returned.set_query_param("fields", ",".join(api_fields))
+        return returned
+
+    def _get_learned_api_fields(self):
+        if self._learned_api_fields is None:
+            recorder = self._fields_recorder
+            if recorder.all_fields or "fields" in self.query.query_dict:
+                self._learned_api_fields = ()
+            elif recorder.field_names:
+                api_fields = {
+                    self._get_or_fabricate_field(field_name).api_name
+                    for field_name in recorder.field_names
+                }
+                for object_type in self.object_types:
+                    for field in object_type.fields.get_identity_fields():
+                        api_fields.add(field.api_name)
+                self._learned_api_fields = tuple(sorted(api_fields))
+        return self._learned_api_fields
+
+
+class _FieldsRecorder:
+    def __init__(self):
+        super(_FieldsRecorder, self).__init__()
+        self.field_names = set()
+        self.all_fields = False
+
+    def record(self, field_names):
+        if field_names:
+            self.field_names.update(field_names)
+        else:
+            self.all_fields = True
+
 
 class ObjectQuery(PolymorphicQuery):
     def __init__(self, system, url, object_type):
@@ -305,3 +685,19 @@ class ObjectQuery(PolymorphicQuery):
 
     def _get_or_fabricate_field(self, field_name):
         return self.object_type.fields.get_or_fabricate(field_name)
+
+    def lite(self):
+        """
+        Returns read-only :class:`.LiteRecord` objects instead of full system objects. Records keep their
+        fields in slots rather than in a per-object cache, greatly reducing the memory needed for holding
+        many objects. Use ``record.to_object()`` to obtain a full object on demand
+        """
+        assert self._mutable, "Cannot modify query after fetching"
+        assert self._fields_recorder is None, "Cannot learn fields of lite records"
+        self._lite = True
+        self.factory = get_lite_record_type(self.object_type)
+        return self
+
+    def learn_fields(self):
+        assert not self._lite, "Cannot learn fields of lite records"
+        return super(ObjectQuery, self).learn_fields()
@@ -0,0 +1,111 @@
+import json
+import os
+import sqlite3
+import time
+from contextlib import closing
+
+from logbook import Logger
+
+from .config import config
+
+_logger = Logger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT NOT NULL,
+    name TEXT NOT NULL,
+    version TEXT NOT NULL,
+    stored_at REAL NOT NULL,
+    payload TEXT NOT NULL,
+    PRIMARY KEY (key, name)
+)
+"""
+
+
+class PersistentCache:
+    """
+    A SQLite-backed cache of rarely-changing API payloads, shared between processes. Entries expire after
+    ``ttl_seconds``, and are ignored when stored for a different version than the requested one
+    """
+
+    def __init__(self, path, ttl_seconds):
+        super(PersistentCache, self).__init__()
+        self.path = os.path.expanduser(path)
+        self.ttl_seconds = ttl_seconds
+        self._initialized = False
+
+    def _connect(self):
+        if not self._initialized:
+            dirname = os.path.dirname(self.path)
+            if dirname:
+                os.makedirs(dirname, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=5)
+        if not self._initialized:
+            with conn:
+                conn.execute(_SCHEMA)
+            self._initialized = True
+        return conn
+
+    def get(self, key, name, version=""):
+        """
+        Returns the payload stored under the given key and name, or ``None`` if it is missing, expired or
+        stored for a different version
+        """
+        try:
+            with closing(self._connect()) as conn:
+                row = conn.execute(
+                    "SELECT version, stored_at, payload FROM entries WHERE key=? AND name=?",
+                    (key, name),
+                ).fetchone()
+        except (sqlite3.Error, OSError) as e:
+            _logger.debug("Could not read {} from persistent cache: {}", name, e)
+            return None
+        if row is None:
+            return None
+        stored_version, stored_at, payload = row
+        if stored_version != str(version):
+            _logger.debug(
+                "Ignoring {} of {} cached for version {}", name, key, stored_version
+            )
+            return None
+        if time.time() - stored_at > self.ttl_seconds:
+            return None
+        return json.loads(payload)
+
+    def set(self, key, name, payload, version=""):
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+                    (key, name, str(version), time.time(), json.dumps(payload)),
+                )
+        except (sqlite3.Error, OSError) as e:
+            _logger.debug("Could not store {} in persistent cache: {}", name, e)
+
+    def invalidate(self, key=None):
+        """Removes all entries stored under the given key, or the entire cache if no key is given"""
+        with closing(self._connect()) as conn, conn:
+            if key is None:
+                conn.execute("DELETE FROM entries")
+            else:
+                conn.execute("DELETE FROM entries WHERE key=?", (key,))
+
+
+_cache_by_path = {}
+
+
+def get_persistent_cache():
+    """
+    Returns the :class:`.PersistentCache` configured by ``config.root.persistent_cache``, or ``None`` if it is
+    disabled
+    """
+    cache_config = config.root.persistent_cache
+    if not cache_config.enabled:
+        return None
+    returned = _cache_by_path.get(cache_config.path)
+    if returned is None:
+        returned = _cache_by_path[cache_config.path] = PersistentCache(
+            cache_config.path, cache_config.ttl_seconds
+        )
+    returned.ttl_seconds = cache_config.ttl_seconds
+    return returned
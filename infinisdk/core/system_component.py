@@ -1,4 +1,7 @@
-from collections import OrderedDict
+from collections import OrderedDict, defaultdict
+
+from api_object_schema.utils import loose_isinstance
+from sentinels import NOTHING
 
 from .type_binder import TypeBinder
 
@@ -11,6 +14,13 @@ class SystemComponentsBinder(TypeBinder):
     def __init__(self, base_component_type, system):
         super(SystemComponentsBinder, self).__init__(base_component_type, system)
         self._components_by_id = OrderedDict()
+        self._components_by_type = defaultdict(OrderedDict)
+        # (component type, field name) -> field value -> component id -> component
+        self._components_by_field_value = defaultdict(dict)
+        # (component type, field name) -> component id -> component, for components which can't be indexed by
+        # the field (e.g. since the field wasn't fetched yet)
+        self._unindexed_components = defaultdict(OrderedDict)
+        self._indexed_values_by_id = {}
 
     def invalidate_cache(self):
         for component in self._components_by_id.values():
@@ -36,6 +46,78 @@ class SystemComponentsBinder(TypeBinder):
         .. warning:: for internal use only. Don't call this method directly
         """
         self._components_by_id[component.id] = component
+        self._components_by_type[type(component)][component.id] = component
+        self.index_component(component)
+
+    def index_component(self, component):
+        """
+        Updates the indexes of the identity fields of a cached component, used for looking up components by
+        field values without scanning all components
+
+        .. warning:: for internal use only. Don't call this method directly
+        """
+        component_type = type(component)
+        indexed_values = self._indexed_values_by_id.setdefault(component.id, {})
+        for field in component_type.fields:
+            if not field.is_identity or field.name == component_type.UID_FIELD:
+                continue
+            key = (component_type, field.name)
+            try:
+                value = field.binding.get_value_from_api_object(
+                    # pylint: disable=protected-access
+                    component.system,
+                    component_type,
+                    component,
+                    component._cache,
+                )
+                hash(value)
+            except (KeyError, TypeError):
+                value = NOTHING
+            prev_value = indexed_values.get(field.name, NOTHING)
+            if field.name in indexed_values and prev_value == value:
+                continue
+            if prev_value is NOTHING:
+                self._unindexed_components[key].pop(component.id, None)
+            else:
+                self._components_by_field_value[key][prev_value].pop(component.id, None)
+            if value is NOTHING:
+                self._unindexed_components[key][component.id] = component
+            else:
+                self._components_by_field_value[key].setdefault(value, OrderedDict())[
+                    component.id
+                ] = component
+            indexed_values[field.name] = value
+
+    def get_cached_components(self, component_type=None):
+        """
+        Returns the cached components of the given type (or of all types), without fetching anything
+        """
+        if component_type is None or component_type is self.object_type:
+            return list(self._components_by_id.values())
+        return list(self._components_by_type.get(component_type, {}).values())
+
+    def get_cached_components_by_field_value(self, component_type, field_name, value):
+        """
+        Returns the cached components of the given type which may have the given value for the given field, using
+        the indexes of the identity fields. The value is first converted to the field's type, since indexed values
+        are stored that way. Returns ``None`` if the field isn't indexed, or the value can't be converted
+        """
+        if field_name == component_type.UID_FIELD:
+            component = self._components_by_id.get(value)
+            if component is None or type(component) is not component_type:
+                return []
+            return [component]
+        key = (component_type, field_name)
+        field = component_type.fields.get(field_name)
+        if field is None or not field.is_identity:
+            return None
+        try:
+            if value is not None and not loose_isinstance(value, field.type.type):
+                value = field.type.type(value)
+            indexed = self._components_by_field_value[key].get(value, {})
+        except (TypeError, ValueError):
+            return None
+        return list(indexed.values()) + list(self._unindexed_components[key].values())
 
     def get_by_id_lazy(self, id):  # pylint: disable=redefined-builtin
         returned = self.try_get_component_by_id(id)
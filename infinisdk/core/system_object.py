@@ -14,6 +14,7 @@ from .api.special_values import translate_special_values
 from .bindings import PassthroughBinding
 from .exceptions import APICommandFailed, CacheMiss
 from .field import Field
+from .field_decoder import get_decoder_plan, is_immutable_value
 from .system_object_utils import get_data_for_object_creation
 from .type_binder import MonomorphicBinder, TypeBinder
 from .utils import DONT_CARE, add_normalized_query_params, end_reraise_context
@@ -37,12 +38,16 @@ class BaseSystemObject(metaclass=FieldsMeta):
     UID_FIELD = "id"
     #: specifies which :class:`.TypeBinder` subclass is to be used for this type
     BINDER_CLASS = MonomorphicBinder
+    _fields_recorder = None
+    _prefetched_objects = None
 
     def __init__(self, system, initial_data):
         super(BaseSystemObject, self).__init__()
         #: the system to which this object belongs
         self._system = system
         self._cache = initial_data
+        # API name -> (raw value, field, decoded value), for immutable values decoded out of the raw value alone
+        self._decoded_values = {}
         uid_field = self.fields[self.UID_FIELD]
         self._uid = uid_field.binding.get_value_from_api_object(
             system, type(self), self, self._cache
@@ -66,9 +71,12 @@ class BaseSystemObject(metaclass=FieldsMeta):
         """
         if field_names:
             for field_name in field_names:
-                self._cache.pop(self.fields.get_or_fabricate(field_name).api_name, None)
+                api_name = self.fields.get_or_fabricate(field_name).api_name
+                self._cache.pop(api_name, None)
+                self._decoded_values.pop(api_name, None)
         else:
             self._cache.clear()
+            self._decoded_values.clear()
 
     @classmethod
     def is_supported(cls, system):  # pylint: disable=unused-argument
@@ -121,16 +129,25 @@ class BaseSystemObject(metaclass=FieldsMeta):
         return (self.system, type(self).__name__, self.id)
 
     def __deepcopy__(self, memo):
-        return self.construct(self.system, copy.deepcopy(self._cache, memo))
+        return type(self)(self.system, copy.deepcopy(self._cache, memo))
 
     @classmethod
     def construct(cls, system, data):
         """
         Template method to enable customizing the object instantiation process.
 
-        This enables system components to be cached rather than re-fetched every time
+        This enables system components to be cached rather than re-fetched every time. When the system's
+        identity map is enabled, an already existing object with the same unique key is returned instead,
+        with its cache updated from ``data``
         """
-        return cls(system, data)
+        returned = cls(system, data)
+        identity_map = system.get_identity_map()
+        if identity_map is not None:
+            existing = identity_map.setdefault(returned.get_unique_key(), returned)
+            if existing is not returned:
+                existing.update_field_cache(data)
+                returned = existing
+        return returned
 
     @classmethod
     def bind(cls, system):
@@ -199,15 +216,19 @@ class BaseSystemObject(metaclass=FieldsMeta):
         :returns: a dictionary of field names to their values
         """
 
+        if self._fields_recorder is not None:
+            self._fields_recorder.record(field_names)
+
         from_cache = self._deduce_from_cache(field_names, from_cache)
 
         if from_cache:
             if not fetch_if_not_cached:
                 return self._get_fields_from_cache(field_names, raw_value)
+            supported_field_names = self.system.get_supported_field_names(type(self))
             field_names_to_retrieve = field_names or [
                 field.name
                 for field in self.fields
-                if self.system.is_field_supported(field)
+                if field.name in supported_field_names
             ]
             try:
                 return self._get_fields_from_cache(field_names_to_retrieve, raw_value)
@@ -280,20 +301,19 @@ class BaseSystemObject(metaclass=FieldsMeta):
             )
         returned = {}
         missed = []
-        for field_name in field_names:
-            field = self.fields.get_or_fabricate(field_name)
+        for step in get_decoder_plan(type(self), tuple(field_names)):
             try:
                 if raw_value:
-                    value = self._cache[field.api_name]
+                    value = self._cache[step.api_name]
+                elif step.decode_api_value is not None:
+                    value = self._get_decoded_value(step)
                 else:
-                    value = field.binding.get_value_from_api_object(
-                        self.system, type(self), self, self._cache
-                    )
+                    value = step.decode(self.system, type(self), self, self._cache)
             except KeyError:
-                if self.system.is_field_supported(field):
-                    missed.append(field_name)
+                if self.system.is_field_supported(step.field):
+                    missed.append(step.field_name)
             else:
-                returned[field_name] = value
+                returned[step.field_name] = value
         if missed:
             raise CacheMiss(
                 "The following fields could not be obtained from cache: {}".format(
@@ -303,6 +323,18 @@ class BaseSystemObject(metaclass=FieldsMeta):
 
         return returned
 
+    def _get_decoded_value(self, step):
+        api_value = self._cache[step.api_name]
+        decoded = self._decoded_values.get(step.api_name)
+        if decoded is not None and decoded[0] is api_value and decoded[1] is step.field:
+            return decoded[2]
+        value = step.decode_api_value(api_value)
+        if is_immutable_value(value):
+            # mutable values (e.g. dictionaries) are decoded again on each read, so callers changing them don't
+            # affect later reads
+            self._decoded_values[step.api_name] = (api_value, step.field, value)
+        return value
+
     def is_field_supported(self, field_name):
         field = self.fields.get_or_fabricate(field_name)
         return self.system.is_field_supported(field)
@@ -310,6 +342,9 @@ class BaseSystemObject(metaclass=FieldsMeta):
     def update_field_cache(self, api_obj):
         assert all(isinstance(key, (str, bytes)) for key in api_obj.keys())
         self._cache.update(api_obj)
+        if self._decoded_values:
+            for api_name in api_obj:
+                self._decoded_values.pop(api_name, None)
 
     def update_field(self, field_name, field_value):
         """
@@ -432,6 +467,9 @@ class SystemObject(BaseSystemObject):
         try:
             returned = system.api.post(url, data=data).get_result()
             obj = cls(system, returned)
+            identity_map = system.get_identity_map()
+            if identity_map is not None:
+                identity_map[obj.get_unique_key()] = obj
         except Exception as e:  # pylint: disable=broad-except
             with end_reraise_context():
                 gossip.trigger_with_tags(
@@ -531,6 +569,11 @@ class SystemObject(BaseSystemObject):
         try:
             resp = self.system.api.delete(url)
             self._use_cache_by_default = True
+            identity_map = self.system.get_identity_map()
+            if identity_map is not None:
+                key = self.get_unique_key()
+                if identity_map.get(key) is self:
+                    del identity_map[key]
         except Exception as e:  # pylint: disable=broad-except
             with end_reraise_context():
                 gossip.trigger_with_tags(
@@ -90,6 +90,7 @@ def get_data_for_object_creation(object_type, system, fields):
     returned = {}
     missing_fields = set()
     extra_fields = fields.copy()
+    supported_field_names = system.get_supported_field_names(object_type)
     for field in object_type.fields:
         if field.name not in fields:
             if not field.creation_parameter or field.optional:
@@ -110,7 +111,7 @@ def get_data_for_object_creation(object_type, system, fields):
         if (
             field_value is NOTHING
             and field_api_value is NOTHING
-            and system.is_field_supported(field)
+            and field.name in supported_field_names
         ):
             missing_fields.add(field.name)
         if field_value is not NOTHING:
@@ -1,5 +1,6 @@
 import random
 from contextlib import contextmanager
+from urllib.parse import quote
 
 from sentinels import NOTHING
 from urlobject import URLObject
@@ -7,6 +8,10 @@ from urlobject import URLObject
 from .exceptions import InfiniSDKRuntimeException, ObjectNotFound, TooManyObjectsFound
 from .object_query import ObjectQuery, PolymorphicQuery
 
+_MAX_REFRESH_URL_LENGTH = 2000
+_MAX_REFRESH_CHUNK_SIZE = 1000
+_QUOTED_COMMA_LENGTH = len(quote(",", safe=""))
+
 
 class BaseBinder:
     """
@@ -215,6 +220,66 @@ class MonomorphicBinder(BaseBinder):  # pylint: disable=abstract-method
         query = ObjectQuery(self.system, self.get_url_path(), self.object_type)
         return query.extend_url(*predicates, **kw)
 
+    def refresh_fields(self, objs, field_names):
+        """
+        Fetches the specified fields for many objects of this type using as few requests as possible,
+        and updates the objects' field caches with the returned values::
+
+            system.volumes.refresh_fields(volumes, ["size", "used"])
+            sizes = [v.get_size(from_cache=True) for v in volumes]
+
+        Objects are grouped into filtered queries by their ids, and the groups are kept small enough for
+        the request URLs not to grow too long. If no field names are given, all fields are fetched
+        """
+        assert isinstance(
+            field_names, (list, tuple)
+        ), "field_names must be either a list or a tuple"
+        uid_field = self.fields[self.object_type.UID_FIELD]
+        base_url = self.get_url_path()
+        if field_names:
+            api_field_names = {uid_field.api_name}
+            for field_name in field_names:
+                api_field_names.add(self.fields.get_or_fabricate(field_name).api_name)
+            base_url = base_url.set_query_param(
+                "fields", ",".join(sorted(api_field_names))
+            )
+
+        objs_by_api_id = {}
+        for obj in objs:
+            api_id = uid_field.binding.get_api_value_from_value(
+                self.system, self.object_type, obj, obj.id
+            )
+            objs_by_api_id.setdefault(str(api_id), []).append(obj)
+
+        for chunk in self._iter_refresh_chunks(base_url, uid_field, objs_by_api_id):
+            url = uid_field.in_(chunk).add_to_url(base_url, self.system)
+            url = url.set_query_params(page=1, page_size=len(chunk))
+            for api_obj in self.system.api.get(url).get_result():
+                for obj in objs_by_api_id.get(str(api_obj[uid_field.api_name]), ()):
+                    obj.update_field_cache(api_obj)
+
+    def _iter_refresh_chunks(self, base_url, uid_field, api_ids):
+        empty_filter_url = uid_field.in_(()).add_to_url(base_url, self.system)
+        longest_page_url = empty_filter_url.set_query_params(
+            page=1, page_size=_MAX_REFRESH_CHUNK_SIZE
+        )
+        base_length = self.system.api.get_max_request_url_length(longest_page_url)
+        chunk = []
+        chunk_length = base_length
+        for api_id in api_ids:
+            id_length = len(quote(api_id, safe="")) + _QUOTED_COMMA_LENGTH
+            if chunk and (
+                chunk_length + id_length > _MAX_REFRESH_URL_LENGTH
+                or len(chunk) >= _MAX_REFRESH_CHUNK_SIZE
+            ):
+                yield chunk
+                chunk = []
+                chunk_length = base_length
+            chunk.append(api_id)
+            chunk_length += id_length
+        if chunk:
+            yield chunk
+
     @contextmanager
     def fetch_once_context(self):
         original_cache = self._cache
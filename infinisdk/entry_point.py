@@ -1,3 +1,4 @@
+import itertools
 import sys
 
 import arrow
@@ -9,6 +10,7 @@ import pkg_resources
 
 from infinisdk import Q
 from infinisdk.core.config import config
+from infinisdk.core.events import load_events_cursor
 from infinisdk.infinibox import InfiniBox
 
 _logger = logbook.Logger("sdk-cli")
@@ -121,29 +123,10 @@ def events_query(
     sorting_order,
 ):
     tzinfo = "local" if display_in_local_time else "utc"
-    if enable_color is None:
-        enable_color = sys.stdout.isatty()
-    if enable_color:
-        colorize = {
-            "WARNING": "yellow",
-            "ERROR": "red",
-            "CRITICAL": "red",
-            "INFO": "green",
-        }.get
-    else:
-        colorize = lambda _: None
+    colorize = _get_level_colorizer(enable_color)
     system = _get_system_object(system_name, should_login=True)
     system.login()
-    filters = []
-    if min_level:
-        supported_levels = system.events.get_levels()
-        try:
-            min_index = supported_levels.index(min_level)
-        except ValueError as e:
-            raise click.ClickException(
-                "Unsupported level {!r}".format(min_level)
-            ) from e
-        filters.append(Q.level.in_(supported_levels[min_index:]))
+    filters = _get_level_filters(system, min_level)
     if since is not None:
         filters.append(Q.timestamp > _convert_time_string_to_arrow(since, tzinfo))
     if until is not None:
@@ -152,26 +135,139 @@ def events_query(
     if sorting_order is not None:
         query = query.sort(+Q.id if sorting_order else -Q.id)
     for event in query:
-        event_info = event.get_fields(from_cache=True)
-        event_time = event_info["timestamp"]
-        if display_in_local_time:
-            event_time = event_time.to("local")
-        formatted = "{} {:5}".format(event_time.format(TIME_TEMPLATE), event_info["id"])
-        if show_reporter:
-            formatted += " {:10}".format(event_info["reporter"])
-        if show_visibility:
-            formatted += " {:9}".format(event["visibility"])
-        if show_source_node_id:
-            formatted += " node-{}".format(event["source_node_id"])
-        click.echo(formatted + " ", nl=False)
-        level = event_info["level"]
-        click.echo(click.style(level, fg=colorize(level)), nl=False)
-        click.echo(
-            " {code} {desc}".format(
-                code=event_info["code"],
-                desc=event_info["description"].replace("\n", " "),
-            )
+        _echo_event(
+            event,
+            colorize,
+            display_in_local_time,
+            show_reporter,
+            show_visibility,
+            show_source_node_id,
+        )
+
+
+@events.command(name="tail")
+@click.option("-s", "--system-name", required=True)
+@click.option("-n", "--lines", "num_events", type=int, default=10)
+@click.option("-f", "--follow", is_flag=True, default=False)
+@click.option("--poll-interval", type=float, default=1)
+@click.option("--cursor-file", type=click.Path(dir_okay=False), default=None)
+@click.option("--show-reporter/--hide-reporter", default=False, is_flag=True)
+@click.option("--show-visibility/--hide-visibility", default=False, is_flag=True)
+@click.option(
+    "--show-source-node-id/--hide-source-node-id", default=False, is_flag=True
+)
+@click.option("--force-color/--no-color", "enable_color", default=None, is_flag=True)
+@click.option(
+    "--local-time/--utc-time", "display_in_local_time", default=True, is_flag=True
+)
+@click.option("-l", "--level", "min_level", default=None)
+def events_tail(
+    system_name,
+    num_events,
+    follow,
+    poll_interval,
+    cursor_file,
+    show_reporter,
+    show_visibility,
+    show_source_node_id,
+    display_in_local_time,
+    enable_color,
+    min_level,
+):
+    colorize = _get_level_colorizer(enable_color)
+    system = _get_system_object(system_name, should_login=True)
+    filters = _get_level_filters(system, min_level)
+    resumed = follow and load_events_cursor(cursor_file) is not None
+    last_events = []
+    if num_events and not resumed:
+        last_events = (
+            system.events.find(*filters)
+            .sort(-Q.id)
+            .page_size(num_events)
+            .page(1)
+            .to_list()
+        )
+        last_events.reverse()
+    events_to_echo = last_events
+    if follow:
+        # when resuming from the cursor file, following starts strictly after the saved cursor
+        since_id = last_events[-1].id if last_events else None
+        events_to_echo = itertools.chain(
+            last_events,
+            system.events.follow(
+                *filters,
+                since_id=since_id,
+                poll_interval=poll_interval,
+                cursor_file=cursor_file
+            ),
+        )
+    for event in events_to_echo:
+        _echo_event(
+            event,
+            colorize,
+            display_in_local_time,
+            show_reporter,
+            show_visibility,
+            show_source_node_id,
+        )
+
+
+def _get_level_colorizer(enable_color):
+    if enable_color is None:
+        enable_color = sys.stdout.isatty()
+    if enable_color:
+        return {
+            "WARNING": "yellow",
+            "ERROR": "red",
+            "CRITICAL": "red",
+            "INFO": "green",
+        }.get
+    return lambda _: None
+
+
+def _get_levels_from(system, min_level):
+    supported_levels = system.events.get_levels()
+    try:
+        min_index = supported_levels.index(min_level)
+    except ValueError as e:
+        raise click.ClickException("Unsupported level {!r}".format(min_level)) from e
+    return supported_levels[min_index:]
+
+
+def _get_level_filters(system, min_level):
+    if not min_level:
+        return []
+    return [Q.level.in_(_get_levels_from(system, min_level))]
+
+
+def _echo_event(
+    event,
+    colorize,
+    display_in_local_time,
+    show_reporter,
+    show_visibility,
+    show_source_node_id,
+):
+    event_info = event.get_fields(from_cache=True)
+    event_time = event_info["timestamp"]
+    if display_in_local_time:
+        event_time = event_time.to("local")
+    formatted = "{} {:5}".format(event_time.format(TIME_TEMPLATE), event_info["id"])
+    if show_reporter:
+        formatted += " {:10}".format(event_info["reporter"])
+    if show_visibility:
+        formatted += " {:9}".format(event["visibility"])
+    if show_source_node_id:
+        formatted += " node-{}".format(event["source_node_id"])
+    click.echo(formatted + " ", nl=False)
+    level = event_info["level"]
+    click.echo(click.style(level, fg=colorize(level)), nl=False)
+    click.echo(
+        " {code} {desc}".format(
+            code=event_info["code"],
+            desc=event_info["description"].replace("\n", " "),
         )
+    )
 
 
 def main_entry_point():
@@ -1 +1,3 @@
+from .async_infinibox import AsyncInfiniBox
+from .fleet import InfiniBoxFleet
 from .infinibox import InfiniBox
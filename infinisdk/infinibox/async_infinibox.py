@@ -0,0 +1,77 @@
+import gossip
+
+from ..core.api.async_api import AsyncAPI
+from .infinibox import InfiniBox
+
+
+class AsyncInfiniBox(InfiniBox):
+    """
+    An :class:`.InfiniBox` variant whose API requests are awaitable, allowing a single event loop to drive
+    many systems concurrently:
+
+    >>> async with AsyncInfiniBox(address, auth=auth) as system: # doctest: +SKIP
+    ...     await system.login()
+    ...     async for volume in system.volumes.find(): # doctest: +SKIP
+    ...         print(volume.get_name(from_cache=True))
+
+    .. note:: Objects returned from queries only hold the fields fetched along with them. Fetching fields
+      which are not cached requires awaiting ``system.api`` requests directly
+    """
+
+    API_CLASS = AsyncAPI
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_):
+        await self.close()
+
+    async def close(self):
+        await self.api.close()
+
+    async def initialize_compat(self):
+        if not self.compat.is_initialized():
+            resp = await self.api.get(
+                "_features", assert_success=False, check_version=False
+            )
+            # pylint: disable=protected-access
+            self.compat._load_features_from_response(resp)
+
+    async def refresh_system_info(self, **kwargs):
+        system_component = self.components.system_component
+        resp = await self.api.get(system_component.get_this_url_path(), **kwargs)
+        system_component.update_field_cache(resp.get_result())
+
+    async def check_version(self, use_basic_auth=False):
+        await self.refresh_system_info(
+            check_version=False, use_basic_auth=use_basic_auth
+        )
+        super(AsyncInfiniBox, self).check_version()
+
+    async def _after_login(self):
+        await self.refresh_system_info()
+
+        gossip.trigger("infinidat.sdk.after_login", system=self)
+
+    async def login(self):
+        """
+        Verifies the current user against the system
+        """
+        await self.initialize_compat()
+        username, password = self.api.get_auth()
+        login_data = {"username": username, "password": password}
+        if self.compat.has_auth_sessions():
+            login_data["clientid"] = self._get_client_id()
+        res = await self.api.post("users/login", data=login_data)
+        self.api.mark_logged_in()
+        await self._after_login()
+        return res
+
+    async def logout(self):
+        """
+        Logs out the current user
+        """
+        returned = await self.api.post("users/logout", data={})
+        self.api.mark_not_logged_in()
+        self.api.clear_cookies()
+        return returned
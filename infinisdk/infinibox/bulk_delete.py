@@ -0,0 +1,135 @@
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from logbook import Logger
+
+_logger = Logger(__name__)
+
+_PREFETCHED_FIELD_NAMES = ("parent", "mapped")
+
+
+class DeletionResult:
+    """
+    The outcome of deleting a single object through :meth:`.InfiniBox.delete_many`
+    """
+
+    def __init__(self, obj):
+        super(DeletionResult, self).__init__()
+        self.obj = obj
+        #: the exception raised when deleting the object, if any
+        self.exception = None
+        #: whether the object wasn't deleted, since deleting an object it depends on failed
+        self.skipped = False
+
+    @property
+    def succeeded(self):
+        return self.exception is None and not self.skipped
+
+    def __repr__(self):
+        if self.skipped:
+            status = "skipped"
+        elif self.exception is not None:
+            status = "failed ({!r})".format(self.exception)
+        else:
+            status = "deleted"
+        return "<{}: {}>".format(self.obj, status)
+
+
+def _prefetch_dependency_fields(system, objs):
+    objs_by_binder = {}
+    for obj in objs:
+        objs_by_binder.setdefault(obj.get_binder(), []).append(obj)
+    for binder, binder_objs in objs_by_binder.items():
+        field_names = [
+            field_name
+            for field_name in _PREFETCHED_FIELD_NAMES
+            if binder.fields.get(field_name) is not None
+            and system.is_field_supported(binder.fields.get(field_name))
+        ]
+        if field_names:
+            binder.refresh_fields(binder_objs, field_names)
+
+
+def _is_mapped_volume(obj):
+    return (
+        hasattr(obj, "unmap")
+        and obj.fields.get("mapped") is not None
+        and obj.get_field("mapped", from_cache=True)
+    )
+
+
+def get_deletion_dependencies(system, objs):
+    """
+    Returns a dictionary mapping each of the given objects to the objects among them which must be deleted
+    before it: children (snapshots and clones) are deleted before their parents, and mapped volumes (which are
+    unmapped first) before hosts and clusters
+    """
+    _prefetch_dependency_fields(system, objs)
+    mapping_types = (system.hosts.object_type, system.host_clusters.object_type)
+    mapped_volumes = [obj for obj in objs if _is_mapped_volume(obj)]
+    returned = {obj: set() for obj in objs}
+    for obj in objs:
+        if obj.fields.get("parent") is not None:
+            parent = obj.get_field("parent", from_cache=True)
+            if parent is not None and parent in returned:
+                returned[parent].add(obj)
+        if isinstance(obj, mapping_types):
+            returned[obj].update(mapped_volumes)
+    return returned
+
+
+def delete_many(system, objs, parallelism=1):
+    """
+    Deletes the given objects, in an order satisfying :func:`.get_deletion_dependencies`. Objects which don't
+    depend on each other are deleted concurrently, by up to ``parallelism`` threads. Returns a list of
+    :class:`.DeletionResult`, ordered like the given objects
+    """
+    objs = list(objs)
+    results = {obj: DeletionResult(obj) for obj in objs}
+    blockers = get_deletion_dependencies(system, objs)
+    dependents = {obj: set() for obj in objs}
+    for obj, obj_blockers in blockers.items():
+        for blocker in obj_blockers:
+            dependents[blocker].add(obj)
+    api = system.api
+    snapshot = api.snapshot_request_context()
+
+    def _delete(obj):
+        with api.applied_request_context(snapshot):
+            if _is_mapped_volume(obj):
+                obj.unmap()
+            obj.delete()
+
+    def _skip_dependents(obj):
+        for dependent in dependents[obj]:
+            result = results[dependent]
+            if not result.skipped:
+                _logger.debug(
+                    "Skipping deletion of {}, depending on {}", dependent, obj
+                )
+                result.skipped = True
+                _skip_dependents(dependent)
+
+    ready = [obj for obj in objs if not blockers[obj]]
+    with ThreadPoolExecutor(max_workers=parallelism) as executor:
+        running = {}
+        while ready or running:
+            for obj in ready:
+                if not results[obj].skipped:
+                    running[executor.submit(_delete, obj)] = obj
+            ready = []
+            if not running:
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                obj = running.pop(future)
+                exception = future.exception()
+                if exception is not None:
+                    _logger.debug("Failed deleting {}: {!r}", obj, exception)
+                    results[obj].exception = exception
+                    _skip_dependents(obj)
+                    continue
+                for dependent in dependents[obj]:
+                    blockers[dependent].discard(obj)
+                    if not blockers[dependent]:
+                        ready.append(dependent)
+    return [results[obj] for obj in objs]
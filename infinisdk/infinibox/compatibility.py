@@ -24,17 +24,24 @@ class Compatibility:
     def __init__(self, system):
         self.system = system
         self._features = None
+        self._initializing = False
         self._system_version = None
+        self._field_support = {}
+        self._supported_field_names_by_type = {}
 
     def invalidate_cache(self):
         self._features = None
         self._system_version = None
+        self._field_support = {}
+        self._supported_field_names_by_type = {}
 
     def is_initialized(self):
         return self._features is not None
 
     def initialize(self):
-        if not self.is_initialized():
+        # Requests sent while initializing (e.g. by the persistent cache, to check the system's version) should
+        # not attempt to initialize again
+        if not self.is_initialized() and not self._initializing:
             self._init_features()
 
     def can_run_on_system(self):
@@ -58,6 +65,46 @@ class Compatibility:
             return True
         return getattr(self, "has_{}".format(feature_name))()
 
+    def is_field_supported(self, field):
+        if (
+            not field.new_to_version
+            and not field.until_version
+            and field.feature_name is NOTHING
+        ):
+            return True
+        returned = self._field_support.get(field)
+        if returned is None:
+            returned = self._field_support[field] = self._check_field_support(field)
+        return returned
+
+    def _check_field_support(self, field):
+        if (
+            field.new_to_version
+            and self.get_parsed_system_version() < field.new_to_version
+        ):
+            return False
+        if (
+            field.until_version
+            and self.get_parsed_system_version() > field.until_version
+        ):
+            return False
+        return self.is_feature_supported(field.feature_name)
+
+    def get_supported_field_names(self, object_type):
+        """
+        Returns a frozen set of the names of the fields of the given object type which are supported by the
+        system. The sets are computed once, until the cache is invalidated
+        """
+        returned = self._supported_field_names_by_type.get(object_type)
+        if returned is None:
+            returned = frozenset(
+                field.name
+                for field in object_type.fields
+                if self.is_field_supported(field)
+            )
+            self._supported_field_names_by_type[object_type] = returned
+        return returned
+
     def normalize_version_string(self, version):
         return InfiniboxVersion.parse(version)
 
@@ -76,12 +123,27 @@ class Compatibility:
         return float(".".join(str(num) for num in version_tuple))
 
     def _init_features(self):
-        resp = self.system.api.get("_features", assert_success=False)
+        self._initializing = True
+        try:
+            features_list = self.system.persistent_cache.get("features")
+        finally:
+            self._initializing = False
+        if features_list is None:
+            resp = self.system.api.get("_features", assert_success=False)
+            features_list = self._get_features_list_from_response(resp)
+            self.system.persistent_cache.set("features", features_list)
+        self._load_features(features_list)
+
+    def _get_features_list_from_response(self, resp):
         if resp.response.status_code == httplib.NOT_FOUND:
-            features_list = []  # Backwards compatible
-        else:
-            resp.assert_success()
-            features_list = resp.get_result()
+            return []  # Backwards compatible
+        resp.assert_success()
+        return resp.get_result()
+
+    def _load_features_from_response(self, resp):
+        self._load_features(self._get_features_list_from_response(resp))
+
+    def _load_features(self, features_list):
         self._features = dict(
             (
                 feature_info["name"],
@@ -81,10 +81,10 @@ class InfiniBoxComponentQuery(ComponentQueryBase):
             with self._get_binder().fetch_tree_once_context(
                 force_fetch=self._force_fetch, with_logging=False
             ):
-                # pylint: disable=protected-access
-                all_components = self.system.components._components_by_id.values()
                 returned = [
-                    item for item in all_components if self.passed_filtering(item)
+                    item
+                    for item in self._get_candidates()
+                    if self.passed_filtering(item)
                 ]
 
             if self.sort_criteria:
@@ -92,6 +92,29 @@ class InfiniBoxComponentQuery(ComponentQueryBase):
             self._fetched_items = returned
         return returned
 
+    def _get_candidates(self):
+        components = self.system.components
+        if self.object_type == components.object_type:
+            return components.get_cached_components()
+        equalities = [
+            (predicate.field.name, predicate.value)
+            for predicate in self.predicates
+            if predicate.operator_name == "eq"
+        ]
+        equalities.extend(self.kw.items())
+        returned = None
+        for field_name, value in equalities:
+            indexed = components.get_cached_components_by_field_value(
+                self.object_type, field_name, value
+            )
+            if indexed is not None and (
+                returned is None or len(indexed) < len(returned)
+            ):
+                returned = indexed
+        if returned is None:
+            returned = components.get_cached_components(self.object_type)
+        return returned
+
     def _get_binder(self):
         if self.object_type.get_type_name() == "infiniboxsystemcomponent":
             return self.system.components.enclosures
@@ -1,11 +1,12 @@
 import copy
 import functools
 import uuid
-from collections import defaultdict
+from collections import defaultdict, namedtuple
 from contextlib import ExitStack, contextmanager
 
 from logbook import Logger
 from mitba import cached_method
+from sentinels import NOTHING
 from urlobject import URLObject as URL
 from vintage import deprecated, warn_deprecation
 
@@ -29,6 +30,13 @@ _UID_DEPRECATION_MSG = (
     "Direct usage of the 'id' field is deprecated. Use 'uid' field instead"
 )
 
+#: A change detected by :meth:`.InfiniBoxSystemComponents.refresh_changed`. ``field_name`` is ``None`` for
+#: components which were not known before the refresh. Values are given as returned by the API, except for
+#: sub-component fields, whose values are the indexes of the sub-components
+ComponentChange = namedtuple(
+    "ComponentChange", ["component", "field_name", "old_value", "new_value"]
+)
+
 
 def _normalize_id_predicate(predicate, component_type):
     if predicate.field.name == "id" and isinstance(predicate.value, str):
@@ -60,6 +68,7 @@ class InfiniBoxSystemComponents(SystemComponentsBinder):
         self._fetched_external_clusters = False
         self._deps_by_components_tree = defaultdict(set)
         self._initialization_uuid = uuid.uuid4()
+        self._recorded_changes = None
 
     def invalidate_cache(self):
         super(InfiniBoxSystemComponents, self).invalidate_cache()
@@ -99,6 +108,46 @@ class InfiniBoxSystemComponents(SystemComponentsBinder):
     def get_rack_1(self):
         return self._rack_1
 
+    def is_recording_changes(self):
+        return self._recorded_changes is not None
+
+    def record_change(self, component, field_name, old_value, new_value):
+        """
+        .. warning:: for internal use only. Don't call this method directly
+        """
+        self._recorded_changes.append(
+            ComponentChange(component, field_name, old_value, new_value)
+        )
+
+    def refresh_changed(self, with_enclosures=True):
+        """
+        Fetches the component tree of the system, only updating the cached fields which changed since the tree
+        was last fetched. Returns a list of :class:`.ComponentChange` describing the changes.
+
+        :param with_enclosures: pass ``False`` to skip the enclosures and drives, like
+          :meth:`.Rack.refresh_without_enclosures`
+        """
+        rack_1 = self.get_rack_1()
+        url = rack_1.get_this_url_path()
+        if not with_enclosures:
+            url = url.add_query_param("fields", rack_1.get_fields_without_enclosures())
+        data = self.system.api.get(url).get_result()
+        if with_enclosures:
+            self.mark_fetched_all()
+        else:
+            self.mark_fetched_nodes()
+        self._recorded_changes = returned = []
+        try:
+            rack_1.construct(
+                self.system,
+                data,
+                rack_1.get_parent_id(),
+                allow_partial_fields=not with_enclosures,
+            )
+        finally:
+            self._recorded_changes = None
+        return returned
+
     def find(self, *predicates, **kw):
         component_name = kw.pop("component_type", None)
         if component_name is None:
@@ -294,11 +343,21 @@ class InfiniBoxSystemComponent(BaseSystemObject):
             super(InfiniBoxSystemComponent, self).invalidate_cache(
                 *field_names_to_invalidate
             )
+            self._reindex()
         else:
             assert not field_names, "Cannot invalidate only these fields: {}".format(
                 ", ".join(non_invalidated_fields)
             )
 
+    def update_field_cache(self, api_obj):
+        super(InfiniBoxSystemComponent, self).update_field_cache(api_obj)
+        self._reindex()
+
+    def _reindex(self):
+        components = self.system.components
+        if components.try_get_component_by_id(self.id) is self:
+            components.index_component(self)
+
     def _deduce_from_cache(self, field_names, from_cache):
         collection = self.system.components[self.get_plural_name()]
         if collection.should_force_fetching_from_cache():
@@ -345,6 +404,48 @@ class InfiniBoxSystemComponent(BaseSystemObject):
         data = self.system.api.get(self.get_this_url_path()).get_result()
         self.construct(self.system, data, self.get_parent_id())
 
+    def _update_changed_fields(self, data):
+        sub_component_fields = {
+            field.api_name: field
+            for field in self._iter_sub_component_fields(self.system)
+        }
+        changed = {}
+        for api_name, new_value in data.items():
+            old_value = self._cache.get(api_name, NOTHING)
+            sub_component_field = sub_component_fields.get(api_name)
+            if sub_component_field is not None:
+                # sub-components are diffed on their own, so only report added or removed ones
+                changed[api_name] = new_value
+                old_indexes = self._get_sub_component_indexes(
+                    sub_component_field, old_value
+                )
+                new_indexes = self._get_sub_component_indexes(
+                    sub_component_field, new_value
+                )
+                if old_indexes != new_indexes:
+                    self.system.components.record_change(
+                        self, sub_component_field.name, old_indexes, new_indexes
+                    )
+            elif old_value != new_value:
+                changed[api_name] = new_value
+                field = self.fields.get_by_api_name(api_name)
+                self.system.components.record_change(
+                    self,
+                    api_name if field is None else field.name,
+                    None if old_value is NOTHING else old_value,
+                    new_value,
+                )
+        if changed:
+            self.update_field_cache(changed)
+
+    def _get_sub_component_indexes(self, field, api_value):
+        if api_value is NOTHING or api_value is None:
+            return []
+        # pylint: disable=protected-access
+        sub_component_type = field.binding._get_collection(self.system).object_type
+        index_api_name = sub_component_type.fields.index.api_name
+        return [item.get(index_api_name) for item in api_value]
+
     @classmethod
     def construct(
         cls, system, data, parent_id, allow_partial_fields=False
@@ -365,6 +466,10 @@ class InfiniBoxSystemComponent(BaseSystemObject):
                 object_type
             )
             system.components.cache_component(returned)
+            if system.components.is_recording_changes():
+                system.components.record_change(returned, None, None, None)
+        elif system.components.is_recording_changes():
+            returned._update_changed_fields(data)
         else:
             returned.update_field_cache(data)
         for field in cls._iter_sub_component_fields(system):
@@ -400,13 +505,17 @@ class Rack(InfiniBoxSystemComponent):
     def get_this_url_path(self):
         return self.get_specific_rack_url(self.get_index())
 
-    def refresh_without_enclosures(self):
-        fields = ",".join(
+    def get_fields_without_enclosures(self):
+        return ",".join(
             field.api_name
             for field in self.fields
             if field.name not in ("enclosures", "uid", "parent_id")
         )
-        url = self.get_this_url_path().add_query_param("fields", fields)
+
+    def refresh_without_enclosures(self):
+        url = self.get_this_url_path().add_query_param(
+            "fields", self.get_fields_without_enclosures()
+        )
         data = self.system.api.get(url).get_result()
         self.system.components.mark_fetched_nodes()
         data["enclosures"] = []
@@ -962,3 +1071,4 @@ class System(InfiniBoxSystemComponent):
     def refresh_cache(self):
         data = self.system.api.get(self.get_this_url_path()).get_result()
         self.update_field_cache(data)
+        self.system.persistent_cache.store_system_info(data)
@@ -1,5 +1,6 @@
 import functools
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 
 import gossip
 import logbook
@@ -10,7 +11,7 @@ from urlobject import URLObject as URL
 from ..core import CapacityType, Field, MillisecondsDatetimeType
 from ..core.api.special_values import OMIT
 from ..core.bindings import RelatedObjectBinding, RelatedObjectNamedBinding
-from ..core.exceptions import ObjectNotFound, TooManyObjectsFound
+from ..core.exceptions import BulkCreationFailed, ObjectNotFound, TooManyObjectsFound
 from ..core.type_binder import PolymorphicBinder, TypeBinder
 from ..core.utils import (
     DONT_CARE,
@@ -55,18 +56,74 @@ class DatasetTypeBinder(TypeBinder):
         Creates multiple volumes with a single call. Parameters are just like ``volumes.create``, only with the
         addition of the ``count`` parameter
 
-        Returns: list of volumes
+        Returns: list of volumes, in the order of their indexes (i.e. ``<name>_1``, ``<name>_2`` and so on)
 
         :param count: number of volumes to create. Defaults to 1.
+        :param parallelism: if specified, the number of volumes to create concurrently. In this mode, a failure
+          to create some of the volumes doesn't stop the creation of the others, and :class:`.BulkCreationFailed`
+          is raised once all creations are done, holding the created volumes and the errors
+        :param rollback_on_failure: if passed along with ``parallelism``, the created volumes are deleted when
+          some of the creations fail. Volumes which could not be deleted are left in the raised exception, along
+          with the deletion errors
         """
         name = kwargs.pop("name", None)
         if name is None:
             name = self.fields.name.generate_default().generate()
         count = kwargs.pop("count", 1)
-        return [
-            self.create(*args, name="{}_{}".format(name, i), **kwargs)
-            for i in range(1, count + 1)
-        ]
+        parallelism = kwargs.pop("parallelism", None)
+        rollback_on_failure = kwargs.pop("rollback_on_failure", False)
+        names = ["{}_{}".format(name, i) for i in range(1, count + 1)]
+        if parallelism is None:
+            return [self.create(*args, name=obj_name, **kwargs) for obj_name in names]
+        return self._create_many_concurrently(
+            names, parallelism, rollback_on_failure, args, kwargs
+        )
+
+    def _create_many_concurrently(
+        self, names, parallelism, rollback_on_failure, args, kwargs
+    ):
+        api = self.system.api
+        snapshot = api.snapshot_request_context()
+
+        def _create(obj_name):
+            with api.applied_request_context(snapshot):
+                return self.create(*args, name=obj_name, **kwargs)
+
+        created = []
+        errors = {}
+        with ThreadPoolExecutor(max_workers=parallelism) as executor:
+            futures = [executor.submit(_create, obj_name) for obj_name in names]
+            for obj_name, future in zip(names, futures):
+                try:
+                    created.append(future.result())
+                except Exception as e:  # pylint: disable=broad-except
+                    _logger.debug("Failed creating {}", obj_name, exc_info=True)
+                    errors[obj_name] = e
+        if not errors:
+            return created
+        rollback_errors = {}
+        if rollback_on_failure:
+            _logger.debug("Rolling back creation of {} objects", len(created))
+
+            def _delete(obj):
+                with api.applied_request_context(snapshot):
+                    obj.delete()
+
+            to_delete = list(reversed(created))
+            with ThreadPoolExecutor(max_workers=parallelism) as executor:
+                futures = [executor.submit(_delete, obj) for obj in to_delete]
+                for obj, future in zip(to_delete, futures):
+                    exception = future.exception()
+                    if exception is not None:
+                        _logger.debug("Failed rolling back creation of {}", obj)
+                        rollback_errors[obj] = exception
+            created = [obj for obj in created if obj in rollback_errors]
+        raise BulkCreationFailed(
+            created,
+            errors,
+            rolled_back=rollback_on_failure and not rollback_errors,
+            rollback_errors=rollback_errors,
+        )
 
     def calculate_reclaimable_space(self, entities):
         url = URL(self.object_type.get_url_path(self.system)).add_path(
@@ -8,6 +8,13 @@ from ..core.utils import end_reraise_context, normalized_query_value
 
 
 class Events(EventsBase):
+    def _get_events_types_from_system(self):
+        returned = self.system.persistent_cache.get("event_types")
+        if returned is None:
+            returned = super(Events, self)._get_events_types_from_system()
+            self.system.persistent_cache.set("event_types", returned)
+        return returned
+
     def create_custom_event(
         self, level="INFO", description="custom event", visibility="CUSTOMER", data=None
     ):
@@ -0,0 +1,350 @@
+import queue
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures import wait
+from contextlib import contextmanager
+
+from logbook import Logger
+from sentinels import NOTHING
+
+from ..core.exceptions import FleetOperationFailed
+from .infinibox import InfiniBox
+
+_logger = Logger(__name__)
+
+_DEFAULT_MAX_WORKERS = 16
+_ITEMS_DONE = object()
+
+
+@contextmanager
+def _limited_request_timeout_context(system, timeout_seconds):
+    """Limits the timeout of the API requests sent to the system to the given timeout of the whole operation"""
+    request_timeout = system.api.get_request_default_timeout()
+    if timeout_seconds is None or (
+        request_timeout is not None and request_timeout <= timeout_seconds
+    ):
+        yield
+        return
+    with system.api.change_request_default_timeout_context(timeout_seconds):
+        yield
+
+
+class FleetResult:
+    """
+    The outcome of running an operation on a single system of a fleet
+    """
+
+    def __init__(self, system, value=None, exception=None, elapsed_seconds=None):
+        super(FleetResult, self).__init__()
+        self.system = system
+        self.value = value
+        self.exception = exception
+        self.elapsed_seconds = elapsed_seconds
+
+    @property
+    def succeeded(self):
+        return self.exception is None
+
+    @property
+    def timed_out(self):
+        return isinstance(self.exception, FutureTimeoutError)
+
+    def get_value(self):
+        """Returns the value returned for the system, or raises the exception the operation failed with"""
+        if self.exception is not None:
+            raise self.exception
+        return self.value
+
+    def __repr__(self):
+        if self.succeeded:
+            return "<{}: {!r}>".format(self.system, self.value)
+        return "<{}: failed ({!r})>".format(self.system, self.exception)
+
+
+class FleetResults:
+    """
+    The results of running an operation on all systems of a fleet, ordered like the fleet's systems
+    """
+
+    def __init__(self, results):
+        super(FleetResults, self).__init__()
+        self._results = list(results)
+
+    def __iter__(self):
+        return iter(self._results)
+
+    def __len__(self):
+        return len(self._results)
+
+    def __getitem__(self, index):
+        return self._results[index]
+
+    def get_succeeded(self):
+        return [result for result in self._results if result.succeeded]
+
+    def get_failed(self):
+        return [result for result in self._results if not result.succeeded]
+
+    def get_values(self):
+        """Returns the values of the systems on which the operation succeeded, ordered like the fleet's systems"""
+        return [result.value for result in self._results if result.succeeded]
+
+    def raise_on_failure(self):
+        """Raises :class:`.FleetOperationFailed` if the operation failed on any of the systems"""
+        failed = self.get_failed()
+        if failed:
+            raise FleetOperationFailed(failed)
+        return self
+
+    def __repr__(self):
+        return "<FleetResults: {} succeeded, {} failed>".format(
+            len(self.get_succeeded()), len(self.get_failed())
+        )
+
+
+class InfiniBoxFleet:
+    """
+    Runs operations on many systems concurrently, using a bounded pool of threads:
+
+    >>> fleet = InfiniBoxFleet(['ibox1', 'ibox2'], auth=('admin', 'password')) # doctest: +SKIP
+    >>> results = fleet.map(lambda system: system.volumes.count()) # doctest: +SKIP
+
+    Systems can be given either as :class:`.InfiniBox` objects, or as addresses from which such objects are
+    constructed with the given keyword arguments. The systems of a fleet are registered as related to each
+    other.
+
+    :param max_workers: the maximal number of systems operated on at the same time
+    :param timeout_seconds: the default time an operation may run on a single system before it is considered
+      failed. Operations which timed out aren't interrupted, but each of their API requests is limited to this
+      time as well, so that their threads don't hang on unresponsive systems
+    """
+
+    SYSTEM_CLASS = InfiniBox
+
+    def __init__(
+        self,
+        systems=(),
+        max_workers=_DEFAULT_MAX_WORKERS,
+        timeout_seconds=None,
+        **kwargs
+    ):
+        super(InfiniBoxFleet, self).__init__()
+        self.max_workers = max_workers
+        self.timeout_seconds = timeout_seconds
+        self._systems = []
+        for system in systems:
+            self.add_system(system, **kwargs)
+
+    def add_system(self, system, **kwargs):
+        """
+        Adds a system to the fleet, returning it. ``system`` is either an :class:`.InfiniBox` object, or an
+        address to construct one with the given keyword arguments
+        """
+        if not isinstance(system, InfiniBox):
+            system = self.SYSTEM_CLASS(system, **kwargs)
+        for other in self._systems:
+            other.register_related_system(system)
+            system.register_related_system(other)
+        self._systems.append(system)
+        return system
+
+    def remove_system(self, system):
+        self._systems.remove(system)
+        for other in self._systems:
+            other.unregister_related_system(system)
+            system.unregister_related_system(other)
+
+    def get_systems(self):
+        return list(self._systems)
+
+    def __iter__(self):
+        return iter(self.get_systems())
+
+    def __len__(self):
+        return len(self._systems)
+
+    def map(self, func, timeout_seconds=NOTHING):
+        """
+        Calls ``func(system)`` for each system of the fleet concurrently, returning a :class:`.FleetResults`
+        holding the outcome of each system. Failures (including timeouts) are stored in the results rather than
+        raised
+        """
+        results_by_system = {
+            id(result.system): result
+            for result in self.iter_results(func, timeout_seconds=timeout_seconds)
+        }
+        return FleetResults(results_by_system[id(system)] for system in self._systems)
+
+    def iter_results(self, func, timeout_seconds=NOTHING):
+        """
+        Like :meth:`.map`, only yields a :class:`.FleetResult` for each system as soon as it completes
+        """
+        if timeout_seconds is NOTHING:
+            timeout_seconds = self.timeout_seconds
+        systems = self.get_systems()
+        if not systems:
+            return
+        start_times = {}
+
+        def _run(system):
+            start_times[id(system)] = time.monotonic()
+            with _limited_request_timeout_context(system, timeout_seconds):
+                return func(system)
+
+        executor = ThreadPoolExecutor(max_workers=min(self.max_workers, len(systems)))
+        pending = {}
+        try:
+            for system in systems:
+                pending[executor.submit(_run, system)] = system
+            while pending:
+                done, _ = wait(
+                    pending,
+                    timeout=self._get_wait_timeout(
+                        pending, start_times, timeout_seconds
+                    ),
+                    return_when=FIRST_COMPLETED,
+                )
+                for future in done:
+                    system = pending.pop(future)
+                    exception = future.exception()
+                    yield FleetResult(
+                        system,
+                        value=None if exception is not None else future.result(),
+                        exception=exception,
+                        elapsed_seconds=time.monotonic() - start_times[id(system)],
+                    )
+                for result in self._pop_timed_out(
+                    pending, start_times, timeout_seconds
+                ):
+                    yield result
+        finally:
+            for future in pending:
+                future.cancel()
+            # operations which timed out keep running in the background, until their current request times out
+            executor.shutdown(wait=False)
+
+    def _get_wait_timeout(self, pending, start_times, timeout_seconds):
+        if timeout_seconds is None:
+            return None
+        now = time.monotonic()
+        deadlines = [
+            start_times[id(system)] + timeout_seconds
+            for system in pending.values()
+            if id(system) in start_times
+        ]
+        if not deadlines:
+            return timeout_seconds
+        return max(min(deadlines) - now, 0)
+
+    def _pop_timed_out(self, pending, start_times, timeout_seconds):
+        if timeout_seconds is None:
+            return []
+        now = time.monotonic()
+        returned = []
+        for future, system in list(pending.items()):
+            start_time = start_times.get(id(system))
+            if start_time is not None and now - start_time >= timeout_seconds:
+                _logger.debug("Operation on {} timed out", system)
+                del pending[future]
+                exception = FutureTimeoutError(
+                    "Operation on {} did not complete within {} seconds".format(
+                        system, timeout_seconds
+                    )
+                )
+                returned.append(
+                    FleetResult(
+                        system, exception=exception, elapsed_seconds=now - start_time
+                    )
+                )
+        return returned
+
+    def iter_merged(self, func, timeout_seconds=NOTHING):
+        """
+        Calls ``func(system)`` for each system of the fleet concurrently, where ``func`` returns an iterable (e.g.
+        a query), and yields ``(system, item)`` tuples as soon as each item is produced:
+
+        >>> for system, volume in fleet.iter_merged(lambda system: system.volumes.find(size=0)): # doctest: +SKIP
+        ...     print(system, volume)
+
+        If the operation fails on some systems, :class:`.FleetOperationFailed` is raised once the items of all
+        other systems were yielded. Items produced by a system after its operation timed out are discarded
+        """
+        if timeout_seconds is NOTHING:
+            timeout_seconds = self.timeout_seconds
+        systems = self.get_systems()
+        if not systems:
+            return
+        items = queue.Queue()
+        start_times = {}
+        # ids of systems whose items are no longer consumed, signaling their producers to stop
+        stopped = set()
+
+        def _produce(system):
+            start_times[id(system)] = time.monotonic()
+            try:
+                with _limited_request_timeout_context(system, timeout_seconds):
+                    for item in func(system):
+                        if id(system) in stopped:
+                            break
+                        items.put((system, item))
+            finally:
+                items.put((system, _ITEMS_DONE))
+
+        executor = ThreadPoolExecutor(max_workers=min(self.max_workers, len(systems)))
+        pending = {}
+        futures_by_system = {}
+        failures = []
+        try:
+            for system in systems:
+                future = futures_by_system[id(system)] = executor.submit(
+                    _produce, system
+                )
+                pending[future] = system
+            while pending:
+                try:
+                    system, item = items.get(
+                        timeout=self._get_wait_timeout(
+                            pending, start_times, timeout_seconds
+                        )
+                    )
+                except queue.Empty:
+                    pass
+                else:
+                    if item is not _ITEMS_DONE:
+                        if id(system) not in stopped:
+                            yield system, item
+                    else:
+                        result = self._pop_finished_producer(
+                            pending, futures_by_system, start_times, system
+                        )
+                        if result is not None and not result.succeeded:
+                            failures.append(result)
+                for result in self._pop_timed_out(
+                    pending, start_times, timeout_seconds
+                ):
+                    stopped.add(id(result.system))
+                    failures.append(result)
+        finally:
+            stopped.update(id(system) for system in systems)
+            for future in pending:
+                future.cancel()
+            # producers which timed out stop once their next item is produced, or their current request times out
+            executor.shutdown(wait=False)
+        if failures:
+            raise FleetOperationFailed(failures)
+
+    def _pop_finished_producer(self, pending, futures_by_system, start_times, system):
+        future = futures_by_system[id(system)]
+        if pending.pop(future, None) is None:
+            return None  # already timed out
+        exception = future.exception()
+        return FleetResult(
+            system,
+            exception=exception,
+            elapsed_seconds=time.monotonic() - start_times[id(system)],
+        )
+
+    def login(self, timeout_seconds=NOTHING):
+        """Logs in to all systems of the fleet, returning a :class:`.FleetResults`"""
+        return self.map(lambda system: system.login(), timeout_seconds=timeout_seconds)
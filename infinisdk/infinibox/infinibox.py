@@ -17,6 +17,7 @@ from ..core.utils.environment import (
     get_logged_in_username,
 )
 from .active_directory import ActiveDirectoryDomains
+from .bulk_delete import delete_many
 from .capacities import InfiniBoxSystemCapacity
 from .certificates import Certificates
 from .compatibility import Compatibility
@@ -41,6 +42,7 @@ from .nfs_user import NFSUser
 from .nlm_lock import NlmLock
 from .notification_rule import NotificationRule
 from .notification_target import NotificationTarget
+from .persistent_cache import InfiniBoxPersistentCache
 from .plugin import Plugin
 from .pool import Pool
 from .qos_policy import QosPolicy
@@ -112,6 +114,7 @@ class InfiniBox(APITarget):
     def _initialize(self):
         super(InfiniBox, self)._initialize()
         self.current_user = _CurrentUserProxy(self)
+        self.persistent_cache = InfiniBoxPersistentCache(self)
         self.compat = Compatibility(self)
         self.capacities = InfiniBoxSystemCapacity(self)
         self.system_metadata = SystemMetadata(self)
@@ -127,17 +130,10 @@ class InfiniBox(APITarget):
             raise VersionNotSupported(self.get_version())
 
     def is_field_supported(self, field):
-        if (
-            field.new_to_version
-            and self.compat.get_parsed_system_version() < field.new_to_version
-        ):
-            return False
-        if (
-            field.until_version
-            and self.compat.get_parsed_system_version() > field.until_version
-        ):
-            return False
-        return self.compat.is_feature_supported(field.feature_name)
+        return self.compat.is_field_supported(field)
+
+    def get_supported_field_names(self, object_type):
+        return self.compat.get_supported_field_names(object_type)
 
     def _get_api_auth(self):
         username = self._get_auth_ini_option("username", None)
@@ -191,6 +187,17 @@ class InfiniBox(APITarget):
     def get_state(self):
         return self.components.system_component.get_state()
 
+    def delete_many(self, objs, parallelism=1):
+        """
+        Deletes many objects, possibly of different types. Snapshots and clones are deleted before their parents,
+        and mapped volumes are unmapped and deleted before hosts and clusters. Objects which don't depend on each
+        other are deleted concurrently, by up to ``parallelism`` threads.
+
+        Failures don't stop the deletion of unrelated objects. Returns a list of :class:`.DeletionResult`, ordered
+        like the given objects
+        """
+        return delete_many(self, objs, parallelism=parallelism)
+
     def is_simulator(self):
         try:
             return self.get_system_info("model").lower() == "infinisim-model"
@@ -0,0 +1,111 @@
+from sentinels import NOTHING
+from urlobject import URLObject as URL
+
+from ..core.exceptions import CacheMiss
+from ..core.persistent_cache import get_persistent_cache
+
+_SYSTEM_IDENTITY = "system_identity"
+_IDENTITY_FIELD_NAMES = ["serial_number", "version"]
+
+
+class InfiniBoxPersistentCache:
+    """
+    Stores rarely-changing payloads of a system (e.g. its features and event types) in the persistent cache,
+    keyed by the system's serial number and version. The serial number and version are also stored by the
+    system's address, so they can be found without fetching the system info. The stored version is checked
+    against the system before it is used
+    """
+
+    def __init__(self, system):
+        super(InfiniBoxPersistentCache, self).__init__()
+        self.system = system
+        self._loaded_system_info = NOTHING
+        self._pending = {}
+
+    def _get_address_key(self):
+        return "address:{}:{}".format(*self.system.get_api_addresses()[0])
+
+    def _get_identity(self):
+        try:
+            system_info = self.system.components.system_component.get_fields(
+                _IDENTITY_FIELD_NAMES, from_cache=True, fetch_if_not_cached=False
+            )
+        except CacheMiss:
+            return None
+        return "serial:{}".format(system_info["serial_number"]), system_info["version"]
+
+    def _fetch_version(self):
+        url = URL("system").add_query_param("fields", "version")
+        return self.system.api.get(url, check_version=False).get_result()["version"]
+
+    def load_system_info(self):
+        """
+        Loads the serial number and version of the system from the persistent cache into the system component,
+        once per system object. The version is first compared with the one currently reported by the system.
+        Returns whether the system info was loaded
+        """
+        if self._loaded_system_info is NOTHING:
+            self._loaded_system_info = False
+            cache = get_persistent_cache()
+            if cache is None:
+                return False
+            data = cache.get(self._get_address_key(), _SYSTEM_IDENTITY)
+            if data is None:
+                return False
+            version = self._fetch_version()
+            if data["version"] != version:
+                return False
+            self.system.components.system_component.update_field_cache(data)
+            self._loaded_system_info = True
+        return self._loaded_system_info
+
+    def store_system_info(self, data):
+        cache = get_persistent_cache()
+        if cache is None:
+            return
+        identity = {
+            field_name: data[field_name] for field_name in _IDENTITY_FIELD_NAMES
+        }
+        cache.set(self._get_address_key(), _SYSTEM_IDENTITY, identity)
+        pending, self._pending = self._pending, {}
+        for name, payload in pending.items():
+            self.set(name, payload)
+
+    def get(self, name):
+        """Returns the payload cached for this system under the given name, or ``None`` if not found"""
+        cache = get_persistent_cache()
+        if cache is None:
+            return None
+        identity = self._get_identity()
+        if identity is None and self.load_system_info():
+            identity = self._get_identity()
+        if identity is None:
+            return None
+        key, version = identity
+        return cache.get(key, name, version)
+
+    def set(self, name, payload):
+        """
+        Stores the payload for this system under the given name. If the system's identity isn't known yet,
+        the payload is stored once the system info is fetched
+        """
+        cache = get_persistent_cache()
+        if cache is None:
+            return
+        identity = self._get_identity()
+        if identity is None:
+            self._pending[name] = payload
+            return
+        key, version = identity
+        cache.set(key, name, payload, version)
+
+    def invalidate(self):
+        """Removes all payloads stored for this system from the persistent cache"""
+        cache = get_persistent_cache()
+        if cache is None:
+            return
+        cache.invalidate(self._get_address_key())
+        identity = self._get_identity()
+        if identity is not None:
+            cache.invalidate(identity[0])
+        self._loaded_system_info = NOTHING
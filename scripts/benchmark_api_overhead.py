@@ -0,0 +1,120 @@
+"""
+Measures the client-side overhead of sending API requests, with the API logger disabled, with its records discarded
+by a NullHandler and with its records formatted by a handler. Requests are answered in-process by a fake transport
+adapter, so the measured times exclude the network and the system. Run it from the repository root:
+
+    python scripts/benchmark_api_overhead.py --requests 2000 --page-size 100
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import timedelta
+
+import logbook
+import requests
+from requests.adapters import BaseAdapter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from infinisdk import InfiniBox  # pylint: disable=wrong-import-position
+from infinisdk.core.api import api  # pylint: disable=wrong-import-position
+
+
+class _FakeAdapter(BaseAdapter):
+    def __init__(self, page_size):
+        super(_FakeAdapter, self).__init__()
+        items = [
+            {"id": index, "name": "vol{}".format(index), "size": 1000000000}
+            for index in range(1, page_size + 1)
+        ]
+        self._bodies = {
+            "/api/rest/_features": self._encode([]),
+            "/api/rest/system": self._encode(
+                {"version": "7.1.0", "name": "benchmark", "serial_number": 1}
+            ),
+        }
+        self._default_body = self._encode(
+            items, metadata={"page": 1, "page_size": page_size, "pages_total": 1}
+        )
+
+    def _encode(self, result, metadata=None):
+        return json.dumps(
+            {"result": result, "metadata": metadata, "error": None}
+        ).encode("utf-8")
+
+    def send(self, request, **kwargs):  # pylint: disable=arguments-differ
+        returned = requests.Response()
+        returned.status_code = 200
+        returned.reason = "OK"
+        returned.headers["Content-Type"] = "application/json"
+        returned._content = self._bodies.get(  # pylint: disable=protected-access
+            requests.utils.urlparse(request.url).path, self._default_body
+        )
+        returned.url = request.url
+        returned.request = request
+        returned.elapsed = timedelta()
+        return returned
+
+    def close(self):
+        pass
+
+
+def _measure(system, num_requests, repeats):
+    """Returns the best per-request time of several rounds, to reduce the noise of the measurement"""
+    returned = None
+    for _ in range(repeats):
+        start_time = time.perf_counter()
+        for _ in range(num_requests):
+            system.api.get("volumes").get_result()
+        elapsed = (time.perf_counter() - start_time) / num_requests
+        returned = elapsed if returned is None else min(returned, elapsed)
+    return returned
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    system = InfiniBox("127.0.0.1", auth=("admin", "password"))
+    system.api._session.mount(  # pylint: disable=protected-access
+        "http://", _FakeAdapter(args.page_size)
+    )
+    system.api.get("volumes")  # initializes the system's features and version
+    with logbook.NullHandler():
+        _measure(system, args.requests, 1)  # warms up
+
+    with logbook.NullHandler():
+        api.logger.level = logbook.DEBUG
+        try:
+            results = [
+                (
+                    "API logger level above TRACE",
+                    _measure(system, args.requests, args.repeats),
+                )
+            ]
+        finally:
+            api.logger.level = logbook.NOTSET
+        results.append(
+            (
+                "records discarded by NullHandler",
+                _measure(system, args.requests, args.repeats),
+            )
+        )
+        with open(os.devnull, "w") as devnull, logbook.StreamHandler(
+            devnull, level=logbook.TRACE
+        ):
+            results.append(
+                ("records formatted", _measure(system, args.requests, args.repeats))
+            )
+    for title, elapsed in results:
+        print("Per-request overhead, {}: {:.1f}us".format(title, elapsed * 1e6))
+
+
+if __name__ == "__main__":
+    main()
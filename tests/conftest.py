@@ -0,0 +1,34 @@
+import pytest
+
+from infinisdk.core.config import config
+
+from .utils import FakeTransport, make_system, make_volumes
+
+
+@pytest.fixture(autouse=True)
+def restore_config():
+    config.backup()
+    try:
+        yield
+    finally:
+        config.restore()
+
+
+@pytest.fixture
+def transport():
+    returned = FakeTransport()
+    returned.collections["volumes"] = make_volumes(120)
+    returned.collections["pools"] = [
+        {"id": 1, "name": "pool1"},
+        {"id": 2, "name": "pool2"},
+    ]
+    returned.collections["events"] = []
+    return returned
+
+
+@pytest.fixture
+def infinibox(transport):
+    returned = make_system(transport)
+    returned.api.get("system")  # initializes the system's features and version
+    transport.sent.clear()
+    return returned
@@ -0,0 +1,71 @@
+import logbook
+import pytest
+
+from infinisdk.core.api import api
+from infinisdk.core.api.api import API
+
+
+@pytest.fixture
+def logged_responses(monkeypatch):
+    returned = []
+    orig = API._get_logged_response_data  # pylint: disable=protected-access
+
+    def _get_logged_response_data(self, response):
+        returned.append(response)
+        return orig(self, response)
+
+    monkeypatch.setattr(API, "_get_logged_response_data", _get_logged_response_data)
+    return returned
+
+
+@pytest.fixture
+def api_logger_level():
+    prev_level = api.logger.level
+    try:
+        yield
+    finally:
+        api.logger.level = prev_level
+
+
+def test_trace_records_are_formatted(infinibox, logged_responses):
+    with logbook.TestHandler(level=logbook.TRACE) as handler:
+        infinibox.api.get("volumes/1")
+    messages = [record.message for record in handler.records]
+    assert any("<-- GET" in message and "volumes/1" in message for message in messages)
+    assert any("vol1" in message for message in messages)
+    assert len(logged_responses) == 1
+
+
+def test_discarded_trace_records_are_not_formatted(infinibox, logged_responses):
+    with logbook.NullHandler():
+        infinibox.api.get("volumes/1")
+    assert not logged_responses
+
+
+def test_sent_password_is_masked(infinibox):
+    infinibox.api.get("system")  # logs in
+    with logbook.TestHandler(level=logbook.TRACE) as handler:
+        infinibox.api.post("users/login", data={"username": "u", "password": "secret"})
+    messages = [record.message for record in handler.records]
+    assert any("DATA" in message for message in messages)
+    assert not any("secret" in message for message in messages)
+
+
+@pytest.mark.usefixtures("api_logger_level")
+def test_logger_level_above_trace_skips_trace_records(infinibox, logged_responses):
+    api.logger.level = logbook.DEBUG
+    with logbook.TestHandler(level=logbook.TRACE) as handler:
+        infinibox.api.get("volumes/1")
+    assert not [record for record in handler.records if record.level == logbook.TRACE]
+    assert not logged_responses
+
+
+@pytest.mark.usefixtures("api_logger_level")
+def test_logger_level_is_checked_on_each_request(infinibox, logged_responses):
+    api.logger.level = logbook.DEBUG
+    infinibox.api.get("volumes/1")
+    api.logger.level = logbook.NOTSET
+    with logbook.TestHandler(level=logbook.TRACE) as handler:
+        infinibox.api.get("volumes/1")
+    assert any("vol1" in record.message for record in handler.records)
+    assert len(logged_responses) == 1
@@ -0,0 +1,104 @@
+import json
+
+import pytest
+
+from infinisdk.core.api.json_stream import iter_list_items
+
+from .utils import FakeTransport, make_system, make_volumes
+
+
+def _split(data, chunk_size):
+    return [data[i : i + chunk_size] for i in range(0, len(data), chunk_size)]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 1000])
+def test_iter_list_items_across_chunks(chunk_size):
+    payload = {
+        "error": None,
+        "result": [{"id": 1, "name": "אב"}, 12345678901234, [1, 2], "x"],
+        "metadata": {"page": 1},
+    }
+    other_members = {}
+    chunks = _split(json.dumps(payload, ensure_ascii=False).encode("utf-8"), chunk_size)
+    assert list(iter_list_items(chunks, "result", other_members)) == payload["result"]
+    assert other_members == {"error": None, "metadata": {"page": 1}}
+
+
+def test_iter_list_items_non_list_result():
+    other_members = {}
+    items = iter_list_items(
+        [b'{"result": {"a": 1}, "error": null}'], "result", other_members
+    )
+    assert list(items) == []
+    assert other_members == {"result": {"a": 1}, "error": None}
+
+
+def test_iter_list_items_invalid_json():
+    with pytest.raises(ValueError):
+        list(iter_list_items([b'{"result": [1, 2'], "result", {}))
+
+
+def test_stream_query(infinibox, transport):
+    transport.collections["volumes"] = make_volumes(250)
+    volumes = list(infinibox.volumes.find().page_size(100).stream())
+    assert [volume.id for volume in volumes] == list(range(1, 251))
+    assert volumes[-1].get_name(from_cache=True) == "vol250"
+    assert [request.params["page"] for request in transport.get_sent("volumes")] == [
+        "1",
+        "2",
+        "3",
+    ]
+    assert all(response.raw.closed for response in transport.responses)
+
+
+def test_streamed_response_metadata(infinibox):
+    response = infinibox.api.get("volumes?page=1&page_size=10", stream=True)
+    assert len(list(response.iter_result_items())) == 10
+    assert response.get_total_num_objects() == 120
+
+
+def test_discarded_streamed_503_response_is_closed():
+    transport = FakeTransport()
+    transport.collections["volumes"] = make_volumes(5)
+    system = make_system(transport, address=[("fake-1", 80), ("fake-2", 80)])
+    system.api.get("system")
+    # causes the next request to try all addresses, as the first request of a system does
+    system.api._active_url = None  # pylint: disable=protected-access
+
+    def interceptor(request):
+        if request.path == "volumes" and not transport.get_sent(path="volumes")[1:]:
+            return 503, {"result": None, "error": None, "metadata": None}
+        return None
+
+    transport.interceptor = interceptor
+    transport.responses.clear()
+    response = system.api.get("volumes", stream=True)
+    assert len(list(response.iter_result_items())) == 5
+    unavailable, returned = transport.responses
+    assert unavailable.status_code == 503
+    assert unavailable.raw.closed
+    assert returned.status_code == 200
+
+
+def test_discarded_streamed_401_response_is_closed(infinibox, transport):
+    infinibox.api.set_cookie("JSESSIONID", "expired")
+
+    def interceptor(request):
+        if request.path == "volumes" and not transport.get_sent(path="users/login"):
+            return 401, {
+                "result": None,
+                "error": {"code": "UNAUTHORIZED"},
+                "metadata": None,
+            }
+        return None
+
+    transport.interceptor = interceptor
+    transport.responses.clear()
+    response = infinibox.api.get("volumes", stream=True)
+    assert len(list(response.iter_result_items())) == 50
+    unauthorized = transport.responses[0]
+    assert unauthorized.status_code == 401
+    assert unauthorized.raw.closed
+    paths = [request.path for request in transport.sent]
+    assert "users/login" in paths
+    assert paths[-1] == "volumes"
@@ -0,0 +1,132 @@
+import asyncio
+
+import pytest
+
+from infinisdk import AsyncInfiniBox
+from infinisdk.core.config import config
+
+from .utils import SYSTEM_INFO, make_volumes
+
+web = pytest.importorskip("aiohttp.web")
+test_utils = pytest.importorskip("aiohttp.test_utils")
+
+
+def _reply(result, metadata=None):
+    return web.json_response({"result": result, "error": None, "metadata": metadata})
+
+
+class _StubSystem:
+    def __init__(self, num_volumes=3):
+        super(_StubSystem, self).__init__()
+        self.volumes = make_volumes(num_volumes)
+        self.sent = []
+        self.app = web.Application(middlewares=[self._record])
+        self.app.router.add_get("/api/rest/_features", self._handle_features)
+        self.app.router.add_get("/api/rest/system", self._handle_system)
+        self.app.router.add_post("/api/rest/users/login", self._handle_login)
+        self.app.router.add_get("/api/rest/volumes", self._handle_volumes)
+
+    @web.middleware
+    async def _record(self, request, handler):
+        self.sent.append(request)
+        return await handler(request)
+
+    async def _handle_features(self, _):
+        return _reply([])
+
+    async def _handle_system(self, _):
+        return _reply(SYSTEM_INFO)
+
+    async def _handle_login(self, _):
+        return web.json_response(
+            {"result": {"roles": ["ADMIN"]}, "error": None, "metadata": None},
+            headers={"Set-Cookie": "JSESSIONID=abc; Path=/"},
+        )
+
+    async def _handle_volumes(self, request):
+        page = int(request.query.get("page", 1))
+        page_size = int(request.query.get("page_size", 50))
+        metadata = {
+            "ready": True,
+            "page": page,
+            "page_size": page_size,
+            "pages_total": (len(self.volumes) + page_size - 1) // page_size,
+            "number_of_objects": len(self.volumes),
+        }
+        return _reply(self.volumes[(page - 1) * page_size : page * page_size], metadata)
+
+
+def _run_against_stub(stub, func):
+    async def _main():
+        async with test_utils.TestServer(stub.app) as server:
+            async with AsyncInfiniBox(
+                (server.host, server.port), auth=("admin", "password")
+            ) as system:
+                return await func(system)
+
+    return asyncio.run(_main())
+
+
+def test_async_query():
+    stub = _StubSystem(num_volumes=5)
+
+    async def _get_names(system):
+        return [
+            volume.get_name(from_cache=True) async for volume in system.volumes.find()
+        ]
+
+    assert _run_against_stub(stub, _get_names) == [
+        "vol{}".format(index) for index in range(1, 6)
+    ]
+
+
+def test_async_query_fetches_all_pages():
+    config.root.api.page_size = 2
+    stub = _StubSystem(num_volumes=5)
+
+    async def _get_ids(system):
+        return [volume.id async for volume in system.volumes.find()]
+
+    assert _run_against_stub(stub, _get_ids) == [1, 2, 3, 4, 5]
+    assert [
+        request.query["page"]
+        for request in stub.sent
+        if request.path == "/api/rest/volumes"
+    ] == ["1", "2", "3"]
+
+
+def test_async_login_keeps_cookies():
+    stub = _StubSystem()
+
+    async def _login_and_query(system):
+        await system.login()
+        await system.api.get("volumes")
+
+    _run_against_stub(stub, _login_and_query)
+    [volumes_request] = [
+        request for request in stub.sent if request.path == "/api/rest/volumes"
+    ]
+    assert volumes_request.cookies.get("JSESSIONID") == "abc"
+
+
+def test_async_basic_auth_is_passed_per_request():
+    stub = _StubSystem()
+
+    async def _get_system(system):
+        await system.api.get("system", use_basic_auth=True, check_version=False)
+
+    _run_against_stub(stub, _get_system)
+    [system_request] = [
+        request for request in stub.sent if request.path == "/api/rest/system"
+    ]
+    assert system_request.headers["Authorization"].startswith("Basic ")
+
+
+def test_async_unsupported_request_arguments():
+    stub = _StubSystem()
+
+    async def _get_streamed(system):
+        await system.api.get("volumes", stream=True)
+
+    with pytest.raises(TypeError):
+        _run_against_stub(stub, _get_streamed)
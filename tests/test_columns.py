@@ -0,0 +1,64 @@
+import pytest
+
+from infinisdk.core import columnar
+from infinisdk.core.exceptions import InvalidUsageException
+
+from .utils import get_fetched_pages
+
+
+def test_to_columns_lists(infinibox, transport):
+    columns = infinibox.volumes.find().to_columns(
+        ["name", "size", "pool"], output="lists"
+    )
+    assert list(columns) == ["name", "size", "pool"]
+    assert columns["name"] == ["vol{}".format(index) for index in range(1, 121)]
+    assert columns["size"] == [1000000000] * 120
+    assert columns["pool"] == [1] * 120
+    requests = transport.get_sent("volumes", method="GET")
+    assert {request.params["fields"] for request in requests} == {"name,pool_id,size"}
+
+
+def test_to_columns_fetches_all_pages(infinibox, transport):
+    columns = infinibox.volumes.find().page_size(50).to_columns(["id"], output="lists")
+    assert columns["id"] == list(range(1, 121))
+    assert get_fetched_pages(transport) == [(1, 50), (2, 50), (3, 50)]
+
+
+def test_to_columns_keeps_query_filters(infinibox, transport):
+    transport.collections["volumes"][4]["pool_id"] = 2
+    columns = infinibox.volumes.find(pool_id=2).to_columns(["name"], output="lists")
+    assert columns == {"name": ["vol5"]}
+
+
+def test_to_columns_unsupported_output(infinibox):
+    with pytest.raises(ValueError):
+        infinibox.volumes.find().to_columns(["name"], output="csv")
+
+
+@pytest.mark.parametrize(
+    "field_name,dtype",
+    [
+        ("size", "int64"),
+        ("created_at", "datetime64[ms]"),
+        ("pool", "int64"),
+        ("name", None),
+    ],
+)
+def test_column_dtype(infinibox, field_name, dtype):
+    field = infinibox.volumes.fields[field_name]
+    assert columnar.get_column_dtype(field) == dtype
+
+
+def test_to_columns_numpy(infinibox):
+    numpy = pytest.importorskip("numpy")
+    columns = infinibox.volumes.find().to_columns(["size", "created_at", "name"])
+    assert columns["size"].dtype == numpy.dtype("int64")
+    assert columns["created_at"].dtype == numpy.dtype("datetime64[ms]")
+    assert columns["name"].dtype == numpy.dtype(object)
+    assert columns["name"][0] == "vol1"
+
+
+def test_to_columns_without_numpy(infinibox, monkeypatch):
+    monkeypatch.setattr(columnar, "numpy", None)
+    with pytest.raises(InvalidUsageException):
+        infinibox.volumes.find().to_columns(["name"])
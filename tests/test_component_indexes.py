@@ -0,0 +1,77 @@
+import pytest
+from infi.dtypes.wwn import WWN
+
+from .utils import get_wwpn
+
+
+@pytest.fixture
+def components(infinibox):
+    returned = infinibox.components
+    returned.get_rack_1().refresh_cache()
+    return returned
+
+
+def _get_candidates(components, binder, field_name, value):
+    return components.get_cached_components_by_field_value(
+        binder.object_type, field_name, value
+    )
+
+
+def test_find_by_indexed_field(components):
+    [fc_port] = components.fc_ports.find(wwpn=get_wwpn(2, 3)).to_list()
+    assert fc_port.get_index() == 3
+    assert fc_port.get_node().get_index() == 2
+
+
+def test_index_narrows_candidates(components):
+    candidates = _get_candidates(
+        components, components.fc_ports, "wwpn", get_wwpn(2, 3)
+    )
+    assert len(candidates) == 1
+    assert len(components.get_cached_components(components.fc_ports.object_type)) == 12
+
+
+def test_index_lookup_converts_values(components):
+    by_string = _get_candidates(components, components.fc_ports, "wwpn", get_wwpn(1, 1))
+    by_wwn = _get_candidates(
+        components, components.fc_ports, "wwpn", WWN(get_wwpn(1, 1))
+    )
+    assert by_string == by_wwn
+    assert len(by_string) == 1
+
+
+def test_non_identity_fields_are_not_indexed(components):
+    assert _get_candidates(components, components.fc_ports, "role", "HARD_PORT") is None
+
+
+def test_find_by_uid(components):
+    node = components.nodes.get(index=2)
+    assert components.nodes.get_by_uid(node.get_uid()) is node
+    assert _get_candidates(components, components.fc_ports, "uid", node.get_uid()) == []
+
+
+def test_indexed_results_match_scan(components):
+    drives = components.drives.find(index=2).to_list()
+    scanned = [
+        drive
+        for drive in components.get_cached_components(components.drives.object_type)
+        if drive.get_index() == 2
+    ]
+    assert drives == scanned
+    assert len(drives) == 2
+
+
+def test_index_is_updated_with_cache(components):
+    fc_port = components.fc_ports.get(wwpn=get_wwpn(1, 1))
+    new_wwpn = get_wwpn(9, 9)
+    fc_port.update_field_cache({"wwpn": new_wwpn})
+    assert components.fc_ports.find(wwpn=get_wwpn(1, 1)).to_list() == []
+    assert components.fc_ports.get(wwpn=new_wwpn) is fc_port
+
+
+def test_index_is_updated_when_tree_is_refetched(components, transport):
+    transport.components_tree["nodes"][0]["fc_ports"][0]["wwpn"] = get_wwpn(9, 9)
+    components.get_rack_1().refresh_cache()
+    fc_port = components.fc_ports.get(wwpn=get_wwpn(9, 9))
+    assert fc_port.get_node().get_index() == 1
+    assert components.fc_ports.safe_get(wwpn=get_wwpn(1, 1)) is None
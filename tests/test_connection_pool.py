@@ -0,0 +1,101 @@
+import json
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from infinisdk import InfiniBox
+from infinisdk.core.api.connection_pool import ConnectionStats, PoolingHTTPAdapter
+from infinisdk.core.config import config
+
+from .utils import SYSTEM_INFO
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        result = SYSTEM_INFO if self.path.startswith("/api/rest/system") else []
+        body = json.dumps({"result": result, "error": None, "metadata": None})
+        body = body.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_):  # pylint: disable=arguments-differ
+        pass
+
+
+@pytest.fixture
+def server_address():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _RequestHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server.server_address
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+
+def test_connections_are_reused(server_address):
+    system = InfiniBox(server_address, auth=("admin", "password"))
+    for _ in range(3):
+        system.api.get("system")
+    stats = system.api.get_connection_stats()
+    assert stats.opened == 1
+    assert stats.requests > 3
+    assert stats.reused == stats.requests - 1
+
+
+def test_connection_stats_survive_session_reinitialization(server_address):
+    system = InfiniBox(server_address, auth=("admin", "password"))
+    system.api.get("system")
+    stats = system.api.get_connection_stats()
+    num_requests = stats.requests
+    system.api.reinitialize_session()
+    system.api.get("system")
+    assert system.api.get_connection_stats() is stats
+    assert stats.opened == 2
+    assert stats.requests == num_requests + 1
+
+
+def test_connection_stats_reset():
+    stats = ConnectionStats()
+    stats.record_opened()
+    stats.record_request()
+    stats.record_request()
+    assert stats.reused == 1
+    stats.reset()
+    assert (stats.opened, stats.requests, stats.reused) == (0, 0, 0)
+
+
+def test_pool_configuration():
+    config.root.api.connection_pool.pool_maxsize = 32
+    config.root.api.connection_pool.pool_block = True
+    adapter = PoolingHTTPAdapter(ConnectionStats())
+    pool = adapter.get_connection_with_tls_context(
+        requests.Request("GET", "http://127.0.0.1/").prepare(), verify=False
+    )
+    assert pool.pool.maxsize == 32
+    assert pool.block
+
+
+def test_tcp_keepalive():
+    config.root.api.connection_pool.tcp_keepalive = True
+    config.root.api.connection_pool.tcp_keepalive_probes = 3
+    adapter = PoolingHTTPAdapter(ConnectionStats())
+    socket_options = adapter.poolmanager.connection_pool_kw["socket_options"]
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in socket_options
+    if hasattr(socket, "TCP_KEEPCNT"):
+        assert (socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 3) in socket_options
+
+
+def test_tcp_keepalive_disabled_by_default():
+    adapter = PoolingHTTPAdapter(ConnectionStats())
+    assert "socket_options" not in adapter.poolmanager.connection_pool_kw
@@ -0,0 +1,98 @@
+import pytest
+
+from infinisdk.core.exceptions import BulkCreationFailed
+
+
+@pytest.fixture
+def pool(infinibox):
+    return infinibox.pools.get_by_id(1)
+
+
+def _get_created_names(transport):
+    return [request.body["name"] for request in transport.get_sent("volumes", "POST")]
+
+
+def test_create_many(infinibox, transport, pool):
+    volumes = infinibox.volumes.create_many(pool=pool, name="v", count=3)
+    assert [volume.get_name(from_cache=True) for volume in volumes] == [
+        "v_1",
+        "v_2",
+        "v_3",
+    ]
+    assert _get_created_names(transport) == ["v_1", "v_2", "v_3"]
+
+
+@pytest.mark.parametrize("parallelism", [1, 4])
+def test_create_many_concurrently_keeps_index_order(infinibox, pool, parallelism):
+    volumes = infinibox.volumes.create_many(
+        pool=pool, name="v", count=12, parallelism=parallelism
+    )
+    assert [volume.get_name(from_cache=True) for volume in volumes] == [
+        "v_{}".format(index) for index in range(1, 13)
+    ]
+
+
+def test_create_many_concurrently_failure(infinibox, transport, pool):
+    transport.failing_names.update(["v_2", "v_4"])
+    with pytest.raises(BulkCreationFailed) as caught:
+        infinibox.volumes.create_many(pool=pool, name="v", count=5, parallelism=3)
+    error = caught.value
+    assert sorted(error.errors) == ["v_2", "v_4"]
+    assert [volume.get_name(from_cache=True) for volume in error.created] == [
+        "v_1",
+        "v_3",
+        "v_5",
+    ]
+    assert not error.rolled_back
+    assert not error.rollback_errors
+    assert not transport.get_sent(method="DELETE")
+
+
+def test_create_many_concurrently_rollback(infinibox, transport, pool):
+    transport.failing_names.add("v_2")
+    with pytest.raises(BulkCreationFailed) as caught:
+        infinibox.volumes.create_many(
+            pool=pool, name="v", count=3, parallelism=2, rollback_on_failure=True
+        )
+    error = caught.value
+    assert error.rolled_back
+    assert error.created == []
+    assert "rolled back" in str(error)
+    assert len(transport.get_sent(method="DELETE")) == 2
+    assert not [
+        volume
+        for volume in transport.collections["volumes"]
+        if volume["name"][:2] == "v_"
+    ]
+
+
+def test_create_many_concurrently_rollback_failure(infinibox, transport, pool):
+    transport.failing_names.add("v_2")
+
+    def interceptor(request):
+        if request.method == "DELETE":
+            [volume] = [
+                volume
+                for volume in transport.collections["volumes"]
+                if "volumes/{}".format(volume["id"]) == request.path
+            ]
+            if volume["name"] == "v_3":
+                return 409, {
+                    "result": None,
+                    "error": {"code": "BUSY"},
+                    "metadata": None,
+                }
+        return None
+
+    transport.interceptor = interceptor
+    with pytest.raises(BulkCreationFailed) as caught:
+        infinibox.volumes.create_many(
+            pool=pool, name="v", count=3, parallelism=2, rollback_on_failure=True
+        )
+    error = caught.value
+    assert not error.rolled_back
+    assert [volume.get_name(from_cache=True) for volume in error.created] == ["v_3"]
+    [(volume, exception)] = error.rollback_errors.items()
+    assert volume is error.created[0]
+    assert exception.status_code == 409
+    assert "Failed rolling back 1 object(s)" in str(error)
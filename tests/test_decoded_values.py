@@ -0,0 +1,48 @@
+import arrow
+from capacity import Capacity, byte
+
+from infinisdk.infinibox.tenant import Tenant
+
+
+def test_memoized_immutable_value(infinibox):
+    volume = infinibox.volumes.find().to_list()[0]
+    size = volume.get_size(from_cache=True)
+    assert isinstance(size, Capacity)
+    assert volume.get_size(from_cache=True) is size
+    created_at = volume.get_created_at(from_cache=True)
+    assert isinstance(created_at, arrow.Arrow)
+    assert volume.get_created_at(from_cache=True) is created_at
+
+
+def test_mutable_value_is_decoded_on_each_read(infinibox):
+    tenant = Tenant(infinibox, {"id": 1, "capacity": {"used": 10, "total": 20}})
+    capacity = tenant.get_field("capacity", from_cache=True)
+    capacity.used = 15
+    capacity["extra"] = True
+    reread = tenant.get_field("capacity", from_cache=True)
+    assert reread is not capacity
+    assert reread == {"used": 10, "total": 20}
+
+
+def test_memoized_value_updated_with_cache(infinibox):
+    volume = infinibox.volumes.find().to_list()[0]
+    assert volume.get_name(from_cache=True) == "vol1"
+    volume.update_field_cache({"name": "renamed"})
+    assert volume.get_name(from_cache=True) == "renamed"
+
+
+def test_memoized_value_invalidated(infinibox, transport):
+    volume = infinibox.volumes.find().to_list()[0]
+    assert volume.get_name(from_cache=True) == "vol1"
+    transport.collections["volumes"][0]["name"] = "renamed"
+    volume.invalidate_cache("name")
+    assert volume.get_name(from_cache=True) == "renamed"
+    transport.collections["volumes"][0]["name"] = "renamed2"
+    volume.invalidate_cache()
+    assert volume.get_name() == "renamed2"
+
+
+def test_raw_value_not_memoized(infinibox):
+    volume = infinibox.volumes.find().to_list()[0]
+    assert volume.get_size(from_cache=True) == 1000000000 * byte
+    assert volume.get_field("size", from_cache=True, raw_value=True) == 1000000000
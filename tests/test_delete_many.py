@@ -0,0 +1,93 @@
+import pytest
+
+from infinisdk.core.exceptions import APICommandFailed
+from infinisdk.infinibox.bulk_delete import get_deletion_dependencies
+
+
+@pytest.fixture(autouse=True)
+def unmapped_volumes(transport):
+    for volume in transport.collections["volumes"]:
+        volume.update(mapped=False, parent_id=None)
+
+
+@pytest.fixture
+def snapshot_chain(transport):
+    volumes = transport.collections["volumes"]
+    volumes[1]["parent_id"] = 1
+    volumes[2]["parent_id"] = 2
+
+
+def _get_volumes(infinibox, ids):
+    return [infinibox.volumes.get_by_id_lazy(volume_id) for volume_id in ids]
+
+
+def _get_deleted_ids(transport):
+    return [
+        int(request.path.split("/")[1])
+        for request in transport.get_sent(method="DELETE")
+    ]
+
+
+@pytest.mark.usefixtures("snapshot_chain")
+def test_deletion_dependencies(infinibox):
+    first, second, third, fourth = _get_volumes(infinibox, [1, 2, 3, 4])
+    assert get_deletion_dependencies(infinibox, [first, second, third, fourth]) == {
+        first: {second},
+        second: {third},
+        third: set(),
+        fourth: set(),
+    }
+
+
+@pytest.mark.usefixtures("snapshot_chain")
+def test_delete_many_deletes_children_first(infinibox, transport):
+    volumes = _get_volumes(infinibox, [1, 2, 3, 4])
+    results = infinibox.delete_many(volumes)
+    assert [result.obj for result in results] == volumes
+    assert all(result.succeeded for result in results)
+    deleted_ids = _get_deleted_ids(transport)
+    assert sorted(deleted_ids) == [1, 2, 3, 4]
+    assert deleted_ids.index(3) < deleted_ids.index(2) < deleted_ids.index(1)
+
+
+@pytest.mark.usefixtures("snapshot_chain")
+def test_delete_many_prefetches_dependency_fields(infinibox, transport):
+    infinibox.delete_many(_get_volumes(infinibox, [1, 2, 3, 4]))
+    [fields_request] = transport.get_sent("volumes", method="GET")
+    assert fields_request.params["id"] == "in:(1,2,3,4)"
+    assert set(fields_request.params["fields"].split(",")) == {
+        "id",
+        "mapped",
+        "parent_id",
+    }
+
+
+@pytest.mark.usefixtures("snapshot_chain")
+def test_delete_many_skips_dependents_of_failures(infinibox, transport):
+    transport.failing_deletes.add(3)
+    volumes = _get_volumes(infinibox, [1, 2, 3, 4])
+    first, second, third, fourth = infinibox.delete_many(volumes, parallelism=4)
+    assert isinstance(third.exception, APICommandFailed)
+    assert second.skipped and first.skipped
+    assert fourth.succeeded
+    assert sorted(_get_deleted_ids(transport)) == [3, 4]
+
+
+def test_delete_many_concurrently(infinibox, transport):
+    volumes = _get_volumes(infinibox, range(1, 21))
+    results = infinibox.delete_many(volumes, parallelism=8)
+    assert all(result.succeeded for result in results)
+    assert sorted(_get_deleted_ids(transport)) == list(range(1, 21))
+    assert len(transport.collections["volumes"]) == 100
+
+
+def test_hosts_are_deleted_after_mapped_volumes(infinibox, transport):
+    transport.collections["volumes"][0]["mapped"] = True
+    transport.collections["hosts"] = [{"id": 1, "name": "host1"}]
+    mapped, unmapped = _get_volumes(infinibox, [1, 2])
+    host = infinibox.hosts.get_by_id_lazy(1)
+    assert get_deletion_dependencies(infinibox, [host, mapped, unmapped]) == {
+        host: {mapped},
+        mapped: set(),
+        unmapped: set(),
+    }
@@ -0,0 +1,135 @@
+import itertools
+
+import flux
+import pytest
+from click.testing import CliRunner
+
+from infinisdk import Q, entry_point
+from infinisdk.core.events import load_events_cursor
+
+from .utils import make_event
+
+
+@pytest.fixture(autouse=True)
+def virtual_timeline():
+    prev = flux.current_timeline.get()
+    timeline = flux.Timeline()
+    timeline.set_time_factor(0)
+    flux.current_timeline.set(timeline)
+    try:
+        yield
+    finally:
+        flux.current_timeline.set(prev)
+
+
+@pytest.fixture
+def events(transport):
+    returned = transport.collections["events"]
+    returned.extend(make_event(event_id) for event_id in range(1, 4))
+    return returned
+
+
+@pytest.fixture
+def cursor_file(tmpdir):
+    return str(tmpdir.join("events.cursor"))
+
+
+def _add_events_on_poll(transport, events, new_event_ids):
+    """Adds one of the given events each time the events are polled"""
+    new_event_ids = iter(new_event_ids)
+
+    def interceptor(request):
+        if request.path == "events" and request.params.get("sort") == "id":
+            event_id = next(new_event_ids, None)
+            if event_id is not None:
+                events.append(make_event(event_id))
+        return None
+
+    transport.interceptor = interceptor
+
+
+def test_follow_yields_new_events(infinibox, transport, events):
+    _add_events_on_poll(transport, events, [4, 5, 6])
+    followed = infinibox.events.follow()
+    assert [event.id for event in itertools.islice(followed, 3)] == [4, 5, 6]
+
+
+def test_follow_since_id(infinibox, events):  # pylint: disable=unused-argument
+    followed = infinibox.events.follow(since_id=1)
+    assert [event.id for event in itertools.islice(followed, 2)] == [2, 3]
+
+
+def test_follow_predicates(infinibox, transport, events):
+    events.append(make_event(4, level="ERROR"))
+    followed = infinibox.events.follow(Q.level == "ERROR", since_id=0)
+    assert next(followed).id == 4
+    polls = [
+        request
+        for request in transport.get_sent("events")
+        if request.params.get("sort") == "id"
+    ]
+    assert polls[0].params["level"] == "eq:ERROR"
+    assert polls[0].params["id"] == "gt:0"
+
+
+def test_cursor_saved_after_consumption(infinibox, events, cursor_file):
+    assert load_events_cursor(cursor_file) is None
+    followed = infinibox.events.follow(since_id=0, cursor_file=cursor_file)
+    assert [event.id for event in itertools.islice(followed, 3)] == [1, 2, 3]
+    followed.close()
+    # the last event was yielded but the next one wasn't requested
+    assert load_events_cursor(cursor_file) == 2
+    events.append(make_event(4))
+    resumed = infinibox.events.follow(since_id=0, cursor_file=cursor_file)
+    assert [event.id for event in itertools.islice(resumed, 2)] == [3, 4]
+
+
+def test_event_yielded_again_after_consumer_failure(infinibox, events, cursor_file):
+    with pytest.raises(ZeroDivisionError):
+        for event in infinibox.events.follow(since_id=0, cursor_file=cursor_file):
+            if event.id == 2:
+                1 / 0  # pylint: disable=pointless-statement
+    assert load_events_cursor(cursor_file) == 1
+    resumed = infinibox.events.follow(cursor_file=cursor_file)
+    assert next(resumed).id == 2
+
+
+def test_cursor_saved_after_each_batch(infinibox, transport, events, cursor_file):
+    _add_events_on_poll(transport, events, [None, 4])
+    followed = infinibox.events.follow(since_id=0, cursor_file=cursor_file)
+    assert [event.id for event in itertools.islice(followed, 4)] == [1, 2, 3, 4]
+    assert load_events_cursor(cursor_file) == 3
+
+
+def test_load_events_cursor_without_path():
+    assert load_events_cursor(None) is None
+
+
+def test_events_tail_command(infinibox, events, monkeypatch):
+    monkeypatch.setattr(
+        entry_point, "_get_system_object", lambda *args, **kwargs: infinibox
+    )
+    result = CliRunner().invoke(
+        entry_point.events_tail,
+        ["-s", "fake-system", "-n", "2", "--no-color", "--utc-time"],
+    )
+    assert result.exit_code == 0, result.output
+    lines = result.output.splitlines()
+    assert len(lines) == 2
+    assert "EVENT_2" in lines[0]
+    assert "EVENT_3" in lines[1]
+
+
+def test_events_tail_command_level(infinibox, events, monkeypatch):
+    events.append(make_event(4, level="ERROR"))
+    monkeypatch.setattr(
+        entry_point, "_get_system_object", lambda *args, **kwargs: infinibox
+    )
+    result = CliRunner().invoke(
+        entry_point.events_tail,
+        ["-s", "fake-system", "-n", "2", "-l", "ERROR", "--no-color"],
+    )
+    assert result.exit_code == 0, result.output
+    lines = result.output.splitlines()
+    assert len(lines) == 1
+    assert "EVENT_4" in lines[0]
@@ -0,0 +1,62 @@
+import arrow
+import pytest
+from capacity import byte
+
+from infinisdk.core.field_decoder import get_decoder_plan
+from infinisdk.infinibox.volume import Volume
+
+_API_VOLUME = {
+    "id": 1,
+    "name": "vol1",
+    "size": 1000000000,
+    "pool_id": 1,
+    "created_at": 1600000000000,
+    "unknown_field": "x",
+}
+
+
+@pytest.mark.parametrize("field_name", ["id", "name", "size", "created_at", "pool"])
+def test_plan_decodes_like_binding(infinibox, field_name):
+    volume = Volume(infinibox, dict(_API_VOLUME))
+    [step] = get_decoder_plan(Volume, (field_name,))
+    field = Volume.fields[field_name]
+    expected = field.binding.get_value_from_api_object(
+        infinibox, Volume, volume, _API_VOLUME
+    )
+    assert step.decode(infinibox, Volume, volume, _API_VOLUME) == expected
+
+
+def test_plan_decodes_typed_values(infinibox):
+    volume = Volume(infinibox, dict(_API_VOLUME))
+    values = volume.get_fields(["size", "created_at", "unknown_field"], from_cache=True)
+    assert values["size"] == 1000000000 * byte
+    assert values["created_at"] == arrow.get(1600000000)
+    assert values["unknown_field"] == "x"
+
+
+def test_related_field_decoded_by_binding():
+    [step] = get_decoder_plan(Volume, ("pool",))
+    assert step.decode_api_value is None
+    [step] = get_decoder_plan(Volume, ("size",))
+    assert step.decode_api_value is not None
+
+
+def test_missing_field_raises_key_error(infinibox):
+    volume = Volume(infinibox, {"id": 1})
+    [step] = get_decoder_plan(Volume, ("size",))
+    with pytest.raises(KeyError):
+        step.decode(infinibox, Volume, volume, {"id": 1})
+
+
+def test_plans_are_memoized():
+    plan = get_decoder_plan(Volume, ("name", "size"))
+    assert get_decoder_plan(Volume, ("name", "size")) is plan
+    assert get_decoder_plan(Volume, ("size", "name")) is not plan
+
+
+def test_memoized_plans_are_bounded():
+    max_plans = get_decoder_plan.cache_info().maxsize
+    assert max_plans is not None
+    for index in range(max_plans + 10):
+        get_decoder_plan(Volume, ("name", "fabricated_{}".format(index)))
+    assert get_decoder_plan.cache_info().currsize == max_plans
@@ -0,0 +1,146 @@
+import threading
+
+import pytest
+
+from infinisdk import InfiniBoxFleet
+from infinisdk.core.exceptions import FleetOperationFailed
+
+from .utils import FakeTransport, make_system, make_volumes
+
+
+@pytest.fixture
+def fleet():
+    returned = InfiniBoxFleet(max_workers=4)
+    for index in range(3):
+        transport = FakeTransport()
+        transport.collections["volumes"] = make_volumes(index + 1)
+        returned.add_system(
+            make_system(transport, address=("fake-{}".format(index), 80))
+        )
+    return returned
+
+
+def test_map(fleet):
+    results = fleet.map(lambda system: system.volumes.count())
+    assert [result.system for result in results] == fleet.get_systems()
+    assert results.get_values() == [1, 2, 3]
+    assert not results.get_failed()
+
+
+def test_map_failure(fleet):
+    failing = fleet.get_systems()[1]
+
+    def func(system):
+        if system is failing:
+            raise ZeroDivisionError()
+        return 1
+
+    results = fleet.map(func)
+    assert results.get_values() == [1, 1]
+    [failed] = results.get_failed()
+    assert failed.system is failing
+    assert isinstance(failed.exception, ZeroDivisionError)
+    with pytest.raises(FleetOperationFailed):
+        results.raise_on_failure()
+
+
+def test_map_timeout(fleet):
+    slow = fleet.get_systems()[0]
+    release = threading.Event()
+
+    def func(system):
+        if system is slow:
+            release.wait(timeout=5)
+        return 1
+
+    try:
+        results = fleet.map(func, timeout_seconds=0.1)
+    finally:
+        release.set()
+    [failed] = results.get_failed()
+    assert failed.system is slow
+    assert failed.timed_out
+    assert results.get_values() == [1, 1]
+
+
+def test_requests_limited_to_operation_timeout(fleet):
+    system = fleet.get_systems()[0]
+    system.api.set_request_default_timeout(30)
+    results = fleet.map(
+        lambda system: system.api.get_request_default_timeout(), timeout_seconds=5
+    )
+    assert results.get_values() == [5, 5, 5]
+    assert system.api.get_request_default_timeout() == 30
+
+
+def test_shorter_request_timeout_kept(fleet):
+    system = fleet.get_systems()[0]
+    system.api.set_request_default_timeout(1)
+    results = fleet.map(
+        lambda system: system.api.get_request_default_timeout(), timeout_seconds=5
+    )
+    assert results.get_values()[0] == 1
+
+
+def test_no_timeout_by_default(fleet):
+    results = fleet.map(lambda system: system.api.get_request_default_timeout())
+    assert results.get_values() == [
+        system.api.get_request_default_timeout() for system in fleet
+    ]
+
+
+def test_iter_merged(fleet):
+    items = list(fleet.iter_merged(lambda system: system.volumes.find()))
+    systems = fleet.get_systems()
+    assert sorted((systems.index(system), volume.id) for system, volume in items) == [
+        (0, 1),
+        (1, 1),
+        (1, 2),
+        (2, 1),
+        (2, 2),
+        (2, 3),
+    ]
+
+
+def test_iter_merged_failure(fleet):
+    failing = fleet.get_systems()[2]
+
+    def func(system):
+        if system is failing:
+            raise ZeroDivisionError()
+        return system.volumes.find()
+
+    received = []
+    with pytest.raises(FleetOperationFailed) as caught:
+        for system, volume in fleet.iter_merged(func):
+            received.append((system, volume.id))
+    assert len(received) == 3
+    [failed] = caught.value.failures
+    assert failed.system is failing
+
+
+def test_iter_merged_timeout(fleet):
+    slow = fleet.get_systems()[0]
+    release = threading.Event()
+
+    def func(system):
+        if system is slow:
+            release.wait(timeout=5)
+        return [system.get_name()]
+
+    try:
+        with pytest.raises(FleetOperationFailed) as caught:
+            list(fleet.iter_merged(func, timeout_seconds=0.1))
+    finally:
+        release.set()
+    [failed] = caught.value.failures
+    assert failed.system is slow
+    assert failed.timed_out
+
+
+def test_systems_registered_as_related(fleet):
+    first, second, third = fleet.get_systems()
+    assert set(first.iter_related_systems()) == {second, third}
+    fleet.remove_system(third)
+    assert set(first.iter_related_systems()) == {second}
+    assert not set(third.iter_related_systems())
@@ -0,0 +1,59 @@
+import copy
+import gc
+
+
+def _find_volume(infinibox, volume_id):
+    [returned] = infinibox.volumes.find(id=volume_id).to_list()
+    return returned
+
+
+def test_identity_map_disabled_by_default(infinibox):
+    assert not infinibox.is_identity_map_enabled()
+    assert _find_volume(infinibox, 1) is not _find_volume(infinibox, 1)
+
+
+def test_identity_map_shares_objects(infinibox):
+    infinibox.enable_identity_map()
+    volume = _find_volume(infinibox, 1)
+    assert _find_volume(infinibox, 1) is volume
+    assert infinibox.volumes.get_by_id_lazy(1) is volume
+    assert _find_volume(infinibox, 2) is not volume
+
+
+def test_identity_map_updates_cache_of_existing_object(infinibox, transport):
+    infinibox.enable_identity_map()
+    volume = _find_volume(infinibox, 1)
+    transport.collections["volumes"][0]["name"] = "renamed"
+    _find_volume(infinibox, 1)
+    assert volume.get_name(from_cache=True) == "renamed"
+
+
+def test_identity_map_releases_unreferenced_objects(infinibox):
+    infinibox.enable_identity_map()
+    _find_volume(infinibox, 1)
+    gc.collect()
+    assert not infinibox.get_identity_map()
+
+
+def test_identity_map_created_and_deleted_objects(infinibox):
+    infinibox.enable_identity_map()
+    volume = infinibox.volumes.create(pool=infinibox.pools.get_by_id_lazy(1))
+    assert infinibox.volumes.get_by_id_lazy(volume.id) is volume
+    volume.delete()
+    assert volume.get_unique_key() not in infinibox.get_identity_map()
+
+
+def test_identity_map_deep_copy_is_distinct(infinibox):
+    infinibox.enable_identity_map()
+    volume = _find_volume(infinibox, 1)
+    copied = copy.deepcopy(volume)
+    assert copied is not volume
+    assert infinibox.volumes.get_by_id_lazy(1) is volume
+
+
+def test_disable_identity_map(infinibox):
+    infinibox.enable_identity_map()
+    volume = _find_volume(infinibox, 1)
+    infinibox.disable_identity_map()
+    assert infinibox.get_identity_map() is None
+    assert _find_volume(infinibox, 1) is not volume
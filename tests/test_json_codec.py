@@ -0,0 +1,105 @@
+import json
+
+import pytest
+
+from infinisdk.core.api.json_codec import (
+    _CODECS,
+    JSONCodec,
+    OrjsonCodec,
+    UjsonCodec,
+    get_json_codec,
+)
+from infinisdk.core.config import config
+
+_AVAILABLE_CODECS = [codec for codec in _CODECS if codec.is_available()]
+
+_OBJECTS = [
+    {"name": "vol", "size": 1000000000, "ratio": 0.1 + 0.2, "ids": [1, 2, 3]},
+    {"name": "עברית-名前-é", "nested": {"a": None, "b": True, "c": "x/y"}},
+    {"id": 2**70, "negative": -(2**63) - 1, "max": 2**64 - 1},
+    [],
+    "",
+]
+
+
+@pytest.fixture(params=_AVAILABLE_CODECS, ids=lambda codec: codec.name)
+def codec(request):
+    return request.param
+
+
+@pytest.mark.parametrize("obj", _OBJECTS)
+def test_dumps_parity(codec, obj):
+    encoded = codec.dumps(obj)
+    assert isinstance(encoded, str)
+    assert encoded.isascii()
+    assert json.loads(encoded) == obj
+
+
+@pytest.mark.parametrize("obj", _OBJECTS)
+def test_loads_parity(codec, obj):
+    encoded = json.dumps(obj, ensure_ascii=False)
+    assert codec.loads(encoded) == obj
+    assert codec.loads(encoded.encode("utf-8")) == obj
+
+
+@pytest.mark.parametrize("obj", _OBJECTS)
+def test_round_trip(codec, obj):
+    assert codec.loads(codec.dumps(obj)) == obj
+    assert codec.loads(codec.dumps_pretty(obj)) == obj
+
+
+def test_large_integers_keep_their_type(codec):
+    decoded = codec.loads(b'{"id": 123456789012345678901234567890}')
+    assert decoded["id"] == 123456789012345678901234567890
+    assert isinstance(decoded["id"], int)
+
+
+def test_dumps_unsupported_type(codec):
+    with pytest.raises(TypeError):
+        codec.dumps({"value": object()})
+
+
+def test_loads_invalid_json(codec):
+    with pytest.raises(ValueError):
+        codec.loads(b'{"result": [1, 2')
+
+
+def test_get_json_codec_by_name():
+    assert isinstance(get_json_codec("json"), JSONCodec)
+    config.root.api.json_codec = "json"
+    assert type(get_json_codec()) is JSONCodec  # pylint: disable=unidiomatic-typecheck
+
+
+def test_get_json_codec_auto_prefers_fastest():
+    expected = _AVAILABLE_CODECS[0]
+    assert get_json_codec("auto") is expected
+
+
+@pytest.mark.parametrize("codec_type", [OrjsonCodec, UjsonCodec])
+def test_get_json_codec_falls_back_when_not_installed(codec_type):
+    returned = get_json_codec(codec_type.name)
+    assert returned.is_available()
+    if codec_type().is_available():
+        assert isinstance(returned, codec_type)
+
+
+def test_get_json_codec_unknown_name():
+    with pytest.raises(ValueError):
+        get_json_codec("nonexistent")
+
+
+@pytest.mark.parametrize("codec_name", [codec.name for codec in _AVAILABLE_CODECS])
+def test_non_ascii_request_body(infinibox, transport, codec_name):
+    config.root.api.json_codec = codec_name
+    infinibox.api.post("volumes", data={"name": "vol-אב", "id_hint": 2**70})
+    [sent] = transport.get_sent("volumes", method="POST")
+    assert sent.raw_body.isascii()
+    assert sent.body == {"name": "vol-אב", "id_hint": 2**70}
+
+
+@pytest.mark.parametrize("codec_name", [codec.name for codec in _AVAILABLE_CODECS])
+def test_non_ascii_response(infinibox, transport, codec_name):
+    config.root.api.json_codec = codec_name
+    transport.collections["volumes"][0]["name"] = "vol-אב"
+    volume = infinibox.volumes.get_by_id(1)
+    assert volume.get_name() == "vol-אב"
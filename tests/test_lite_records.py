@@ -0,0 +1,63 @@
+import pytest
+from capacity import GB
+
+from infinisdk.core.exceptions import CacheMiss
+from infinisdk.core.lite_record import LiteRecord
+
+
+def test_lite_query(infinibox):
+    records = infinibox.volumes.find().lite().to_list()
+    assert len(records) == 120
+    record = records[0]
+    assert isinstance(record, LiteRecord)
+    assert not hasattr(record, "__dict__")
+    assert record.id == 1
+    assert record.get_name() == "vol1"
+    assert record.get_size() == GB
+    assert record.get_field("name") == "vol1"
+
+
+def test_lite_records_never_fetch(infinibox, transport):
+    [record] = infinibox.volumes.find(id=1).only_fields(["name"]).lite().to_list()
+    transport.sent.clear()
+    assert record.get_name() == "vol1"
+    with pytest.raises(CacheMiss):
+        record.get_size()
+    assert transport.sent == []
+
+
+def test_lite_records_are_read_only(infinibox):
+    [record] = infinibox.volumes.find(id=1).lite().to_list()
+    with pytest.raises(AttributeError):
+        record.name = "other"
+    with pytest.raises(AttributeError):
+        del record.id
+
+
+def test_lite_record_related_object(infinibox):
+    [record] = infinibox.volumes.find(id=1).lite().to_list()
+    assert record.get_pool() == infinibox.pools.get_by_id_lazy(1)
+
+
+def test_lite_record_to_object(infinibox, transport):
+    [record] = infinibox.volumes.find(id=1).lite().to_list()
+    transport.sent.clear()
+    volume = record.to_object()
+    assert volume == infinibox.volumes.get_by_id_lazy(1)
+    assert volume.get_name(from_cache=True) == "vol1"
+    assert volume.get_size(from_cache=True) == GB
+    assert transport.sent == []
+
+
+def test_lite_record_equality(infinibox):
+    [first] = infinibox.volumes.find(id=1).lite().to_list()
+    [second] = infinibox.volumes.find(id=1).lite().to_list()
+    [other] = infinibox.volumes.find(id=2).lite().to_list()
+    assert first == second
+    assert hash(first) == hash(second)
+    assert first != other
+
+
+def test_lite_record_get_fields(infinibox):
+    [record] = infinibox.volumes.find(id=1).only_fields(["name"]).lite().to_list()
+    assert record.get_fields() == {"id": 1, "name": "vol1"}
@@ -0,0 +1,74 @@
+import pytest
+
+from infinisdk.core.api.metrics import APIMetrics, LatencyHistogram, get_path_template
+from infinisdk.core.exceptions import APICommandFailed
+
+
+@pytest.mark.parametrize(
+    "path,expected",
+    [
+        ("/api/rest/volumes/1001/luns?page=2", "/api/rest/volumes/{id}/luns"),
+        ("/api/rest/volumes", "/api/rest/volumes"),
+        (
+            "/api/rest/users/8f14e45f-ceea-467f-a0e6-b1c2d3e4f5a6",
+            "/api/rest/users/{id}",
+        ),
+        ("/api/rest/pools/pool1", "/api/rest/pools/pool1"),
+    ],
+)
+def test_get_path_template(path, expected):
+    assert get_path_template(path) == expected
+
+
+def test_latency_histogram_percentiles():
+    histogram = LatencyHistogram()
+    for millis in range(1, 1001):
+        histogram.record(millis / 1000.0)
+    assert histogram.count == 1000
+    assert histogram.p50 == pytest.approx(0.5, rel=0.02)
+    assert histogram.p95 == pytest.approx(0.95, rel=0.02)
+    assert histogram.p99 == pytest.approx(0.99, rel=0.02)
+    assert histogram.get_percentile(100) == histogram.max_seconds == 1.0
+
+
+def test_latency_histogram_empty():
+    assert LatencyHistogram().p50 is None
+
+
+def test_api_metrics(infinibox, transport):
+    infinibox.api.metrics.reset()
+    infinibox.api.get("volumes/1")
+    infinibox.api.get("volumes/2")
+    with pytest.raises(APICommandFailed):
+        infinibox.api.get("volumes/100000")
+    infinibox.api.post("volumes", data={"name": "new_volume"})
+    volume_metrics = infinibox.api.metrics.get("GET", "/api/rest/volumes/5")
+    assert volume_metrics.path_template == "/api/rest/volumes/{id}"
+    assert volume_metrics.count == 3
+    assert volume_metrics.errors == 1
+    assert volume_metrics.bytes_sent == 0
+    assert volume_metrics.bytes_received > 0
+    assert volume_metrics.latency.count == 3
+    create_metrics = infinibox.api.metrics.get("post", "/api/rest/volumes")
+    assert create_metrics.count == 1
+    [create_request] = transport.get_sent("volumes", method="POST")
+    assert create_metrics.bytes_sent == len(create_request.raw_body)
+    assert infinibox.api.metrics.get("DELETE", "/api/rest/volumes/1") is None
+
+
+def test_prometheus_text():
+    metrics = APIMetrics()
+    metrics.record("get", "/api/rest/volumes/1", 0.01, status_code=200)
+    metrics.record("get", "/api/rest/volumes/2", 0.02, status_code=404)
+    lines = metrics.to_prometheus_text().splitlines()
+    labels = 'method="GET",path="/api/rest/volumes/{id}"'
+    assert "# TYPE infinisdk_api_requests_total counter" in lines
+    assert "infinisdk_api_requests_total{%s} 2" % labels in lines
+    assert "infinisdk_api_errors_total{%s} 1" % labels in lines
+    assert "infinisdk_api_request_duration_seconds_count{%s} 2" % labels in lines
+    assert any(
+        line.startswith(
+            'infinisdk_api_request_duration_seconds{%s,quantile="0.5"}' % labels
+        )
+        for line in lines
+    )
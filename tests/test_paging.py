@@ -0,0 +1,72 @@
+import pytest
+
+from infinisdk.core.config import config
+
+from .utils import get_fetched_indexes, get_fetched_pages, make_volumes
+
+NUM_VOLUMES = 2500
+
+
+@pytest.fixture
+def transport(transport):  # pylint: disable=redefined-outer-name
+    transport.collections["volumes"] = make_volumes(NUM_VOLUMES)
+    return transport
+
+
+def test_default_page_size_from_config(infinibox, transport):
+    config.root.api.page_size = 700
+    assert len(list(infinibox.volumes.find())) == NUM_VOLUMES
+    assert get_fetched_pages(transport) == [(1, 700), (2, 700), (3, 700), (4, 700)]
+
+
+def test_explicit_page_size_overrides_config(infinibox, transport):
+    config.root.api.page_size = 700
+    list(infinibox.volumes.find().page_size(1000))
+    assert get_fetched_pages(transport) == [(1, 1000), (2, 1000), (3, 1000)]
+
+
+@pytest.mark.parametrize("probe", [len, bool])
+def test_len_then_iterate_fetches_each_page_once(infinibox, transport, probe):
+    query = infinibox.volumes.find()
+    assert probe(query)
+    assert get_fetched_pages(transport) == [(1, 1000)]
+    assert [volume.id for volume in query] == list(range(1, NUM_VOLUMES + 1))
+    assert get_fetched_pages(transport) == [(1, 1000), (2, 1000), (3, 1000)]
+
+
+def test_to_list_fetches_each_page_once(infinibox, transport):
+    assert len(infinibox.volumes.find().to_list()) == NUM_VOLUMES
+    assert get_fetched_pages(transport) == [(1, 1000), (2, 1000), (3, 1000)]
+
+
+def test_len_of_requested_page(infinibox, transport):
+    assert len(infinibox.volumes.find().page_size(1000).page(3)) == 500
+    assert get_fetched_pages(transport) == [(3, 1000)]
+
+
+def test_prefetch_fetches_each_page_once(infinibox, transport):
+    infinibox.api.enable_thread_safety()
+    query = infinibox.volumes.find().page_size(500).prefetch(pages=3)
+    assert len(query) == NUM_VOLUMES
+    assert [volume.id for volume in query] == list(range(1, NUM_VOLUMES + 1))
+    assert sorted(get_fetched_pages(transport)) == [(page, 500) for page in range(1, 6)]
+
+
+def test_adaptive_page_size_fetches_each_object_once(infinibox, transport):
+    config.root.api.page_size = 100
+    config.root.api.adaptive_paging.max_page_size = 400
+    query = infinibox.volumes.find().adaptive_page_size()
+    assert len(query) == NUM_VOLUMES
+    assert [volume.id for volume in query] == list(range(1, NUM_VOLUMES + 1))
+    assert sorted(get_fetched_indexes(transport, NUM_VOLUMES)) == list(
+        range(NUM_VOLUMES)
+    )
+    assert {page_size for _, page_size in get_fetched_pages(transport)} != {100}
+
+
+def test_adaptive_page_size_respects_bounds(infinibox, transport):
+    config.root.api.adaptive_paging.min_page_size = 50
+    config.root.api.adaptive_paging.max_page_size = 200
+    list(infinibox.volumes.find().adaptive_page_size())
+    page_sizes = [page_size for _, page_size in get_fetched_pages(transport)]
+    assert all(50 <= page_size <= 200 for page_size in page_sizes)
@@ -0,0 +1,94 @@
+import pytest
+
+from infinisdk.core.config import config
+from infinisdk.core.persistent_cache import PersistentCache, get_persistent_cache
+
+from .utils import SYSTEM_INFO, make_system
+
+_CACHED_PATHS = ["_features", "events/types"]
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    returned = str(tmp_path / "cache.sqlite3")
+    config.root.persistent_cache.enabled = True
+    config.root.persistent_cache.path = returned
+    return returned
+
+
+def _start_system(transport):
+    returned = make_system(transport)
+    returned.login()
+    returned.events.get_levels()
+    return returned
+
+
+def _get_sent_cached_paths(transport):
+    return [request.path for request in transport.sent if request.path in _CACHED_PATHS]
+
+
+def test_persistent_cache_disabled_by_default():
+    assert get_persistent_cache() is None
+
+
+@pytest.mark.usefixtures("cache_path")
+def test_payloads_are_reused_by_later_systems(transport):
+    _start_system(transport)
+    assert set(_get_sent_cached_paths(transport)) == set(_CACHED_PATHS)
+    transport.sent.clear()
+    system = _start_system(transport)
+    assert _get_sent_cached_paths(transport) == []
+    assert system.events.get_levels() == ["INFO", "ERROR"]
+
+
+@pytest.mark.usefixtures("cache_path")
+def test_payloads_are_not_reused_after_upgrade(transport):
+    _start_system(transport)
+    transport.sent.clear()
+    upgraded_info = dict(SYSTEM_INFO, version="7.2.0")
+
+    def _intercept(sent):
+        if sent.path == "system":
+            fields = sent.params.get("fields")
+            if fields:
+                return 200, {
+                    "result": {key: upgraded_info[key] for key in fields.split(",")},
+                    "error": None,
+                    "metadata": None,
+                }
+            return 200, {"result": upgraded_info, "error": None, "metadata": None}
+        return None
+
+    transport.interceptor = _intercept
+    system = _start_system(transport)
+    assert set(_get_sent_cached_paths(transport)) == set(_CACHED_PATHS)
+    assert system.get_version() == "7.2.0"
+
+
+@pytest.mark.usefixtures("cache_path")
+def test_invalidate(transport):
+    system = _start_system(transport)
+    system.persistent_cache.invalidate()
+    transport.sent.clear()
+    _start_system(transport)
+    assert set(_get_sent_cached_paths(transport)) == set(_CACHED_PATHS)
+
+
+def test_cache_entry_version(cache_path):
+    cache = PersistentCache(cache_path, ttl_seconds=60)
+    cache.set("key", "name", {"a": 1}, version="1.0")
+    assert cache.get("key", "name", version="1.0") == {"a": 1}
+    assert cache.get("key", "name", version="2.0") is None
+    assert cache.get("other_key", "name", version="1.0") is None
+
+
+def test_cache_entry_expiry(cache_path):
+    cache = PersistentCache(cache_path, ttl_seconds=-1)
+    cache.set("key", "name", {"a": 1})
+    assert cache.get("key", "name") is None
+
+
+def test_unusable_cache_path(tmp_path):
+    cache = PersistentCache(str(tmp_path), ttl_seconds=60)
+    cache.set("key", "name", {"a": 1})
+    assert cache.get("key", "name") is None
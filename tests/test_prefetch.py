@@ -0,0 +1,99 @@
+import threading
+
+import pytest
+import waiting
+
+from infinisdk.core.exceptions import APICommandFailed
+
+from .utils import make_system, make_volumes
+
+NUM_VOLUMES = 1000
+
+
+@pytest.fixture
+def transport(transport):  # pylint: disable=redefined-outer-name
+    transport.collections["volumes"] = make_volumes(NUM_VOLUMES)
+    return transport
+
+
+@pytest.fixture
+def infinibox(infinibox):  # pylint: disable=redefined-outer-name
+    infinibox.api.enable_thread_safety()
+    return infinibox
+
+
+def _get_prefetching_threads():
+    return [
+        thread
+        for thread in threading.enumerate()
+        if thread.name.startswith("infinisdk-prefetch")
+    ]
+
+
+def test_prefetch_requires_thread_safety(transport):
+    system = make_system(transport)
+    with pytest.raises(AssertionError):
+        system.volumes.find().prefetch(pages=2)
+
+
+def test_prefetch_keeps_order(infinibox, transport):
+    page_events = {}
+
+    def interceptor(request):
+        # later pages are answered first
+        page = int(request.params.get("page", 1))
+        if request.path == "volumes" and page in (2, 3):
+            page_events.setdefault(page, threading.Event())
+            page_events.setdefault(page + 1, threading.Event()).wait(timeout=5)
+        if request.path == "volumes":
+            page_events.setdefault(page, threading.Event()).set()
+        return None
+
+    transport.interceptor = interceptor
+    query = infinibox.volumes.find().page_size(100).prefetch(pages=3)
+    assert [volume.id for volume in query] == list(range(1, NUM_VOLUMES + 1))
+
+
+def test_prefetch_applies_request_context(infinibox, transport):
+    with infinibox.api.added_headers_context({"X-Test": "1"}):
+        list(infinibox.volumes.find().page_size(100).prefetch(pages=2))
+    sent = transport.get_sent("volumes")
+    assert len(sent) == 10
+    assert all(request.headers.get("X-Test") == "1" for request in sent)
+
+
+def test_prefetch_worker_error(infinibox, transport):
+    def interceptor(request):
+        if request.path == "volumes" and request.params.get("page") == "4":
+            return 500, {"result": None, "error": {"code": "ERROR"}, "metadata": None}
+        return None
+
+    transport.interceptor = interceptor
+    received = []
+    with pytest.raises(APICommandFailed):
+        for volume in infinibox.volumes.find().page_size(100).prefetch(pages=2):
+            received.append(volume.id)
+    assert received == list(range(1, 301))
+    waiting.wait(
+        lambda: not _get_prefetching_threads(), timeout_seconds=5, sleep_seconds=0.01
+    )
+
+
+def test_prefetch_stops_when_iteration_stops(infinibox, transport):
+    release = threading.Event()
+
+    def interceptor(request):
+        if request.path == "volumes" and request.params.get("page") != "1":
+            release.wait(timeout=5)
+        return None
+
+    transport.interceptor = interceptor
+    iterator = iter(infinibox.volumes.find().page_size(100).prefetch(pages=2))
+    assert next(iterator).id == 1
+    iterator.close()
+    release.set()
+    waiting.wait(
+        lambda: not _get_prefetching_threads(), timeout_seconds=5, sleep_seconds=0.01
+    )
+    pages = {request.params["page"] for request in transport.get_sent("volumes")}
+    assert pages == {"1", "2", "3"}
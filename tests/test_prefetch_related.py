@@ -0,0 +1,51 @@
+import pytest
+
+
+@pytest.fixture
+def volumes_in_two_pools(transport):
+    for volume in transport.collections["volumes"][::2]:
+        volume["pool_id"] = 2
+
+
+def _get_pool_requests(transport):
+    return transport.get_sent("pools", method="GET")
+
+
+@pytest.mark.usefixtures("volumes_in_two_pools")
+def test_prefetch_related(infinibox, transport):
+    volumes = infinibox.volumes.find().prefetch_related("pool").to_list()
+    [pools_request] = _get_pool_requests(transport)
+    assert pools_request.params["id"] == "in:(2,1)"
+    transport.sent.clear()
+    pool_names = {volume.get_pool().get_name(from_cache=True) for volume in volumes}
+    assert pool_names == {"pool1", "pool2"}
+    assert transport.sent == []
+
+
+@pytest.mark.usefixtures("volumes_in_two_pools")
+def test_prefetch_related_shares_related_objects(infinibox):
+    volumes = infinibox.volumes.find().prefetch_related("pool").to_list()
+    assert volumes[0].get_pool() is volumes[2].get_pool()
+    assert volumes[0].get_pool() is not volumes[1].get_pool()
+
+
+@pytest.mark.usefixtures("volumes_in_two_pools")
+def test_prefetch_related_fetches_each_object_once(infinibox, transport):
+    infinibox.volumes.find().page_size(50).prefetch_related("pool").to_list()
+    assert len(transport.get_sent("volumes", method="GET")) == 3
+    [pools_request] = _get_pool_requests(transport)
+    assert pools_request.params["id"] == "in:(2,1)"
+
+
+def test_prefetch_related_without_related_objects(infinibox, transport):
+    transport.collections["volumes"] = [
+        dict(volume, pool_id=None) for volume in transport.collections["volumes"]
+    ]
+    volumes = infinibox.volumes.find().prefetch_related("pool").to_list()
+    assert _get_pool_requests(transport) == []
+    assert volumes[0].get_pool(from_cache=True) is None
+
+
+def test_prefetch_related_requires_related_field(infinibox):
+    with pytest.raises(ValueError):
+        infinibox.volumes.find().prefetch_related("name")
@@ -0,0 +1,93 @@
+import threading
+
+from .utils import make_volumes
+
+NUM_VOLUMES = 250
+
+
+def _get_requested_fields(transport):
+    return [
+        request.params.get("fields")
+        for request in transport.get_sent("volumes", method="GET")
+    ]
+
+
+def test_fields_hint(infinibox, transport):
+    volumes = infinibox.volumes.find().fields_hint("name", "size").to_list()
+    assert _get_requested_fields(transport) == ["id,name,size"]
+    assert volumes[0].get_name(from_cache=True) == "vol1"
+    assert volumes[0].get_size(from_cache=True) is not None
+
+
+def test_fields_hint_unhinted_field_fetched_on_access(infinibox, transport):
+    [volume] = infinibox.volumes.find().fields_hint("name").page_size(1).page(1)
+    transport.sent.clear()
+    assert volume.get_allocated() is not None
+    [request] = transport.sent
+    assert request.path == "volumes/1"
+
+
+def test_fields_hint_unknown_field(infinibox, transport):
+    infinibox.volumes.find().fields_hint("some_new_field").to_list()
+    assert _get_requested_fields(transport) == ["id,some_new_field"]
+
+
+def test_fields_hint_combined_with_only_fields(infinibox, transport):
+    infinibox.volumes.find().only_fields(["allocated"]).fields_hint("name").to_list()
+    assert sorted(_get_requested_fields(transport)[0].split(",")) == [
+        "allocated",
+        "id",
+        "name",
+    ]
+
+
+def test_fields_hint_applies_to_its_query_only(infinibox, transport):
+    infinibox.volumes.find().fields_hint("name")
+    infinibox.volumes.find().to_list()
+    assert _get_requested_fields(transport) == [None]
+
+
+def test_concurrent_queries_keep_their_hints(infinibox, transport):
+    transport.collections["volumes"] = make_volumes(NUM_VOLUMES)
+    infinibox.api.enable_thread_safety()
+    barrier = threading.Barrier(2)
+    errors = []
+
+    def _iterate(field_name):
+        try:
+            query = infinibox.volumes.find().page_size(10).fields_hint(field_name)
+            barrier.wait(timeout=5)
+            for volume in query:
+                assert set(
+                    volume.get_fields(from_cache=True, fetch_if_not_cached=False)
+                )
+        except Exception as e:  # pylint: disable=broad-except
+            errors.append(e)
+
+    threads = [
+        threading.Thread(target=_iterate, args=(field_name,))
+        for field_name in ("name", "size")
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+    assert sorted(set(_get_requested_fields(transport))) == ["id,name", "id,size"]
+
+
+def test_learn_fields(infinibox, transport):
+    transport.collections["volumes"] = make_volumes(NUM_VOLUMES)
+    names = [
+        volume.get_name()
+        for volume in infinibox.volumes.find().page_size(100).learn_fields()
+    ]
+    assert len(names) == NUM_VOLUMES
+    assert _get_requested_fields(transport) == [None, "id,name", "id,name"]
+
+
+def test_learn_fields_all_fields_read(infinibox, transport):
+    transport.collections["volumes"] = make_volumes(NUM_VOLUMES)
+    for volume in infinibox.volumes.find().page_size(100).learn_fields():
+        volume.get_fields()
+    assert _get_requested_fields(transport) == [None, None, None]
@@ -0,0 +1,56 @@
+import pytest
+
+from infinisdk.infinibox.components import ComponentChange
+
+
+@pytest.fixture
+def components(infinibox):
+    returned = infinibox.components
+    returned.refresh_changed()
+    return returned
+
+
+def test_first_refresh_reports_new_components(infinibox):
+    changes = infinibox.components.refresh_changed()
+    new_components = [
+        change.component for change in changes if change.field_name is None
+    ]
+    assert len(infinibox.components.nodes.find().to_list()) == 3
+    assert set(infinibox.components.nodes.find().to_list()) <= set(new_components)
+
+
+def test_refresh_without_changes(components):
+    assert components.refresh_changed() == []
+
+
+def test_refresh_reports_changed_fields(components, transport):
+    node = components.nodes.get(index=2)
+    transport.components_tree["nodes"][1]["state"] = "FAILED"
+    assert components.refresh_changed() == [
+        ComponentChange(node, "state", "ACTIVE", "FAILED")
+    ]
+    assert components.nodes.get(index=2) is node
+    assert node.get_state(from_cache=True) == "FAILED"
+
+
+def test_refresh_reports_added_sub_components(components, transport):
+    enclosure = components.enclosures.get(index=1)
+    drives = transport.components_tree["enclosures"][0]["drives"]
+    drives.append(dict(drives[-1], drive_index=5))
+    changes = components.refresh_changed()
+    assert (
+        ComponentChange(enclosure, "drives", [1, 2, 3, 4], [1, 2, 3, 4, 5]) in changes
+    )
+    [new_drive] = [change.component for change in changes if change.field_name is None]
+    assert new_drive.get_index() == 5
+    assert new_drive.get_parent() is enclosure
+
+
+def test_refresh_without_enclosures(components, transport):
+    transport.components_tree["enclosures"][0]["state"] = "FAILED"
+    transport.components_tree["nodes"][0]["state"] = "FAILED"
+    transport.sent.clear()
+    [change] = components.refresh_changed(with_enclosures=False)
+    assert change.component == components.nodes.get(index=1)
+    [request] = transport.sent
+    assert "enclosures" not in request.params["fields"].split(",")
@@ -0,0 +1,47 @@
+from capacity import byte
+
+from .utils import make_volumes
+
+NUM_VOLUMES = 1500
+
+
+def _get_volumes(infinibox, ids):
+    return [infinibox.volumes.get_by_id_lazy(volume_id) for volume_id in ids]
+
+
+def test_refresh_fields(infinibox, transport):
+    volumes = _get_volumes(infinibox, [1, 2, 3])
+    infinibox.volumes.refresh_fields(volumes, ["name", "allocated"])
+    [request] = transport.sent
+    assert request.params["fields"] == "allocated,id,name"
+    assert request.params["id"] == "in:(1,2,3)"
+    assert [volume.get_name(from_cache=True) for volume in volumes] == [
+        "vol1",
+        "vol2",
+        "vol3",
+    ]
+    assert volumes[2].get_allocated(from_cache=True) == 30 * byte
+
+
+def test_refresh_fields_duplicate_objects(infinibox, transport):
+    volumes = _get_volumes(infinibox, [5, 5])
+    infinibox.volumes.refresh_fields(volumes, ["name"])
+    [request] = transport.sent
+    assert request.params["id"] == "in:(5)"
+    assert all(volume.get_name(from_cache=True) == "vol5" for volume in volumes)
+
+
+def test_refresh_fields_chunks_by_full_url_length(infinibox, transport):
+    transport.collections["volumes"] = make_volumes(NUM_VOLUMES)
+    volumes = _get_volumes(infinibox, range(1, NUM_VOLUMES + 1))
+    transport.responses.clear()
+    infinibox.volumes.refresh_fields(volumes, ["name"])
+    urls = [response.request.url for response in transport.responses]
+    assert len(urls) > 1
+    assert all(len(url) <= 2000 for url in urls)
+    assert all(
+        url.startswith("http://fake-system:80/api/rest/volumes?") for url in urls
+    )
+    assert [volume.get_name(from_cache=True) for volume in volumes] == [
+        "vol{}".format(index) for index in range(1, NUM_VOLUMES + 1)
+    ]
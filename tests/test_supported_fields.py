@@ -0,0 +1,62 @@
+import pytest
+
+from infinisdk.core.api.api_target import APITarget
+
+
+@pytest.fixture
+def transport_with_compression(transport):
+    def _intercept(sent):
+        if sent.path == "_features":
+            return 200, {
+                "result": [{"name": "compression", "version": 1}],
+                "error": None,
+                "metadata": None,
+            }
+        return None
+
+    transport.interceptor = _intercept
+    return transport
+
+
+def test_supported_field_names(infinibox):
+    supported = infinibox.get_supported_field_names(infinibox.volumes.object_type)
+    assert isinstance(supported, frozenset)
+    assert {"name", "size", "pool", "family_id", "paths_available"} <= supported
+    assert "compression_enabled" not in supported
+    assert "udid" not in supported
+
+
+@pytest.mark.usefixtures("transport_with_compression")
+def test_supported_field_names_by_feature(infinibox):
+    supported = infinibox.get_supported_field_names(infinibox.volumes.object_type)
+    assert "compression_enabled" in supported
+    assert "qos_policy" not in supported
+
+
+def test_supported_field_names_are_computed_once(infinibox):
+    volume_type = infinibox.volumes.object_type
+    supported = infinibox.get_supported_field_names(volume_type)
+    assert infinibox.get_supported_field_names(volume_type) is supported
+    infinibox.compat.invalidate_cache()
+    assert infinibox.get_supported_field_names(volume_type) is not supported
+
+
+def test_is_field_supported(infinibox):
+    fields = infinibox.volumes.fields
+    assert infinibox.is_field_supported(fields.name)
+    assert infinibox.is_field_supported(fields.replica_ids)
+    assert not infinibox.is_field_supported(fields.qos_policy)
+
+
+def test_get_fields_skips_unsupported_fields(infinibox):
+    [volume] = infinibox.volumes.find(id=1).to_list()
+    fields = volume.get_fields(from_cache=True)
+    assert fields["name"] == "vol1"
+    assert "compression_enabled" not in fields
+    assert "qos_policy" not in fields
+
+
+def test_default_supported_field_names(infinibox):
+    volume_type = infinibox.volumes.object_type
+    supported = APITarget.get_supported_field_names(infinibox, volume_type)
+    assert supported == infinibox.get_supported_field_names(volume_type)
@@ -0,0 +1,107 @@
+import threading
+
+import pytest
+
+
+def _run_in_thread(func):
+    results = []
+    thread = threading.Thread(target=lambda: results.append(func()))
+    thread.start()
+    thread.join()
+    assert results, "Thread failed"
+    return results[0]
+
+
+def _get_volume_request(transport, volume_id):
+    [returned] = transport.get_sent("volumes/{}".format(volume_id))
+    return returned
+
+
+@pytest.fixture
+def thread_safe_infinibox(infinibox):
+    infinibox.api.enable_thread_safety()
+    return infinibox
+
+
+def test_thread_safety_disabled_by_default(infinibox, transport):
+    assert not infinibox.api.is_thread_safe()
+    with infinibox.api.added_headers_context({"X-Test": "1"}):
+        _run_in_thread(lambda: infinibox.api.get("volumes/1"))
+    assert _get_volume_request(transport, 1).headers.get("X-Test") == "1"
+
+
+def test_added_headers_apply_to_current_thread(thread_safe_infinibox, transport):
+    api = thread_safe_infinibox.api
+    with api.added_headers_context({"X-Test": "1"}):
+        api.get("volumes/1")
+        _run_in_thread(lambda: api.get("volumes/2"))
+    api.get("volumes/3")
+    assert _get_volume_request(transport, 1).headers.get("X-Test") == "1"
+    assert "X-Test" not in _get_volume_request(transport, 2).headers
+    assert "X-Test" not in _get_volume_request(transport, 3).headers
+
+
+def test_approval_applies_to_current_thread(thread_safe_infinibox, transport):
+    api = thread_safe_infinibox.api
+    with api.get_unapproved_context():
+        api.delete("volumes/1")
+        _run_in_thread(lambda: api.delete("volumes/2"))
+    assert _get_volume_request(transport, 1).params["approved"] == "false"
+    assert _get_volume_request(transport, 2).params["approved"] == "true"
+
+
+def test_applied_request_context(thread_safe_infinibox, transport):
+    api = thread_safe_infinibox.api
+    with api.added_headers_context({"X-Test": "1"}):
+        snapshot = api.snapshot_request_context()
+
+    def _get_with_snapshot():
+        with api.applied_request_context(snapshot):
+            api.get("volumes/1")
+        api.get("volumes/2")
+
+    _run_in_thread(_get_with_snapshot)
+    assert _get_volume_request(transport, 1).headers.get("X-Test") == "1"
+    assert "X-Test" not in _get_volume_request(transport, 2).headers
+
+
+def test_auth_context_applies_to_current_thread(thread_safe_infinibox, transport):
+    api = thread_safe_infinibox.api
+    with api.get_auth_context("other", "other_password"):
+        assert api.get_auth() == ("other", "other_password")
+        assert _run_in_thread(api.get_auth) == ("admin", "password")
+    assert api.get_auth() == ("admin", "password")
+    [login_request] = transport.get_sent("users/login")
+    assert login_request.body["username"] == "other"
+
+
+def test_expired_login_is_refreshed_once(thread_safe_infinibox, transport):
+    api = thread_safe_infinibox.api
+    api._session.cookies.set(  # pylint: disable=protected-access
+        "JSESSIONID", "expired"
+    )
+    num_threads = 4
+    barrier = threading.Barrier(num_threads)
+    logins = []
+
+    def _intercept(sent):
+        if sent.path == "users/login":
+            logins.append(sent)
+        elif sent.path.startswith("volumes/") and not logins:
+            barrier.wait(timeout=5)
+            return 401, {"result": None, "error": {"code": "UNAUTHORIZED"}}
+        return None
+
+    transport.interceptor = _intercept
+    threads = [
+        threading.Thread(target=api.get, args=("volumes/{}".format(index),))
+        for index in range(1, num_threads + 1)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(logins) == 1
+    for index in range(1, num_threads + 1):
+        requests = transport.get_sent("volumes/{}".format(index))
+        assert len(requests) == 2
@@ -0,0 +1,313 @@
+import copy
+import io
+import json
+import threading
+from urllib.parse import parse_qsl, urlsplit
+
+import urllib3
+from requests.adapters import BaseAdapter, HTTPAdapter
+
+from infinisdk import InfiniBox
+
+_API_PREFIX = "/api/rest/"
+
+SYSTEM_INFO = {
+    "version": "7.1.0",
+    "name": "fake-system",
+    "serial_number": 1234,
+    "model": "F6xxx",
+}
+
+EVENT_TYPES = {
+    "codes": [],
+    "levels": [{"name": "INFO", "value": 1}, {"name": "ERROR", "value": 3}],
+    "visibilities": [],
+    "reporters": [],
+}
+
+
+class SentRequest:
+    def __init__(self, method, path, params, body, raw_body, headers):
+        super(SentRequest, self).__init__()
+        self.method = method
+        self.path = path
+        self.params = params
+        self.body = body
+        self.raw_body = raw_body
+        self.headers = headers
+
+    def __repr__(self):
+        return "<{} {} {}>".format(self.method, self.path, self.params)
+
+
+class FakeTransport(BaseAdapter):
+    """
+    Answers API requests in-process, serving collections of objects held in memory. Responses are built
+    through :class:`requests.adapters.HTTPAdapter`, so streaming and closing behave as they do over the network
+    """
+
+    def __init__(self):
+        super(FakeTransport, self).__init__()
+        self.collections = {}
+        self.sent = []
+        self.responses = []
+        #: allows tests to override responses, by a callable receiving the request and returning
+        #: ``(status, json)`` or ``None`` to answer it normally
+        self.interceptor = None
+        self.failing_names = set()
+        self.failing_deletes = set()
+        #: the component tree returned by the ``components`` endpoint
+        self.components_tree = make_components_tree()
+        self._next_id = 100000
+        self._lock = threading.Lock()
+        self._builder = HTTPAdapter()
+
+    def get_sent(self, path=None, method=None):
+        return [
+            request
+            for request in self.sent
+            if (path is None or request.path == path)
+            and (method is None or request.method == method)
+        ]
+
+    def send(self, request, **kwargs):  # pylint: disable=arguments-differ
+        parsed = urlsplit(request.url)
+        path = parsed.path[len(_API_PREFIX) :]
+        params = dict(parse_qsl(parsed.query))
+        body = request.body
+        if isinstance(body, bytes):
+            body = body.decode("utf-8")
+        sent = SentRequest(
+            request.method,
+            path,
+            params,
+            json.loads(body) if body else None,
+            body,
+            dict(request.headers),
+        )
+        with self._lock:
+            self.sent.append(sent)
+        answer = None
+        if self.interceptor is not None:
+            answer = self.interceptor(sent)
+        if answer is None:
+            answer = self._answer(sent)
+        status, payload = answer
+        raw = urllib3.HTTPResponse(
+            body=io.BytesIO(json.dumps(payload).encode("utf-8")),
+            headers={"Content-Type": "application/json"},
+            status=status,
+            preload_content=False,
+            decode_content=False,
+        )
+        returned = self._builder.build_response(request, raw)
+        with self._lock:
+            self.responses.append(returned)
+        return returned
+
+    def close(self):
+        pass
+
+    def _answer(self, sent):
+        if sent.path == "_features":
+            return _result([])
+        if sent.path == "system":
+            return _result(_pluck(SYSTEM_INFO, sent.params))
+        if sent.path == "events/types":
+            return _result(EVENT_TYPES)
+        if sent.path == "users/login":
+            return _result({"roles": ["ADMIN"]})
+        if sent.path == "components":
+            return _result(_pluck(self.components_tree, sent.params))
+        collection_name, _, object_id = sent.path.partition("/")
+        collection = self.collections.get(collection_name)
+        if collection is None:
+            return _error(404, "NOT_FOUND")
+        if not object_id:
+            if sent.method == "POST":
+                return self._create(collection, sent.body)
+            return _page(collection, sent.params)
+        matching = [obj for obj in collection if str(obj["id"]) == object_id]
+        if not matching:
+            return _error(404, "NOT_FOUND")
+        if sent.method == "DELETE":
+            if matching[0]["id"] in self.failing_deletes:
+                return _error(409, "CANNOT_DELETE")
+            collection.remove(matching[0])
+            return _result(None)
+        if sent.method == "PUT":
+            matching[0].update(sent.body)
+        return _result(_pluck(matching[0], sent.params))
+
+    def _create(self, collection, data):
+        if data.get("name") in self.failing_names:
+            return _error(400, "BAD_REQUEST")
+        with self._lock:
+            self._next_id += 1
+            obj = dict(data, id=self._next_id)
+        collection.append(obj)
+        return 201, {"result": copy.deepcopy(obj), "error": None, "metadata": None}
+
+
+def _result(result):
+    return 200, {"result": copy.deepcopy(result), "error": None, "metadata": None}
+
+
+def _error(status, code):
+    return status, {
+        "result": None,
+        "error": {"code": code, "message": code},
+        "metadata": None,
+    }
+
+
+def _pluck(obj, params):
+    fields = params.get("fields")
+    if not fields or obj is None:
+        return obj
+    return {key: value for key, value in obj.items() if key in fields.split(",")}
+
+
+def _matches(obj, key, condition):
+    value = obj.get(key)
+    operator, _, operand = condition.partition(":")
+    if not _:
+        operator, operand = "eq", condition
+    if operator == "in":
+        return str(value) in operand.strip("()").split(",")
+    if operator == "gt":
+        return value > int(operand)
+    if operator == "ne":
+        return str(value) != operand
+    return str(value) == operand
+
+
+def _page(collection, params):
+    objs = list(collection)
+    for key, condition in params.items():
+        if key not in ("page", "page_size", "fields", "sort", "approved", "include"):
+            objs = [obj for obj in objs if _matches(obj, key, condition)]
+    sort = params.get("sort")
+    if sort:
+        objs.sort(key=lambda obj: obj[sort.lstrip("-")], reverse=sort.startswith("-"))
+    page = int(params.get("page", 1))
+    page_size = int(params.get("page_size", 50))
+    result = [
+        _pluck(obj, params) for obj in objs[(page - 1) * page_size : page * page_size]
+    ]
+    metadata = {
+        "ready": True,
+        "page": page,
+        "page_size": page_size,
+        "pages_total": (len(objs) + page_size - 1) // page_size,
+        "number_of_objects": len(objs),
+    }
+    return 200, {"result": copy.deepcopy(result), "error": None, "metadata": metadata}
+
+
+def make_volumes(count, pool_id=1):
+    return [
+        {
+            "id": index,
+            "name": "vol{}".format(index),
+            "size": 1000000000,
+            "used": 10 * index,
+            "allocated": 10 * index,
+            "pool_id": pool_id,
+            "type": "MASTER",
+            "created_at": 1600000000000 + index,
+        }
+        for index in range(1, count + 1)
+    ]
+
+
+def get_wwpn(node_index, port_index):
+    return "57:42:b0:f0:00:00:{:02x}:{:02x}".format(node_index, port_index)
+
+
+def make_components_tree(num_nodes=3, num_fc_ports=4, num_enclosures=2, num_drives=4):
+    return {
+        "rack": 1,
+        "nodes": [
+            {
+                "id": node_index,
+                "name": "node{}".format(node_index),
+                "model": "NODE",
+                "state": "ACTIVE",
+                "fc_ports": [
+                    {
+                        "id": port_index,
+                        "wwpn": get_wwpn(node_index, port_index),
+                        "node_index": node_index,
+                        "role": "HARD_PORT",
+                        "state": "OK",
+                    }
+                    for port_index in range(1, num_fc_ports + 1)
+                ],
+                "ib_ports": [],
+                "eth_ports": [],
+                "drives": [],
+                "services": [],
+            }
+            for node_index in range(1, num_nodes + 1)
+        ],
+        "enclosures": [
+            {
+                "id": enclosure_index,
+                "state": "OK",
+                "drives": [
+                    {
+                        "drive_index": drive_index,
+                        "enclosure_index": enclosure_index,
+                        "state": "ACTIVE",
+                    }
+                    for drive_index in range(1, num_drives + 1)
+                ],
+            }
+            for enclosure_index in range(1, num_enclosures + 1)
+        ],
+        "ups": [],
+        "pdus": [],
+    }
+
+
+def make_system(transport, address=("fake-system", 80)):
+    system = InfiniBox(address, auth=("admin", "password"))
+    system.api._session.mount("http://", transport)  # pylint: disable=protected-access
+    return system
+
+
+def get_fetched_pages(transport, path="volumes"):
+    return [
+        (int(request.params["page"]), int(request.params["page_size"]))
+        for request in transport.get_sent(path, method="GET")
+    ]
+
+
+def get_fetched_indexes(transport, num_objects, path="volumes"):
+    """Returns the indexes of the objects returned by the sent page requests, in the order they were sent"""
+    returned = []
+    for page, page_size in get_fetched_pages(transport, path):
+        start = (page - 1) * page_size
+        returned.extend(range(start, min(start + page_size, num_objects)))
+    return returned
+
+
+def make_event(event_id, level="INFO"):
+    return {
+        "id": event_id,
+        "seq_num": event_id,
+        "code": "EVENT_{}".format(event_id),
+        "level": level,
+        "timestamp": 1600000000000 + event_id,
+        "description": "event {}".format(event_id),
+        "description_template": "",
+        "reporter": "MANAGEMENT",
+        "visibility": "CUSTOMER",
+        "source_node_id": 1,
+        "affected_entity_id": "",
+        "data": [],
+        "system_version": SYSTEM_INFO["version"],
+        "tenant_id": 1,
+        "username": "admin",
+    }